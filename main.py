@@ -12,6 +12,8 @@ Usage:
 
 Commands:
   run             Run the JobHunter application
+  crawl-worker    Crawl URLs published to the shared crawl queue
+  benchmark       Benchmark the crawler on synthetic career boards
   create          Create scheduled task(s) from scheduler_config.json
   delete          Delete existing scheduled task(s)
   list            List existing scheduled task(s)
@@ -30,6 +32,12 @@ Examples:
   jh                              # Show this help message
   jh help                         # Show this help message
   jh run                          # Run the application
+  jh run --har record             # Run and save a HAR archive per target URL
+  jh run --har replay             # Run offline from the recorded archives
+  jh crawl-worker                 # Serve the crawl queue until stopped
+  jh crawl-worker --exit-when-idle  # Exit once the crawl queue is empty
+  jh benchmark                    # Benchmark all board layouts
+  jh benchmark --layouts static json_spa --listings 10 5000
   jh create                       # Create scheduled tasks
   jh delete                       # Delete scheduled tasks
   jh list                         # List scheduled tasks
@@ -43,14 +51,50 @@ For Linux users:
 """
 
 
-def handle_run() -> None:
-    """Handle run command - execute JobHunter application."""
+def handle_run(har_mode: str | None = None) -> None:
+    """Handle run command - execute JobHunter application.
+    
+    Args:
+        har_mode: "record" or "replay" to crawl with HAR archives, None to crawl live
+    """
     from src.app_manager import JobHunterOrchestrator
+    from src.config import browser_settings
     
+    browser_settings.har_mode = har_mode
     orchestrator = JobHunterOrchestrator()
     orchestrator.run()
 
 
+def handle_crawl_worker(exit_when_idle: bool) -> None:
+    """Handle crawl-worker command - crawl URLs from the shared work queue.
+    
+    Args:
+        exit_when_idle: Whether to exit once no URLs are available
+    """
+    from src.job_crawler_service.crawl_worker import CrawlWorker
+    
+    worker = CrawlWorker()
+    worker.run(exit_when_idle=exit_when_idle)
+
+
+def handle_benchmark(layouts: list[str] | None, listings: list[int] | None) -> None:
+    """Handle benchmark command - crawl the synthetic boards and report throughput.
+    
+    Args:
+        layouts: Board layouts to benchmark, the configured ones if None
+        listings: Board sizes to benchmark, the configured ones if None
+    """
+    from src.benchmark import BenchmarkRunner, format_report
+    
+    try:
+        runner = BenchmarkRunner(layouts, listings)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(format_report(runner.run()))
+
+
 def handle_help() -> None:
     """Handle help command."""
     print(MENU)
@@ -115,16 +159,46 @@ def run_cli() -> None:
     parser.add_argument(
         "command",
         nargs="?",
-        choices=["run", "create", "delete", "list", "help"],
+        choices=["run", "crawl-worker", "benchmark", "create", "delete", "list", "help"],
         help="Command to execute"
     )
     
+    parser.add_argument(
+        "--exit-when-idle",
+        action="store_true",
+        help="crawl-worker: exit once the crawl queue has no available URLs"
+    )
+    
+    parser.add_argument(
+        "--har",
+        choices=["record", "replay"],
+        help="run: record a HAR archive per target URL, or replay the recorded archives offline"
+    )
+    
+    parser.add_argument(
+        "--layouts",
+        nargs="+",
+        help="benchmark: board layouts to crawl (static, infinite_scroll, virtualized, "
+             "click_pagination, query_pagination, json_spa, workday_api)"
+    )
+    
+    parser.add_argument(
+        "--listings",
+        nargs="+",
+        type=int,
+        help="benchmark: board sizes to crawl, e.g. 10 100 5000"
+    )
+    
     args = parser.parse_args()
     command = args.command if args.command else "help"
     
     match command:
         case "run":
-            handle_run()
+            handle_run(args.har)
+        case "crawl-worker":
+            handle_crawl_worker(args.exit_when_idle)
+        case "benchmark":
+            handle_benchmark(args.layouts, args.listings)
         case "help":
             handle_help()
         case "create":
@@ -37,10 +37,10 @@ class JobHunterOrchestrator:
 
     def _setup(self) -> None:
         """Setup the orchestrator."""
-        self.job_crawler_service = JobCrawlerService()
-        
         self.job_storage_service = JobStorageService()
         
+        self.job_crawler_service = JobCrawlerService(self.job_storage_service)
+        
         self.llm_service = LLMService(
             llm_provider=LLMProviderFactory.create_provider()
             )
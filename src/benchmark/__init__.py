@@ -0,0 +1,7 @@
+"""Crawler benchmark against synthetic career boards served locally."""
+
+from .benchmark_runner import BenchmarkRunner, format_report
+from .fixture_server import FixtureServer
+from .fixture_boards import LAYOUTS
+
+__all__ = ['BenchmarkRunner', 'format_report', 'FixtureServer', 'LAYOUTS']
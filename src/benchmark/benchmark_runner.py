@@ -0,0 +1,339 @@
+"""Runs the crawler against the fixture boards and tracks results across runs."""
+
+import math
+import os
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List
+from src.config import (
+    benchmark_settings, scraping_settings, browser_settings, crawl_queue_settings,
+    site_settings, SiteSettings
+)
+from src.job_crawler_service.job_crawler_service import JobCrawlerService
+from src.job_crawler_service.crawl_stats import crawl_stats
+from src.job_crawler_service.workday_client import WORKDAY_PAGE_SIZE
+from src.job_storage.json_file_store import JsonFileStore, DATA_DIR_ENV_VAR
+from src.logger import get_logger
+from .fixture_boards import LAYOUTS, LAYOUT_WORKDAY_API, BENCHMARK_KEYWORD
+from .fixture_server import FixtureServer, WORKDAY_FIXTURE_HOST
+from .ipc_counter import IpcCounter
+from .rss_sampler import PeakRssSampler
+
+FIXTURE_HOST = "127.0.0.1"
+
+# Metric name -> whether a higher value is better
+REGRESSION_METRICS = {
+    "jobs_per_sec": True,
+    "page_loads": False,
+    "ipc_per_job": False,
+    "peak_rss_mb": False,
+}
+
+
+class BenchmarkRunner:
+    """Crawls every fixture board layout at every size and reports throughput.
+
+    Each scenario crawls a single board with a fresh `JobCrawlerService` on
+    an empty temporary data directory, so no learned profile, fingerprint
+    or cache carries over between scenarios or runs. Politeness delays and
+    the keyword filters are overridden so only crawling is measured, and
+    the HTTP tier is off unless `benchmark_settings.http_first` is set.
+    """
+
+    def __init__(self, layouts: List[str] | None = None, listings: List[int] | None = None) -> None:
+        """Initialize the benchmark runner.
+
+        Args:
+            layouts: Layouts to benchmark, the configured ones if None
+            listings: Board sizes to benchmark, the configured ones if None
+
+        Raises:
+            ValueError: If a layout is unknown
+        """
+        self.logger = get_logger("benchmark")
+        self.layouts = layouts or benchmark_settings.layouts or LAYOUTS
+        self.listings = listings or benchmark_settings.listings
+        self.store = JsonFileStore(benchmark_settings.results_file_name)
+
+        unknown = [layout for layout in self.layouts if layout not in LAYOUTS]
+        if unknown:
+            raise ValueError(f"Unknown board layouts: {', '.join(unknown)}. Use {', '.join(LAYOUTS)}")
+
+    def run(self) -> dict:
+        """Run all scenarios, compare them with earlier runs and store the results.
+
+        Returns:
+            The run: 'started', 'commit', 'scenarios', 'incomplete' and 'regressions'
+        """
+        previous_runs = self.store.load().get("runs", [])
+        run = {"started": datetime.now().isoformat(), "commit": get_git_commit(), "scenarios": []}
+
+        with FixtureServer(benchmark_settings.page_size) as server, self._benchmark_settings():
+            for layout in self.layouts:
+                for listings in self.listings:
+                    run["scenarios"].append(self._run_scenario(server, layout, listings))
+
+        run["incomplete"] = find_incomplete(run["scenarios"])
+        for problem in run["incomplete"]:
+            self.logger.warning(f"Incomplete crawl: {problem}")
+
+        run["regressions"] = find_regressions(run["scenarios"], previous_runs)
+        for regression in run["regressions"]:
+            self.logger.warning(f"Regression: {regression}")
+
+        runs = (previous_runs + [run])[-benchmark_settings.max_stored_runs:]
+        self.store.save({"runs": runs})
+        return run
+
+    def _run_scenario(self, server: FixtureServer, layout: str, listings: int) -> dict:
+        """Crawl one board and measure it.
+
+        Args:
+            server: Running fixture server
+            layout: Board layout
+            listings: Number of jobs on the board
+
+        Returns:
+            Scenario result with its metrics, and 'error' if the crawl failed
+        """
+        self.logger.info(f"Benchmarking {layout} board with {listings} listings")
+        scraping_settings.urls = [server.board_url(layout, listings)]
+        # One page more than needed, so stopping at the last page is checked
+        page_size = WORKDAY_PAGE_SIZE if layout == LAYOUT_WORKDAY_API else benchmark_settings.page_size
+        scraping_settings.max_pages_per_url = math.ceil(listings / page_size) + 1
+        server.reset_counters()
+
+        result = {"layout": layout, "listings": listings}
+        jobs = []
+
+        with tempfile.TemporaryDirectory(prefix="jh-benchmark-") as data_dir, use_data_dir(data_dir):
+            service = JobCrawlerService()
+            with IpcCounter() as ipc, PeakRssSampler() as rss:
+                start = time.monotonic()
+                try:
+                    jobs = service.crawl_jobs()
+                except Exception as e:
+                    self.logger.error(f"Benchmark crawl of {layout}/{listings} failed: {e}")
+                    result["error"] = str(e) or type(e).__name__
+                seconds = time.monotonic() - start
+
+        counters = crawl_stats.snapshot()["counters"]
+        result.update({
+            "tier": get_tier(counters),
+            "jobs_found": len(jobs),
+            "seconds": round(seconds, 2),
+            "jobs_per_sec": round(len(jobs) / seconds, 2) if seconds else None,
+            "page_loads": server.counters["document"],
+            "api_requests": server.counters["api"],
+            "ipc_calls": ipc.calls,
+            "ipc_per_job": round(ipc.calls / len(jobs), 2) if ipc.calls is not None and jobs else None,
+            "peak_rss_mb": round(rss.peak_rss_mb) if rss.peak_rss_mb is not None else None,
+            "counters": counters,
+        })
+        return result
+
+    @contextmanager
+    def _benchmark_settings(self) -> Iterator[None]:
+        """Override the settings that would skew or skip benchmark crawls, restoring them afterwards."""
+        overrides = [
+            (scraping_settings, "urls", scraping_settings.urls),
+            (scraping_settings, "max_pages_per_url", scraping_settings.max_pages_per_url),
+            (scraping_settings, "keywords", [BENCHMARK_KEYWORD]),
+            (scraping_settings, "excluded_keywords", []),
+            (scraping_settings, "locations", []),
+            (scraping_settings, "max_posting_age_days", None),
+            (scraping_settings, "skip_unchanged_listings", False),
+            (scraping_settings, "host_min_interval", 0),
+            (scraping_settings, "http_first", benchmark_settings.http_first),
+            (scraping_settings, "url_budget", benchmark_settings.scenario_budget),
+            (scraping_settings, "crawl_budget", benchmark_settings.scenario_budget),
+            (browser_settings, "har_mode", None),
+            (crawl_queue_settings, "coordinator", False),
+        ]
+        site_overrides = {
+            # The JSON SPA board is only readable through its API responses
+            FIXTURE_HOST: SiteSettings(json_extractor="generic"),
+            WORKDAY_FIXTURE_HOST: SiteSettings(direct_api="workday"),
+        }
+        originals = [(settings, name, getattr(settings, name)) for settings, name, _ in overrides]
+        original_sites = {host: site_settings.get(host) for host in site_overrides}
+
+        for settings, name, value in overrides:
+            setattr(settings, name, value)
+        site_settings.update(site_overrides)
+
+        try:
+            yield
+        finally:
+            for settings, name, value in originals:
+                setattr(settings, name, value)
+            for host, original_site in original_sites.items():
+                if original_site:
+                    site_settings[host] = original_site
+                else:
+                    site_settings.pop(host, None)
+
+
+@contextmanager
+def use_data_dir(data_dir: str) -> Iterator[None]:
+    """Point the data directory at another location while active.
+
+    Args:
+        data_dir: Directory to use
+    """
+    previous = os.environ.get(DATA_DIR_ENV_VAR)
+    os.environ[DATA_DIR_ENV_VAR] = data_dir
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(DATA_DIR_ENV_VAR, None)
+        else:
+            os.environ[DATA_DIR_ENV_VAR] = previous
+
+
+def get_tier(counters: dict) -> str:
+    """Get the tier that crawled a single-board scenario.
+
+    Args:
+        counters: Crawl statistics counters of the scenario
+
+    Returns:
+        'api', 'http' or 'browser'
+    """
+    if counters.get("urls.direct_api"):
+        return "api"
+    if counters.get("urls.http"):
+        return "http"
+    return "browser"
+
+
+def get_git_commit() -> str | None:
+    """Get the checked out commit, to tell which change a result belongs to.
+
+    Returns:
+        Short commit hash, or None outside a git checkout
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=10,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def find_incomplete(scenarios: List[dict]) -> List[str]:
+    """Check that every scenario found its whole board and stopped paginating at its end.
+
+    The page cap is one page above what each board needs, so a crawl that
+    does not stop at the board's total shows up as an extra request.
+
+    Args:
+        scenarios: Scenario results of the current run
+
+    Returns:
+        Description of every scenario that missed jobs or over-fetched
+    """
+    problems = []
+
+    for scenario in scenarios:
+        if scenario.get("error"):
+            continue
+
+        board = f"{scenario['layout']}/{scenario['listings']}"
+        if scenario["jobs_found"] < scenario["listings"]:
+            problems.append(f"{board}: found {scenario['jobs_found']} of {scenario['listings']} jobs")
+
+        if scenario["layout"] == LAYOUT_WORKDAY_API and scenario["tier"] == "api":
+            expected = math.ceil(scenario["listings"] / WORKDAY_PAGE_SIZE)
+            if scenario["api_requests"] != expected:
+                problems.append(f"{board}: {scenario['api_requests']} Workday API requests, expected {expected}")
+
+    return problems
+
+
+def find_regressions(scenarios: List[dict], previous_runs: List[dict]) -> List[str]:
+    """Compare scenarios with the latest earlier result of the same board.
+
+    Args:
+        scenarios: Scenario results of the current run
+        previous_runs: Stored earlier runs, oldest first
+
+    Returns:
+        Description of every metric that got worse by more than the threshold
+    """
+    regressions = []
+    threshold = benchmark_settings.regression_threshold
+
+    for scenario in scenarios:
+        if scenario.get("error"):
+            regressions.append(f"{scenario['layout']}/{scenario['listings']}: crawl failed ({scenario['error']})")
+            continue
+
+        previous = next(
+            (
+                earlier for run in reversed(previous_runs) for earlier in run["scenarios"]
+                if earlier["layout"] == scenario["layout"] and earlier["listings"] == scenario["listings"]
+                and not earlier.get("error")
+            ),
+            None
+        )
+        if not previous:
+            continue
+
+        for metric, higher_is_better in REGRESSION_METRICS.items():
+            before, after = previous.get(metric), scenario.get(metric)
+            if not before or after is None:
+                continue
+
+            change = (after - before) / before
+            if (-change if higher_is_better else change) > threshold:
+                regressions.append(
+                    f"{scenario['layout']}/{scenario['listings']}: {metric} {before} -> {after} ({change:+.0%})"
+                )
+
+    return regressions
+
+
+def format_report(run: dict) -> str:
+    """Format a benchmark run as a table.
+
+    Args:
+        run: Result of `BenchmarkRunner.run`
+
+    Returns:
+        Printable report
+    """
+    lines = [
+        f"Benchmark run {run['started']} (commit {run['commit'] or 'unknown'})",
+        f"{'layout':<18} {'listings':>8} {'tier':>7} {'found':>6} {'jobs/s':>8} {'loads':>6} {'ipc/job':>8} {'peak MB':>8}",
+    ]
+    for scenario in run["scenarios"]:
+        lines.append(
+            f"{scenario['layout']:<18} {scenario['listings']:>8} {scenario['tier']:>7} {scenario['jobs_found']:>6} "
+            f"{_format_metric(scenario['jobs_per_sec']):>8} {scenario['page_loads']:>6} "
+            f"{_format_metric(scenario['ipc_per_job']):>8} {_format_metric(scenario['peak_rss_mb']):>8}"
+            + (f"  FAILED: {scenario['error']}" if scenario.get("error") else "")
+        )
+
+    lines.append("")
+    if run.get("incomplete"):
+        lines.append("Incomplete crawls:")
+        lines.extend(f"  {problem}" for problem in run["incomplete"])
+    if run["regressions"]:
+        lines.append("Regressions against the previous run:")
+        lines.extend(f"  {regression}" for regression in run["regressions"])
+    else:
+        lines.append("No regressions against the previous run")
+    return "\n".join(lines)
+
+
+def _format_metric(value: float | None) -> str:
+    """Format an optional metric value for the report."""
+    return "-" if value is None else f"{value:g}"
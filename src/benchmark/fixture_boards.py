@@ -0,0 +1,262 @@
+"""Synthetic career boards in the layouts the crawler meets on real sites.
+
+Every board lists `listings` jobs linking to /jobs/<n>, with titles that
+all contain "Engineer" so the benchmark's keyword filter keeps each one.
+The Workday board is also served through a CXS search API, see
+`get_workday_page`.
+"""
+
+import html
+import json
+from typing import List
+
+LAYOUT_STATIC = "static"
+LAYOUT_INFINITE_SCROLL = "infinite_scroll"
+LAYOUT_VIRTUALIZED = "virtualized"
+LAYOUT_CLICK_PAGINATION = "click_pagination"
+LAYOUT_QUERY_PAGINATION = "query_pagination"
+LAYOUT_JSON_SPA = "json_spa"
+LAYOUT_WORKDAY_API = "workday_api"
+
+LAYOUTS = [
+    LAYOUT_STATIC,
+    LAYOUT_INFINITE_SCROLL,
+    LAYOUT_VIRTUALIZED,
+    LAYOUT_CLICK_PAGINATION,
+    LAYOUT_QUERY_PAGINATION,
+    LAYOUT_JSON_SPA,
+    LAYOUT_WORKDAY_API,
+]
+
+BENCHMARK_KEYWORD = "Engineer"
+JOB_TITLES = ["Software Engineer", "Backend Engineer", "Data Engineer", "QA Engineer", "DevOps Engineer"]
+VIRTUAL_ROW_HEIGHT = 40
+
+PAGE_TEMPLATE = """<!doctype html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Careers - {layout}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+li, .row {{ height: {row_height}px; line-height: {row_height}px; }}
+#viewport {{ height: 600px; overflow-y: auto; position: relative; border: 1px solid #ccc; }}
+.row {{ position: absolute; left: 0; right: 0; }}
+</style>
+</head>
+<body>
+<h1>Open positions</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def get_job_title(index: int) -> str:
+    """Get the title of a synthetic job.
+
+    Args:
+        index: 1-based job number
+
+    Returns:
+        Job title
+    """
+    return f"{JOB_TITLES[index % len(JOB_TITLES)]} {index}"
+
+
+def get_job_items(offset: int, limit: int, listings: int) -> List[dict]:
+    """Get a slice of a board's jobs.
+
+    Args:
+        offset: Number of jobs before the slice
+        limit: Maximum number of jobs in the slice
+        listings: Total number of jobs on the board
+
+    Returns:
+        List of {'id', 'title', 'path'} dicts
+    """
+    return [
+        {"id": index, "title": get_job_title(index), "path": f"/jobs/{index}"}
+        for index in range(offset + 1, min(offset + limit, listings) + 1)
+    ]
+
+
+def render_job_list_items(items: List[dict]) -> str:
+    """Render jobs as list items of anchors.
+
+    Args:
+        items: Jobs from `get_job_items`
+
+    Returns:
+        HTML of the <li> elements
+    """
+    return "\n".join(
+        f'<li><a href="{item["path"]}">{html.escape(item["title"])}</a></li>' for item in items
+    )
+
+
+def render_board(layout: str, listings: int, page_size: int, page: int = 1) -> str:
+    """Render the HTML document of a board.
+
+    Args:
+        layout: One of LAYOUTS
+        listings: Total number of jobs on the board
+        page_size: Jobs per page or loaded chunk
+        page: 1-based page number, used by query-param pagination only
+
+    Returns:
+        HTML document
+
+    Raises:
+        ValueError: If the layout is unknown
+    """
+    match layout:
+        case "static" | "workday_api":
+            body = f"<ul>{render_job_list_items(get_job_items(0, listings, listings))}</ul>"
+        case "query_pagination":
+            body = _render_query_page(listings, page_size, page)
+        case "infinite_scroll":
+            body = _render_infinite_scroll(listings, page_size)
+        case "virtualized":
+            body = _render_virtualized(listings)
+        case "click_pagination":
+            body = _render_click_pagination(listings, page_size)
+        case "json_spa":
+            body = _render_json_spa(listings, page_size)
+        case _:
+            raise ValueError(f"Unknown board layout: {layout}. Use one of {', '.join(LAYOUTS)}")
+
+    return PAGE_TEMPLATE.format(layout=layout, row_height=VIRTUAL_ROW_HEIGHT, body=body)
+
+
+def get_workday_page(offset: int, limit: int, listings: int) -> dict:
+    """Get a page of the Workday board's CXS search response.
+    
+    Like Workday, only the first page reports the total.
+    
+    Args:
+        offset: Number of postings before the page
+        limit: Maximum number of postings on the page
+        listings: Total number of jobs on the board
+        
+    Returns:
+        Search response with 'total' and 'jobPostings'
+    """
+    return {
+        "total": listings if offset == 0 else 0,
+        "jobPostings": [
+            {"title": item["title"], "externalPath": f"/job/{item['id']}"}
+            for item in get_job_items(offset, limit, listings)
+        ],
+    }
+
+
+def render_job_page(index: int) -> str:
+    """Render the detail page of a job.
+
+    Args:
+        index: 1-based job number
+
+    Returns:
+        HTML document
+    """
+    body = f"<h2>{html.escape(get_job_title(index))}</h2><p>Synthetic benchmark job.</p>"
+    return PAGE_TEMPLATE.format(layout="job", row_height=VIRTUAL_ROW_HEIGHT, body=body)
+
+
+def _render_query_page(listings: int, page_size: int, page: int) -> str:
+    """Server-rendered page with a next link selecting ?page=N."""
+    items = get_job_items((page - 1) * page_size, page_size, listings)
+    body = f"<ul>{render_job_list_items(items)}</ul>"
+    if page * page_size < listings:
+        body += f'<a href="/boards/query_pagination?n={listings}&page={page + 1}" rel="next">Next</a>'
+    return body
+
+
+def _render_infinite_scroll(listings: int, page_size: int) -> str:
+    """First chunk server-rendered, later chunks fetched as HTML when scrolled near the end."""
+    first = render_job_list_items(get_job_items(0, page_size, listings))
+    return f"""<ul id="jobs">{first}</ul>
+<script>
+let offset = {page_size}, loading = false;
+window.addEventListener('scroll', async () => {{
+    if (loading || offset >= {listings}) return;
+    if (window.innerHeight + window.scrollY < document.body.scrollHeight - 200) return;
+    loading = true;
+    const response = await fetch('/fragments/listings?n={listings}&offset=' + offset + '&limit={page_size}');
+    document.getElementById('jobs').insertAdjacentHTML('beforeend', await response.text());
+    offset += {page_size};
+    loading = false;
+}});
+</script>"""
+
+
+def _render_virtualized(listings: int) -> str:
+    """Scrollable viewport rendering only the rows currently in view."""
+    jobs = json.dumps(get_job_items(0, listings, listings))
+    return f"""<div id="viewport"><div id="spacer" style="height: {listings * VIRTUAL_ROW_HEIGHT}px"></div></div>
+<script>
+const jobs = {jobs};
+const viewport = document.getElementById('viewport');
+const spacer = document.getElementById('spacer');
+function render() {{
+    const first = Math.floor(viewport.scrollTop / {VIRTUAL_ROW_HEIGHT});
+    const last = Math.min(jobs.length, first + Math.ceil(viewport.clientHeight / {VIRTUAL_ROW_HEIGHT}) + 1);
+    spacer.replaceChildren(...jobs.slice(first, last).map((job, i) => {{
+        const row = document.createElement('div');
+        row.className = 'row';
+        row.style.top = ((first + i) * {VIRTUAL_ROW_HEIGHT}) + 'px';
+        row.innerHTML = '<a href="' + job.path + '"></a>';
+        row.firstChild.textContent = job.title;
+        return row;
+    }}));
+}}
+viewport.addEventListener('scroll', render);
+render();
+</script>"""
+
+
+def _render_click_pagination(listings: int, page_size: int) -> str:
+    """All jobs embedded in the page, paged client-side by a next button."""
+    jobs = json.dumps(get_job_items(0, listings, listings))
+    return f"""<ul id="jobs"></ul>
+<button id="next" aria-label="Next page">Next</button>
+<script>
+const jobs = {jobs};
+let page = 0;
+function render() {{
+    document.getElementById('jobs').replaceChildren(...jobs.slice(page * {page_size}, (page + 1) * {page_size}).map(job => {{
+        const item = document.createElement('li');
+        item.innerHTML = '<a href="' + job.path + '"></a>';
+        item.firstChild.textContent = job.title;
+        return item;
+    }}));
+    document.getElementById('next').disabled = (page + 1) * {page_size} >= jobs.length;
+}}
+document.getElementById('next').addEventListener('click', () => {{ page++; render(); }});
+render();
+</script>"""
+
+
+def _render_json_spa(listings: int, page_size: int) -> str:
+    """Empty shell rendering pages fetched from a JSON API, paged by a next button."""
+    return f"""<div id="app">Loading...</div>
+<button id="next" aria-label="Next page" disabled>Next</button>
+<script>
+let offset = 0;
+async function load() {{
+    const response = await fetch('/api/listings?n={listings}&offset=' + offset + '&limit={page_size}');
+    const data = await response.json();
+    const list = document.createElement('ul');
+    list.replaceChildren(...data.jobs.map(job => {{
+        const item = document.createElement('li');
+        item.innerHTML = '<a href="' + job.url + '"></a>';
+        item.firstChild.textContent = job.title;
+        return item;
+    }}));
+    document.getElementById('app').replaceChildren(list);
+    document.getElementById('next').disabled = offset + {page_size} >= data.total;
+}}
+document.getElementById('next').addEventListener('click', () => {{ offset += {page_size}; load(); }});
+load();
+</script>"""
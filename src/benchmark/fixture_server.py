@@ -0,0 +1,177 @@
+"""Local HTTP server serving the synthetic career boards."""
+
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from src.logger import get_logger
+from .fixture_boards import (
+    LAYOUTS, LAYOUT_WORKDAY_API, get_job_items, get_workday_page, render_board, render_job_page,
+    render_job_list_items
+)
+
+# The Workday board is reached by name, so the Workday client can be routed
+# to it through site settings without affecting the other boards
+WORKDAY_FIXTURE_HOST = "localhost"
+
+
+class FixtureServer:
+    """Serves the fixture boards on an ephemeral localhost port.
+
+    Routes:
+        /boards/<layout>?n=<listings>[&page=<n>]  board documents
+        /jobs/<n>                                 job detail documents
+        /api/listings?n=&offset=&limit=           JSON pages of the SPA board
+        /fragments/listings?n=&offset=&limit=     HTML chunks of the infinite scroll board
+        POST /wday/cxs/<tenant>/<site>/jobs       Workday CXS search of the Workday board,
+                                                  sized by its 'n' facet
+
+    Requests are counted by kind so the benchmark can report page loads.
+    """
+
+    def __init__(self, page_size: int) -> None:
+        """Initialize the fixture server.
+
+        Args:
+            page_size: Jobs per page or loaded chunk on the boards
+        """
+        self.logger = get_logger("fixture_server")
+        self.page_size = page_size
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "FixtureServer":
+        """Context manager entry.
+
+        Returns:
+            The started server
+        """
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def board_url(self, layout: str, listings: int) -> str:
+        """Get the URL of a board.
+
+        Args:
+            layout: One of LAYOUTS
+            listings: Number of jobs on the board
+
+        Returns:
+            URL of the board's first page
+        """
+        if layout == LAYOUT_WORKDAY_API:
+            port = self._server.server_address[1]
+            return f"http://{WORKDAY_FIXTURE_HOST}:{port}/boards/{layout}?n={listings}"
+        return f"{self.base_url}/boards/{layout}?n={listings}"
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Fixture boards served at {self.base_url}")
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset_counters(self) -> None:
+        """Clear the request counters."""
+        with self._lock:
+            self.counters.clear()
+
+    def count(self, kind: str) -> None:
+        """Count a served request.
+
+        Args:
+            kind: 'document', 'api' or 'other'
+        """
+        with self._lock:
+            self.counters[kind] += 1
+
+    def _make_handler(self) -> type:
+        """Build the request handler class bound to this server."""
+        fixture = self
+
+        class FixtureRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                query = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+                parts = parsed.path.strip("/").split("/")
+
+                try:
+                    listings = int(query.get("n", 0))
+                    offset = int(query.get("offset", 0))
+                    limit = int(query.get("limit", fixture.page_size))
+
+                    if parts[0] == "boards" and len(parts) == 2 and parts[1] in LAYOUTS:
+                        fixture.count("document")
+                        page = int(query.get("page", 1))
+                        self._send(render_board(parts[1], listings, fixture.page_size, page), "text/html")
+                    elif parts[0] == "jobs" and len(parts) == 2:
+                        fixture.count("document")
+                        self._send(render_job_page(int(parts[1])), "text/html")
+                    elif parsed.path == "/api/listings":
+                        fixture.count("api")
+                        jobs = get_job_items(offset, limit, listings)
+                        for job in jobs:
+                            job["url"] = f"http://{self.headers['Host']}{job['path']}"
+                        self._send(json.dumps({"total": listings, "jobs": jobs}), "application/json")
+                    elif parsed.path == "/fragments/listings":
+                        fixture.count("api")
+                        self._send(render_job_list_items(get_job_items(offset, limit, listings)), "text/html")
+                    elif parsed.path == "/robots.txt":
+                        fixture.count("other")
+                        self._send("User-agent: *\nAllow: /\n", "text/plain")
+                    else:
+                        fixture.count("other")
+                        self.send_error(404)
+                except ValueError:
+                    self.send_error(400)
+
+            def do_POST(self) -> None:
+                parts = urlparse(self.path).path.strip("/").split("/")
+                if len(parts) != 5 or parts[:2] != ["wday", "cxs"] or parts[4] != "jobs":
+                    fixture.count("other")
+                    self.send_error(404)
+                    return
+
+                fixture.count("api")
+                try:
+                    body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                    listings = int(body.get("appliedFacets", {}).get("n", [0])[0])
+                    page = get_workday_page(int(body.get("offset", 0)), int(body.get("limit", 20)), listings)
+                except (ValueError, TypeError, AttributeError):
+                    self.send_error(400)
+                    return
+                self._send(json.dumps(page), "application/json")
+
+            def _send(self, body: str, content_type: str) -> None:
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args) -> None:
+                fixture.logger.debug(format % args)
+
+        return FixtureRequestHandler
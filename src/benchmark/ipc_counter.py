@@ -0,0 +1,67 @@
+"""Counting of the calls the Playwright client makes to its driver process."""
+
+import functools
+import threading
+from src.logger import get_logger
+
+# Channel methods every protocol message of the Playwright client goes through
+CHANNEL_SEND_METHODS = ["send", "send_return_as_dict", "send_no_reply"]
+
+
+class IpcCounter:
+    """Counts Playwright protocol messages while active.
+    
+    Every sync API call (evaluate, click, goto, ...) is one or more messages
+    to the driver process, so the count is the crawler's IPC round trips.
+    Patches Playwright's internal Channel class, so on Playwright versions
+    without these methods nothing is counted and `calls` stays None.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.logger = get_logger("ipc_counter")
+        self.calls: int | None = None
+        self._originals: dict = {}
+        self._lock = threading.Lock()
+    
+    def __enter__(self) -> "IpcCounter":
+        """Start counting.
+        
+        Returns:
+            The active counter
+        """
+        try:
+            from playwright._impl._connection import Channel
+        except ImportError:
+            self.logger.warning("Playwright internals not found, IPC calls are not counted")
+            return self
+        
+        for name in CHANNEL_SEND_METHODS:
+            original = getattr(Channel, name, None)
+            if original:
+                self._originals[name] = original
+                setattr(Channel, name, self._wrap(original))
+        
+        if self._originals:
+            self.calls = 0
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop counting and restore Playwright."""
+        if not self._originals:
+            return
+        
+        from playwright._impl._connection import Channel
+        
+        for name, original in self._originals.items():
+            setattr(Channel, name, original)
+        self._originals = {}
+    
+    def _wrap(self, original):
+        """Wrap a Channel method to count its calls."""
+        @functools.wraps(original)
+        def counted(*args, **kwargs):
+            with self._lock:
+                self.calls += 1
+            return original(*args, **kwargs)
+        return counted
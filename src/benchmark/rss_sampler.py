@@ -0,0 +1,75 @@
+"""Peak memory sampling of the crawler and its browser processes."""
+
+import threading
+from pathlib import Path
+from src.job_crawler_service.browser_memory import get_descendants_rss_mb
+
+SAMPLE_INTERVAL = 0.25
+
+
+def get_own_rss_mb() -> float | None:
+    """Get the resident memory of the current process.
+    
+    Returns:
+        RSS in MB, or None where /proc is not available
+    """
+    try:
+        status = Path("/proc/self/status").read_text()
+    except OSError:
+        return None
+    
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return None
+
+
+class PeakRssSampler:
+    """Samples the combined RSS of this process and its descendants in the background.
+    
+    The browser only exists while a board is crawled, so the peak is taken
+    from periodic samples rather than measured at the end.
+    """
+    
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        """Initialize the sampler.
+        
+        Args:
+            interval: Time between samples (seconds)
+        """
+        self.interval = interval
+        self.peak_rss_mb: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+    
+    def __enter__(self) -> "PeakRssSampler":
+        """Start sampling.
+        
+        Returns:
+            The running sampler
+        """
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop sampling after a last sample."""
+        self._stop.set()
+        self._thread.join()
+    
+    def _run(self) -> None:
+        """Sample until stopped."""
+        while True:
+            self._sample()
+            if self._stop.wait(self.interval):
+                self._sample()
+                return
+    
+    def _sample(self) -> None:
+        """Take one sample and keep the peak."""
+        own_rss_mb = get_own_rss_mb()
+        if own_rss_mb is None:
+            return
+        
+        rss_mb = own_rss_mb + (get_descendants_rss_mb() or 0)
+        self.peak_rss_mb = max(self.peak_rss_mb or 0, rss_mb)
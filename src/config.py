@@ -2,7 +2,8 @@
 
 import os
 from dotenv import load_dotenv
-from typing import List
+from typing import Dict, List
+from urllib.parse import urlparse
 from src.data_models import RelevanceStatus
 
 DEFAULT_LLM_PROVIDER = "gemini"
@@ -39,6 +40,10 @@ EXCLUDED_KEYWORDS = [
     "sr.",
 ]
 
+# Locations to keep when a site publishes them as structured data (empty keeps all)
+# Matched as whole words, so country codes are safe, e.g. ["Israel", "IL", "Tel Aviv", "Remote"]
+LOCATIONS = []
+
 # URLs to scrape (add your target job sites here)
 TARGET_URLS = [
     "https://nvidia.wd5.myworkdayjobs.com/NVIDIAExternalCareerSite?locationHierarchy1=2fcb99c455831013ea52bbe14cf9326c&jobFamilyGroup=0c40f6bd1d8f10ae43ffaefd46dc7e78&workerSubType=0c40f6bd1d8f10adf6dae161b1844a15&workerSubType=ab40a98049581037a3ada55b087049b7&timeType=5509c0b5959810ac0029943377d47364",
@@ -51,6 +56,29 @@ TARGET_URLS = [
 ]
 NOTIFIER_PROVIDER_NAMES = ["telegram"]
 
+# Resource types aborted by the browser - the scraper only reads anchors
+BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+
+# Third-party domains aborted by the browser (analytics, trackers, chat widgets)
+BLOCKED_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "segment.com",
+    "segment.io",
+    "snap.licdn.com",
+    "intercom.io",
+    "intercomcdn.com",
+    "driftt.com",
+    "zopim.com",
+    "zdassets.com",
+    "hs-scripts.com",
+    "hs-analytics.net",
+]
+
 DEFAULT_BASE_PROMPT = """
 You are a job relevance analyzer for computer science graduates. Analyze each job posting(url, title, company, description) and determine relevance.
 
@@ -129,7 +157,19 @@ class BrowserSettings:
         self, 
         browser_type: str = "firefox",
         headless_mode: bool = False, 
-        page_load_timeout: int = 30
+        page_load_timeout: int = 30,
+        block_requests: bool = True,
+        blocked_resource_types: List[str] = BLOCKED_RESOURCE_TYPES,
+        blocked_domains: List[str] = BLOCKED_DOMAINS,
+        use_browser_server: bool = False,
+        browser_server_port: int = 9323,
+        use_persistent_profile: bool = False,
+        profile_max_size_mb: int = 500,
+        profile_prune_days: int = 7,
+        recycle_after_urls: int = 10,
+        recycle_memory_mb: int = 1500,
+        har_mode: str = None,
+        har_dir: str = None
         ) -> None:
         """Initialize the browser settings.
         
@@ -137,10 +177,40 @@ class BrowserSettings:
             browser_type: Type of browser to use ('chrome', 'firefox').
             headless_mode: Whether to run browser in headless mode.
             page_load_timeout: Maximum time to wait for page to load (seconds)
+            block_requests: Whether to abort unneeded requests (see blocked_* below)
+            blocked_resource_types: Playwright resource types to abort
+            blocked_domains: Domains to abort requests to, subdomains included
+            use_browser_server: Whether to keep one browser server running across
+                runs and connect to it instead of launching a browser each run
+            browser_server_port: Local port of the browser server
+            use_persistent_profile: Whether to keep a browser profile under data/
+                between runs (warm HTTP cache, cookie consent). Takes precedence
+                over the browser server.
+            profile_max_size_mb: Profile size above which its cache is dropped
+            profile_prune_days: Days after which the profile cache is dropped anyway
+            recycle_after_urls: URLs crawled on one page before its context is
+                replaced by a fresh one (0 never recycles by count)
+            recycle_memory_mb: Browser RSS above which the context is replaced
+                after the current URL (0 never recycles by memory, Linux only)
+            har_mode: "record" saves a HAR archive per target URL, "replay" serves
+                pages from those archives without network (None crawls live)
+            har_dir: Directory of the HAR archives, data/har if None
         """
         self.browser_type = browser_type
         self.headless_mode = headless_mode
         self.page_load_timeout = page_load_timeout
+        self.block_requests = block_requests
+        self.blocked_resource_types = blocked_resource_types
+        self.blocked_domains = blocked_domains
+        self.use_browser_server = use_browser_server
+        self.browser_server_port = browser_server_port
+        self.use_persistent_profile = use_persistent_profile
+        self.profile_max_size_mb = profile_max_size_mb
+        self.profile_prune_days = profile_prune_days
+        self.recycle_after_urls = recycle_after_urls
+        self.recycle_memory_mb = recycle_memory_mb
+        self.har_mode = har_mode
+        self.har_dir = har_dir
 
 class ScrapingSettings:
     """Scraping settings for the job scraper application."""
@@ -148,27 +218,155 @@ class ScrapingSettings:
     def __init__(
         self, 
         scroll_pause_time: int = 2, 
+        settle_quiet_time: float = 0.3,
+        settle_timeout: float = 2,
+        ready_timeout: float = 10,
         max_pages_per_url: int = 3,
+        max_concurrent_urls: int = 3,
+        parallel_pages: int = 4,
+        max_in_flight_per_host: int = 2,
+        host_min_interval: float = 1,
+        url_max_attempts: int = 2,
+        url_budget: float | None = 180,
+        crawl_budget: float | None = 1800,
+        retry_backoff: float = 2,
+        circuit_breaker_threshold: int = 3,
+        circuit_breaker_cooldown_hours: float = 24,
+        crawl_processes: int = 1,
+        http_first: bool = True,
+        http_concurrency: int = 8,
+        http_min_job_links: int = 5,
+        fetch_tier_max_age_days: int = 7,
+        skip_unchanged_listings: bool = True,
+        site_profile_max_age_days: int = 7,
         urls: List[str] = TARGET_URLS,
         keywords: List[str] = DEFAULT_KEYWORDS,
-        excluded_keywords: List[str] = EXCLUDED_KEYWORDS
+        excluded_keywords: List[str] = EXCLUDED_KEYWORDS,
+        max_posting_age_days: int = None,
+        locations: List[str] = LOCATIONS
         ) -> None:
         """
         Initialize the scraping settings.
 
         Args:
             page_load_timeout: Maximum time to wait for page to load
-            scroll_pause_time: Time to pause between scrolls
+            scroll_pause_time: Maximum time to wait for new content after each scroll
+            settle_quiet_time: Time without DOM or network activity after which
+                a page counts as settled (seconds)
+            settle_timeout: Maximum time to wait for a page to settle after
+                pagination (seconds)
+            ready_timeout: Maximum time to wait for a page's readiness
+                predicate (seconds), scraping proceeds after it
             max_pages_per_url: Maximum pages to scrape per URL
+            max_concurrent_urls: Number of URLs crawled in parallel by the browser,
+                each in its own context of one shared browser (1 crawls the URLs
+                one after another). With persistent profiles every parallel
+                crawler launches its own browser instead.
+            parallel_pages: Number of tabs loading pages at once once a URL
+                pagination pattern is inferred (1 keeps clicking the next button)
+            max_in_flight_per_host: URLs of one site crawled at the same time
+                (tenants like *.myworkdayjobs.com count as one site)
+            host_min_interval: Minimum time between starting URLs of one site
+                (seconds, 0 for no limit), raised to the robots.txt crawl-delay if longer
+            url_max_attempts: Browser attempts per URL before it counts as failed
+            url_budget: Time a URL may take across all its attempts (seconds, None
+                for no limit). Waits are capped at it and the pages scraped
+                before it runs out are kept.
+            crawl_budget: Time the whole crawl may take (seconds, None for no
+                limit). URLs not started when it runs out are skipped.
+            retry_backoff: Base of the jittered exponential backoff between
+                attempts (seconds)
+            circuit_breaker_threshold: Consecutive failed runs after which a URL
+                is skipped
+            circuit_breaker_cooldown_hours: Time a failing URL is skipped before
+                it is tried again
+            crawl_processes: Number of worker processes the browser URLs are
+                sharded across, each with its own browser (1 keeps a single process)
+            http_first: Whether to try a plain HTTP fetch before opening the browser
+            http_concurrency: Number of URLs fetched in parallel over plain HTTP
+            http_min_job_links: Minimum job-like links outside navigation an HTTP
+                fetch must find, at least one matching the keywords, otherwise the
+                URL is escalated to the browser
+            fetch_tier_max_age_days: Days a URL escalated to the browser skips the
+                HTTP attempt before it is tried over HTTP again
+            skip_unchanged_listings: Whether to reuse the last run's jobs for a URL
+                whose first page is unchanged, skipping its scrolling and pagination
+            site_profile_max_age_days: Days a learned site profile (selectors, next
+                button, scroll container) is trusted before the site is rediscovered
             urls: URLs to scrape
             keywords: Keywords to search for
+            excluded_keywords: Keywords that exclude a job
+            max_posting_age_days: Drop jobs whose published posting date is
+                older than this (None keeps all)
+            locations: Drop jobs whose published location matches none of these
+                (empty keeps all). Jobs without structured data are always kept.
         """
 
         self.scroll_pause_time = scroll_pause_time
+        self.settle_quiet_time = settle_quiet_time
+        self.settle_timeout = settle_timeout
+        self.ready_timeout = ready_timeout
         self.max_pages_per_url = max_pages_per_url
+        self.max_concurrent_urls = max_concurrent_urls
+        self.parallel_pages = parallel_pages
+        self.max_in_flight_per_host = max_in_flight_per_host
+        self.host_min_interval = host_min_interval
+        self.url_max_attempts = url_max_attempts
+        self.url_budget = url_budget
+        self.crawl_budget = crawl_budget
+        self.retry_backoff = retry_backoff
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_cooldown_hours = circuit_breaker_cooldown_hours
+        self.crawl_processes = crawl_processes
+        self.http_first = http_first
+        self.http_concurrency = http_concurrency
+        self.http_min_job_links = http_min_job_links
+        self.fetch_tier_max_age_days = fetch_tier_max_age_days
+        self.skip_unchanged_listings = skip_unchanged_listings
+        self.site_profile_max_age_days = site_profile_max_age_days
         self.urls = urls
         self.keywords = keywords
         self.excluded_keywords = excluded_keywords
+        self.max_posting_age_days = max_posting_age_days
+        self.locations = locations
+
+class SiteSettings:
+    """Per-site overrides for the job scraper application."""
+
+    def __init__(
+        self,
+        block_resources: bool = True,
+        ready_selector: str = None,
+        ready_min_anchors: int = 1,
+        ready_script: str = None,
+        json_extractor: str = None,
+        direct_api: str = None,
+        sorted_by_recency: bool = False
+        ) -> None:
+        """Initialize the site settings.
+        
+        The page counts as ready by the first readiness option set, checked in
+        the order ready_script, ready_selector, ready_min_anchors.
+        
+        Args:
+            block_resources: Whether request blocking applies to this site
+            ready_selector: Selector that must be attached to the page
+            ready_min_anchors: Minimum number of job-like anchors on the page
+            ready_script: JS predicate evaluated in the page, e.g. "() => window.jobsLoaded"
+            json_extractor: Extractor reading listings from the site's JSON API
+                responses: "workday", "comeet" or "generic" (None scrapes the DOM only)
+            direct_api: API fetched over plain HTTP instead of opening a browser:
+                "workday" (falls back to the browser if the API fails)
+            sorted_by_recency: Whether the listing is sorted newest first, so
+                pagination stops after a page whose jobs were all sent before
+        """
+        self.block_resources = block_resources
+        self.ready_selector = ready_selector
+        self.ready_min_anchors = ready_min_anchors
+        self.ready_script = ready_script
+        self.json_extractor = json_extractor
+        self.direct_api = direct_api
+        self.sorted_by_recency = sorted_by_recency
 
 class OutputSettings:
     """Output settings for the job scraper application."""
@@ -303,12 +501,93 @@ class JobStorageSettings:
         self.storage_file_name = storage_file_name
         self.job_url_expiry_days = job_url_expiry_days
 
+class CrawlQueueSettings:
+    """Shared work queue settings for crawling across several workers or hosts."""
+    
+    def __init__(
+        self,
+        coordinator: bool = False,
+        queue_path: str | None = None,
+        lease_seconds: int = 120,
+        heartbeat_interval: int = 30,
+        max_attempts: int = 3,
+        poll_interval: float = 2,
+        coordinator_timeout: int = 1800
+        ) -> None:
+        """Initialize the crawl queue settings.
+        
+        Args:
+            coordinator: Whether `jh run` publishes URLs to the queue for crawl workers instead of crawling itself
+            queue_path: SQLite queue database path, data/crawl_queue.db if None - put it on shared storage for multiple hosts
+            lease_seconds: Time a worker holds a URL before it is handed to another worker
+            heartbeat_interval: Interval between lease renewals while a URL is being crawled
+            max_attempts: Number of leases a URL gets before it is marked failed
+            poll_interval: Interval between queue polls of idle workers and the coordinator
+            coordinator_timeout: Maximum time the coordinator waits for a run to finish
+        """
+        self.coordinator = coordinator
+        self.queue_path = queue_path
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.coordinator_timeout = coordinator_timeout
+
+class BenchmarkSettings:
+    """Crawler benchmark settings for `jh benchmark`."""
+    
+    def __init__(
+        self,
+        layouts: List[str] | None = None,
+        listings: List[int] = [10, 100, 1000],
+        page_size: int = 25,
+        scenario_budget: int = 600,
+        regression_threshold: float = 0.2,
+        http_first: bool = False,
+        max_stored_runs: int = 50,
+        results_file_name: str = "benchmark_results.json"
+        ) -> None:
+        """Initialize the benchmark settings.
+        
+        Args:
+            layouts: Fixture board layouts to benchmark, all if None
+            listings: Board sizes to benchmark each layout at (up to 5000)
+            page_size: Listings per page or loaded chunk on the fixture boards
+            scenario_budget: Time budget of a single board crawl (seconds)
+            regression_threshold: Relative change against the previous run that
+                is reported as a regression (0.2 = 20% worse)
+            http_first: Whether boards may be crawled over plain HTTP, otherwise
+                every board is crawled in the browser
+            max_stored_runs: Number of benchmark runs kept in the results file
+            results_file_name: Results file inside the data directory
+        """
+        self.layouts = layouts
+        self.listings = listings
+        self.page_size = page_size
+        self.scenario_budget = scenario_budget
+        self.regression_threshold = regression_threshold
+        self.http_first = http_first
+        self.max_stored_runs = max_stored_runs
+        self.results_file_name = results_file_name
+
 load_dotenv()
 
 browser_settings = BrowserSettings()
 
 scraping_settings = ScrapingSettings()
 
+# Per-site overrides keyed by host name; a key also matches its subdomains
+site_settings: Dict[str, SiteSettings] = {
+    # "example.com": SiteSettings(block_resources=False),
+    "myworkdayjobs.com": SiteSettings(
+        ready_selector="a[data-automation-id='jobTitle']",
+        json_extractor="workday",
+        direct_api="workday"
+    ),
+    # TARGET_URLS sorts Check Point by date_published
+    "careers.checkpoint.com": SiteSettings(sorted_by_recency=True),
+}
+
 output_settings = OutputSettings()
 
 job_filter_settings = JobFilterSettings(
@@ -336,3 +615,26 @@ mail_settings = MailSettings(
 )
 
 job_storage_settings = JobStorageSettings()
+
+crawl_queue_settings = CrawlQueueSettings(
+    coordinator=os.getenv("CRAWL_QUEUE_COORDINATOR", "false").lower() == "true",
+    queue_path=os.getenv("CRAWL_QUEUE_PATH", None)
+)
+
+benchmark_settings = BenchmarkSettings()
+
+
+def get_site_settings(url: str) -> SiteSettings:
+    """Get the settings for the site serving a URL.
+    
+    Args:
+        url: URL of the page to get settings for
+        
+    Returns:
+        Matching SiteSettings, or the defaults if no override exists
+    """
+    host = (urlparse(url).hostname or "").lower()
+    for domain, settings in site_settings.items():
+        if host == domain or host.endswith(f".{domain}"):
+            return settings
+    return SiteSettings()
@@ -1,6 +1,6 @@
 """JobData data class for representing job information."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
 from .relevance_status import RelevanceStatus
 from src.logger import get_logger
@@ -16,6 +16,8 @@ class JobData:
         url: Job URL
         found_date: Date when job was found (auto-generated if None)
         source_url: URL of the page where job was found
+        location: Job location, when the site publishes it as structured data
+        date_posted: Date the job was posted, when the site publishes it
         relevant: LLM analysis result (RelevanceStatus enum)
         reason: LLM explanation for the relevance decision
     """
@@ -25,6 +27,8 @@ class JobData:
     url: str = None
     found_date: datetime = datetime.now()
     source_url: str = ""
+    location: str = ""
+    date_posted: datetime = None
     relevant: RelevanceStatus = RelevanceStatus.UNKNOWN
     reason: str = "Unknown"
     
@@ -33,6 +37,36 @@ class JobData:
         if self.found_date is None:
             self.found_date = datetime.now()
 
+    def to_dict(self) -> dict:
+        """Convert the job to a JSON-serializable dict.
+        
+        Returns:
+            Dict with dates as ISO strings and relevance as its name
+        """
+        return {
+            **asdict(self),
+            "found_date": self.found_date.isoformat() if self.found_date else None,
+            "date_posted": self.date_posted.isoformat() if self.date_posted else None,
+            "relevant": self.relevant.name,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'JobData':
+        """Create a job from a dict produced by `to_dict`.
+        
+        Args:
+            data: Serialized job
+            
+        Returns:
+            JobData instance
+        """
+        return cls(**{
+            **data,
+            "found_date": datetime.fromisoformat(data["found_date"]) if data.get("found_date") else None,
+            "date_posted": datetime.fromisoformat(data["date_posted"]) if data.get("date_posted") else None,
+            "relevant": RelevanceStatus[data.get("relevant", RelevanceStatus.UNKNOWN.name)],
+        })
+
     def __str__(self):
         return f"""
         Job #{self.id}:
@@ -40,6 +74,8 @@ class JobData:
         \nCompany: {self.company}
         \nURL: {self.url}
         \nSource URL: {self.source_url}
+        \nLocation: {self.location or "Unknown"}
+        \nPosted: {self.date_posted.date() if self.date_posted else "Unknown"}
         \nRelevant: {self.relevant.name}
         \nReason: {self.reason}
         """
@@ -1,32 +1,70 @@
 """Browser driver for automation using Playwright."""
 
 import logging
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
-from src.config import browser_settings
+import threading
+import time
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, BrowserType, Error as PlaywrightError
+from src.config import browser_settings, get_site_settings
+from .request_blocker import RequestBlocker
+from .browser_server import BrowserServer
+from .browser_profile import BrowserProfile
+from .crawl_stats import crawl_stats
+from .browser_memory import BrowserMemorySampler, get_child_pids
+from .page_scripts import CACHE_STATS_SCRIPT, TRACK_REQUESTS_SCRIPT
+from .har_archive import HAR_RECORD, HAR_REPLAY, get_har_path
+
+# Serializes Playwright starts, so each driver can tell its own driver process
+_start_lock = threading.Lock()
 
 
 class BrowserDriver:
     """Browser driver for automation.
     
     Creates and configures Playwright browser instances for Firefox and Chromium.
+    A single driver can hand out several isolated contexts, each with its own
+    cookies, cache and pages.
     """
     
     def __init__(
         self, 
         browser: str = browser_settings.browser_type, 
-        headless: bool = browser_settings.headless_mode
+        headless: bool = browser_settings.headless_mode,
+        profile_name: str = "main",
+        browser_server: BrowserServer | None = None
         ) -> None:
         """Initialize the browser driver.
         
         Args:
             browser: Type of browser to use ('firefox', 'chrome'/'chromium').
             headless: Whether to run browser in headless mode.
+            profile_name: Persistent profile to use when persistent profiles are
+                enabled; concurrently running drivers need different names.
+            browser_server: Running browser server to connect to instead of
+                launching a browser, so concurrent drivers share one browser.
+                Ignored with a persistent profile.
         """
         self.browser = browser.lower()
         self.headless = headless
+        self.browser_server = browser_server
         self.playwright = None
         self.browser_instance: Browser | None = None
         self.context: BrowserContext | None = None
+        self.persistent_context: BrowserContext | None = None
+        # HAR archives are recorded and replayed per context, so they need
+        # a fresh context per target URL rather than the profile's single one
+        self.profile = (
+            BrowserProfile(profile_name)
+            if browser_settings.use_persistent_profile and not browser_settings.har_mode else None
+        )
+        self.browser_type: BrowserType | None = None
+        self.memory_sampler = BrowserMemorySampler()
+        self.urls_in_context = 0
+        
+        # Routing disables the HTTP cache, so a persistent profile blocks
+        # resources through browser preferences instead
+        self.request_blocker = (
+            RequestBlocker() if browser_settings.block_requests and not self.profile else None
+        )
         self.logger = logging.getLogger(__name__)
     
     def __enter__(self) -> Page:
@@ -35,42 +73,282 @@ class BrowserDriver:
         Returns:
             Configured Playwright Page instance.
         """
-        self.playwright = sync_playwright().start()
+        self.start()
+        self.context = self.new_context()
+        return self.new_page(self.context)
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit.
+        
+        Args:
+            exc_type: Exception type.
+            exc_val: Exception value.
+            exc_tb: Exception traceback.
+        """
+        self.close()
+    
+    def start(self) -> None:
+        """Start Playwright and launch the configured browser.
+        
+        Raises:
+            ValueError: If the browser type is not supported.
+        """
+        with _start_lock:
+            children = get_child_pids()
+            self.playwright = sync_playwright().start()
+            started = get_child_pids() - children
+        
+        # The browser is launched by this driver process, so measuring its
+        # tree leaves out the browsers of other drivers in this process
+        if len(started) == 1:
+            self.memory_sampler.root_pid = started.pop()
         
-        # Launch appropriate browser
         match self.browser:
             case "chrome" | "chromium":
-                self.browser_instance = self.playwright.chromium.launch(headless=self.headless)
+                browser_type = self.playwright.chromium
             case "firefox":
-                self.browser_instance = self.playwright.firefox.launch(headless=self.headless)
+                browser_type = self.playwright.firefox
             case _:
                 raise ValueError(f"Unsupported browser: {self.browser}. Use 'firefox' or 'chrome'")
+        self.browser_type = browser_type
         
-        # Create context with settings
-        self.context = self.browser_instance.new_context(
-            viewport={'width': 1920, 'height': 1080}
-        )
+        if self.profile:
+            if browser_settings.block_requests:
+                # Routing would disable the profile's HTTP cache
+                blocked = "only images are blocked" if "image" in browser_settings.blocked_resource_types else "nothing is blocked"
+                self.logger.warning(
+                    f"Persistent profile limits request blocking: {blocked}, "
+                    "without domain blocking or blocked request counts"
+                )
+                crawl_stats.increment("blocking.limited_by_profile")
+            self.persistent_context = self._launch_persistent_context(browser_type)
+            return
         
-        # Create and configure page
-        page = self.context.new_page()
-        page.set_default_timeout(browser_settings.page_load_timeout * 1000)  # Convert to ms
+        if self.browser_server:
+            # Already checked by whoever shares it, relaunching here would
+            # cut off the other drivers connected to it
+            self.browser_instance = browser_type.connect(self.browser_server.ws_endpoint)
+            self.memory_sampler.root_pid = self.browser_server.pid
+            self.logger.info(f"Connected to shared {self.browser} browser")
+            return
+        
+        if browser_settings.use_browser_server:
+            self.browser_instance = self._connect_to_server(browser_type)
+            return
+        
+        # Launch appropriate browser
+        self.browser_instance = browser_type.launch(headless=self.headless)
         
         self.logger.info(f"Playwright {self.browser} browser launched")
+    
+    def _connect_to_server(self, browser_type: BrowserType) -> Browser:
+        """Connect to the shared browser server, relaunching it if it is unhealthy.
+        
+        Args:
+            browser_type: Playwright browser type matching the server.
+            
+        Returns:
+            Browser connected over the server's websocket endpoint.
+        """
+        server = BrowserServer(browser=self.browser, headless=self.headless)
+        checked_at = time.time()
+        
+        try:
+            browser = browser_type.connect(server.ensure_running())
+        except PlaywrightError as e:
+            self.logger.warning(f"Browser server unreachable, relaunching: {e}")
+            browser = browser_type.connect(server.relaunch(failed_at=checked_at))
+        
+        # The server's browser is not our descendant, measure it directly
+        self.memory_sampler.root_pid = server.pid
+        self.logger.info(f"Connected to {self.browser} browser server")
+        return browser
+    
+    def _launch_persistent_context(self, browser_type: BrowserType) -> BrowserContext:
+        """Launch the browser on the managed on-disk profile.
+        
+        Args:
+            browser_type: Playwright browser type to launch.
+            
+        Returns:
+            The profile's persistent browser context.
+        """
+        options = {}
+        if browser_settings.block_requests and "image" in browser_settings.blocked_resource_types:
+            if browser_type.name == "firefox":
+                options["firefox_user_prefs"] = {"permissions.default.image": 2}
+            else:
+                options["args"] = ["--blink-settings=imagesEnabled=false"]
+        
+        context = browser_type.launch_persistent_context(
+            str(self.profile.path),
+            headless=self.headless,
+            viewport={'width': 1920, 'height': 1080},
+            **options
+        )
+        self.logger.info(f"Playwright {self.browser} browser launched with profile '{self.profile.name}'")
+        return context
+    
+    def new_context(self, har_url: str | None = None) -> BrowserContext:
+        """Create a new isolated browser context with the default settings.
+        
+        With a persistent profile there is a single shared context, which is
+        returned instead.
+        
+        Args:
+            har_url: Target URL the context is opened for. In HAR record mode
+                its traffic is saved to the URL's archive when the context is
+                closed; in replay mode it is served from that archive.
+        
+        Returns:
+            Configured Playwright BrowserContext instance.
+        """
+        if self.persistent_context:
+            return self.persistent_context
+        
+        options = {}
+        if har_url and browser_settings.har_mode == HAR_RECORD:
+            options["record_har_path"] = str(get_har_path(har_url))
+        
+        context = self.browser_instance.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            **options
+        )
+        
+        if self.request_blocker:
+            self.request_blocker.attach(context)
+        
+        # Registered last so it is matched before the blocker; requests
+        # missing from the archive are aborted instead of going to network
+        if har_url and browser_settings.har_mode == HAR_REPLAY:
+            context.route_from_har(get_har_path(har_url), not_found="abort")
+        
+        return context
+    
+    def new_page(self, context: BrowserContext) -> Page:
+        """Create and configure a page inside the given context.
+        
+        Args:
+            context: Browser context to open the page in.
+            
+        Returns:
+            Configured Playwright Page instance.
+        """
+        page = context.new_page()
+        page.set_default_timeout(browser_settings.page_load_timeout * 1000)  # Convert to ms
+        # Lets page settling wait for requests still in flight
+        page.add_init_script(TRACK_REQUESTS_SCRIPT)
         return page
     
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Context manager exit.
+    def close_context(self, context: BrowserContext) -> None:
+        """Close a context created by new_context, keeping a persistent one open.
         
         Args:
-            exc_type: Exception type.
-            exc_val: Exception value.
-            exc_tb: Exception traceback.
+            context: Context to close.
+        """
+        if context is not self.persistent_context:
+            context.close()
+    
+    def record_cache_stats(self, page: Page) -> None:
+        """Count the current document's resources served from the HTTP cache.
+        
+        Args:
+            page: Page to sample.
+        """
+        if not self.profile:
+            return
+        
+        try:
+            stats = page.evaluate(CACHE_STATS_SCRIPT)
+            crawl_stats.increment("cache.resources", stats["resources"])
+            crawl_stats.increment("cache.hits", stats["hits"])
+        except PlaywrightError as e:
+            self.logger.debug(f"Error sampling cache stats: {e}")
+    
+    def recycle_if_needed(self, page: Page, url: str) -> Page:
+        """Sample memory after a URL and swap in a fresh context when due.
+        
+        Heavy boards leak listeners and DOM into a long-lived page, so the
+        default context is replaced after `recycle_after_urls` URLs or once
+        the browser's RSS passes `recycle_memory_mb`.
+        
+        Args:
+            page: Page of the default context that crawled the URL.
+            url: Crawled URL.
+            
+        Returns:
+            The page to crawl the next URL with.
+        """
+        rss_mb = self.memory_sampler.sample(page, url)
+        self.urls_in_context += 1
+        
+        if browser_settings.recycle_after_urls and self.urls_in_context >= browser_settings.recycle_after_urls:
+            reason = f"{self.urls_in_context} URLs"
+        elif browser_settings.recycle_memory_mb and rss_mb and rss_mb > browser_settings.recycle_memory_mb:
+            reason = f"browser RSS {rss_mb:.0f} MB"
+        else:
+            return page
+        
+        self.logger.info(f"Recycling browser context after {reason}")
+        crawl_stats.increment("contexts.recycled")
+        return self.recycle_context(page)
+    
+    def recycle_context(self, page: Page) -> Page:
+        """Replace the default context and its page with fresh ones.
+        
+        A persistent profile context is relaunched, keeping its disk cache.
+        
+        Args:
+            page: Current page of the default context.
+            
+        Returns:
+            Page of the new default context.
         """
-        if self.context:
+        try:
+            page.close()
+        except PlaywrightError as e:
+            self.logger.debug(f"Error closing page: {e}")
+        if self.persistent_context:
+            self.persistent_context.close()
+            self.persistent_context = self._launch_persistent_context(self.browser_type)
+        else:
+            self.context.close()
+        
+        self.context = self.new_context()
+        self.urls_in_context = 0
+        return self.new_page(self.context)
+    
+    def apply_site_settings(self, url: str) -> None:
+        """Apply per-site overrides before navigating to a URL.
+        
+        Args:
+            url: URL about to be opened.
+        """
+        if self.request_blocker:
+            self.request_blocker.enabled = get_site_settings(url).block_resources
+            self.request_blocker.start_url()
+    
+    def record_blocked_requests(self, url: str) -> None:
+        """Report the requests blocked on a URL and the estimated saving.
+        
+        Args:
+            url: Crawled URL.
+        """
+        if self.request_blocker:
+            self.request_blocker.log_savings(url)
+    
+    def close(self) -> None:
+        """Close the default context, the browser and Playwright."""
+        if self.context and self.context is not self.persistent_context:
             self.context.close()
+        if self.persistent_context:
+            self.persistent_context.close()
         if self.browser_instance:
+            # For a server connection this only disconnects, the server stays up
             self.browser_instance.close()
         if self.playwright:
             self.playwright.stop()
+        if self.profile:
+            self.profile.prune()
         
         self.logger.info("Playwright browser closed")
@@ -0,0 +1,154 @@
+"""Memory sampling of the browser processes started by the crawler."""
+
+import os
+from pathlib import Path
+from playwright.sync_api import Page, Error as PlaywrightError
+from src.logger import get_logger
+
+PROC_DIR = Path("/proc")
+
+
+def get_child_pids(parent_pid: int | None = None) -> set[int]:
+    """Get the direct children of a process.
+    
+    Args:
+        parent_pid: Parent process, the current one if None
+        
+    Returns:
+        Child process IDs, empty where /proc is unavailable
+    """
+    if not PROC_DIR.is_dir():
+        return set()
+    
+    parent_pid = parent_pid or os.getpid()
+    children = set()
+    for status_file in PROC_DIR.glob("[0-9]*/status"):
+        try:
+            for line in status_file.read_text().splitlines():
+                if line.startswith("PPid:"):
+                    if int(line.split(":", 1)[1]) == parent_pid:
+                        children.add(int(status_file.parent.name))
+                    break
+        except OSError:
+            continue  # Process exited while we were reading
+    return children
+
+
+def get_descendants_rss_mb(root_pid: int | None = None, include_root: bool = False) -> float | None:
+    """Sum the resident memory of all processes descending from a process.
+    
+    Playwright's driver and the browsers it launches are children of the
+    crawler process, so their combined RSS is what a container limit sees.
+    Only available where /proc is (Linux).
+    
+    Args:
+        root_pid: Process whose descendants to measure, the current one if None
+        include_root: Whether to count the root process itself
+        
+    Returns:
+        Combined RSS in MB, or None if it cannot be measured
+    """
+    if not PROC_DIR.is_dir():
+        return None
+    
+    root_pid = root_pid or os.getpid()
+    children: dict[int, list[int]] = {}
+    rss_kb: dict[int, int] = {}
+    
+    for status_file in PROC_DIR.glob("[0-9]*/status"):
+        try:
+            fields = dict(
+                line.split(":", 1) for line in status_file.read_text().splitlines() if ":" in line
+            )
+        except OSError:
+            continue  # Process exited while we were reading
+        
+        pid = int(status_file.parent.name)
+        children.setdefault(int(fields["PPid"]), []).append(pid)
+        rss_kb[pid] = int(fields.get("VmRSS", "0 kB").split()[0])
+    
+    total_kb = rss_kb.get(root_pid, 0) if include_root else 0
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        total_kb += rss_kb.get(pid, 0)
+        pending.extend(children.get(pid, []))
+    
+    return total_kb / 1024
+
+
+class BrowserMemorySampler:
+    """Samples browser memory after each URL and logs it.
+    
+    Reports the RSS of the browser processes and, on Chromium, the page's
+    JS heap, DOM node and event listener counts - the usual leak signals
+    of heavy single-page boards.
+    
+    Only the driver's own process tree is measured, through `root_pid`:
+    its Playwright driver process, which launched its browser, or the
+    browser server it is connected to. A browser server is shared, so its
+    figure covers the contexts of every connected crawler. Without a
+    `root_pid` every process descending from the crawler is measured.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the memory sampler."""
+        self.logger = get_logger("browser_memory")
+        self.peak_rss_mb = 0.0
+        self.root_pid: int | None = None
+    
+    def sample(self, page: Page, url: str) -> float | None:
+        """Sample and log memory after crawling a URL.
+        
+        Args:
+            page: Page that crawled the URL
+            url: Crawled URL
+            
+        Returns:
+            Browser RSS in MB, or None if it cannot be measured
+        """
+        if self.root_pid:
+            rss_mb = get_descendants_rss_mb(self.root_pid, include_root=True)
+        else:
+            rss_mb = get_descendants_rss_mb()
+        parts = []
+        
+        if rss_mb is not None:
+            self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+            parts.append(f"browser RSS {rss_mb:.0f} MB (peak {self.peak_rss_mb:.0f} MB)")
+        
+        metrics = self._get_page_metrics(page)
+        if metrics:
+            parts.append(
+                f"JS heap {metrics.get('JSHeapUsedSize', 0) / 1024 / 1024:.0f} MB, "
+                f"{metrics.get('Nodes', 0):.0f} DOM nodes, "
+                f"{metrics.get('JSEventListeners', 0):.0f} listeners"
+            )
+        
+        if parts:
+            self.logger.info(f"Memory after {url}: {', '.join(parts)}")
+        return rss_mb
+    
+    def _get_page_metrics(self, page: Page) -> dict:
+        """Read the page's performance metrics over CDP (Chromium only).
+        
+        Args:
+            page: Page to measure
+            
+        Returns:
+            Metric name to value, empty on other browsers
+        """
+        try:
+            session = page.context.new_cdp_session(page)
+        except PlaywrightError:
+            return {}
+        
+        try:
+            session.send("Performance.enable")
+            result = session.send("Performance.getMetrics")
+            return {metric["name"]: metric["value"] for metric in result["metrics"]}
+        except PlaywrightError as e:
+            self.logger.debug(f"Error reading page metrics: {e}")
+            return {}
+        finally:
+            session.detach()
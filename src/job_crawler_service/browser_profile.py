@@ -0,0 +1,96 @@
+"""Managed on-disk browser profiles with a size-capped HTTP cache."""
+
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+from src.config import browser_settings
+from src.logger import get_logger
+from src.job_storage.json_file_store import JsonFileStore, get_data_dir
+
+PROFILES_DIR_NAME = "browser_profiles"
+
+# File recording when each profile was last pruned
+BROWSER_PROFILES_FILE_NAME = "browser_profiles.json"
+
+# Cache directories of Firefox and Chromium profiles - safe to delete,
+# cookies and consent state live elsewhere in the profile
+CACHE_DIR_NAMES = ["cache2", "startupCache", "Cache", "Code Cache", "GPUCache"]
+
+
+class BrowserProfile:
+    """A persistent browser profile directory under data/.
+    
+    Keeps the HTTP cache and cookie-consent state between runs. The cache is
+    dropped when the profile outgrows `profile_max_size_mb` or was last
+    pruned more than `profile_prune_days` ago.
+    """
+    
+    def __init__(self, name: str) -> None:
+        """Initialize the browser profile.
+        
+        Args:
+            name: Profile name; each concurrently running browser needs its own.
+        """
+        self.name = name
+        self.path: Path = get_data_dir() / PROFILES_DIR_NAME / name
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.store = JsonFileStore(BROWSER_PROFILES_FILE_NAME)
+        self.logger = get_logger("browser_profile")
+    
+    def prune(self) -> None:
+        """Drop the cache if the profile is too large or due for pruning."""
+        size_mb = self._get_size(self.path) / (1024 * 1024)
+        state = self.store.load()
+        last_pruned = state.get(self.name)
+        
+        is_due = (
+            last_pruned is None or
+            datetime.fromisoformat(last_pruned) < datetime.now() - timedelta(days=browser_settings.profile_prune_days)
+        )
+        if size_mb <= browser_settings.profile_max_size_mb and not is_due:
+            self.logger.info(f"Browser profile '{self.name}' is {size_mb:.0f} MB")
+            return
+        
+        for cache_dir in self._find_cache_dirs():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        
+        # Still over the cap without its cache - start the profile over
+        if self._get_size(self.path) / (1024 * 1024) > browser_settings.profile_max_size_mb:
+            shutil.rmtree(self.path, ignore_errors=True)
+            self.path.mkdir(parents=True, exist_ok=True)
+        
+        # Workers prune their own profiles, keep the others' timestamps
+        self.store.update({self.name: datetime.now().isoformat()})
+        self.logger.info(
+            f"Pruned browser profile '{self.name}': {size_mb:.0f} MB -> "
+            f"{self._get_size(self.path) / (1024 * 1024):.0f} MB"
+        )
+    
+    def _find_cache_dirs(self) -> list[Path]:
+        """Find the cache directories inside the profile.
+        
+        Returns:
+            List of cache directory paths.
+        """
+        return [
+            path for path in self.path.rglob("*")
+            if path.is_dir() and path.name in CACHE_DIR_NAMES
+        ]
+    
+    def _get_size(self, path: Path) -> int:
+        """Get the total size of the files under a directory.
+        
+        Args:
+            path: Directory to measure.
+            
+        Returns:
+            Size in bytes.
+        """
+        total = 0
+        for file in path.rglob("*"):
+            try:
+                if file.is_file():
+                    total += file.stat().st_size
+            except OSError:
+                continue
+        return total
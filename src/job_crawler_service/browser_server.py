@@ -0,0 +1,287 @@
+"""Long-lived Playwright browser server shared across runs."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from src.config import browser_settings
+from src.logger import get_logger
+from src.job_storage.json_file_store import JsonFileStore, get_data_dir
+
+# File recording the running server between runs
+BROWSER_SERVER_FILE_NAME = "browser_server.json"
+BROWSER_SERVER_LOG_FILE_NAME = "browser_server.log"
+
+BROWSER_SERVER_HOST = "127.0.0.1"
+BROWSER_SERVER_WS_PATH = "jobhunter"
+BROWSER_SERVER_START_TIMEOUT = 30
+
+# Part of the launch script, so it appears in the server's command line
+SERVER_COMMAND_MARKER = "JH_PLAYWRIGHT_PACKAGE"
+
+# Node script run with Playwright's bundled driver - the Python API has no
+# launchServer, the driver's playwright-core package does
+LAUNCH_SERVER_SCRIPT = """
+const playwright = require(process.env.JH_PLAYWRIGHT_PACKAGE);
+playwright[process.env.JH_BROWSER].launchServer({
+    headless: process.env.JH_HEADLESS === '1',
+    host: process.env.JH_HOST,
+    port: Number(process.env.JH_PORT),
+    wsPath: process.env.JH_WS_PATH,
+}).then(server => console.log(server.wsEndpoint()));
+"""
+
+
+class BrowserServer:
+    """Launches a Playwright browser server once and keeps it alive.
+    
+    BrowserDriver connects to it over its websocket endpoint, so a run only
+    pays for creating a fresh context instead of a cold browser launch.
+    
+    Health checks and relaunches hold a lock on the state file's .lock
+    sibling, so crawl threads and processes never stop a server another
+    one has just launched.
+    """
+    
+    def __init__(
+        self,
+        browser: str = browser_settings.browser_type,
+        headless: bool = browser_settings.headless_mode,
+        port: int = browser_settings.browser_server_port
+        ) -> None:
+        """Initialize the browser server manager.
+        
+        Args:
+            browser: Type of browser to serve ('firefox', 'chrome'/'chromium').
+            headless: Whether to run the browser in headless mode.
+            port: Local port the server listens on.
+        """
+        self.browser = "chromium" if browser.lower() in ("chrome", "chromium") else browser.lower()
+        self.headless = headless
+        self.port = port
+        self.ws_endpoint = f"ws://{BROWSER_SERVER_HOST}:{port}/{BROWSER_SERVER_WS_PATH}"
+        self.store = JsonFileStore(BROWSER_SERVER_FILE_NAME)
+        self.logger = get_logger("browser_server")
+    
+    @property
+    def pid(self) -> int | None:
+        """Process ID of the recorded server, if one was launched."""
+        return self.store.load().get("pid")
+    
+    def ensure_running(self) -> str:
+        """Make sure a healthy server is running, launching one if needed.
+        
+        Returns:
+            Websocket endpoint to connect to.
+        """
+        with self.store.lock():
+            if self.is_healthy():
+                self.logger.info(f"Reusing browser server at {self.ws_endpoint}")
+                return self.ws_endpoint
+            
+            return self._launch()
+    
+    def is_healthy(self) -> bool:
+        """Check the recorded server process is alive and accepting connections.
+        
+        Returns:
+            True if the server matches the current settings and is reachable.
+        """
+        state = self.store.load()
+        if state.get("browser") != self.browser or state.get("headless") != self.headless:
+            return False
+        if not self._is_recorded_server(state.get("pid")):
+            return False
+        
+        try:
+            with socket.create_connection((BROWSER_SERVER_HOST, self.port), timeout=2):
+                return True
+        except OSError:
+            return False
+    
+    def relaunch(self, failed_at: float | None = None) -> str:
+        """Stop any recorded server and launch a new one.
+        
+        Args:
+            failed_at: Time (time.time()) the caller last got the endpoint
+                before finding the server broken. A healthy server launched
+                by someone else since then is reused instead of replaced.
+        
+        Returns:
+            Websocket endpoint to connect to.
+            
+        Raises:
+            RuntimeError: If the server does not come up in time.
+        """
+        with self.store.lock():
+            if failed_at and self.store.load().get("launched", 0) > failed_at and self.is_healthy():
+                self.logger.info(f"Browser server was relaunched meanwhile, reusing {self.ws_endpoint}")
+                return self.ws_endpoint
+            return self._launch()
+    
+    def _launch(self) -> str:
+        """Stop any recorded server, launch a new one and wait until it is up.
+        
+        Callers hold the store's lock.
+        
+        Returns:
+            Websocket endpoint to connect to.
+        """
+        self._stop()
+        
+        node_path, cli_path = self._get_driver_paths()
+        log_file = open(get_data_dir() / BROWSER_SERVER_LOG_FILE_NAME, "a", encoding="utf-8")
+        env = {
+            **os.environ,
+            "JH_PLAYWRIGHT_PACKAGE": str(Path(cli_path).parent),
+            "JH_BROWSER": self.browser,
+            "JH_HEADLESS": "1" if self.headless else "0",
+            "JH_HOST": BROWSER_SERVER_HOST,
+            "JH_PORT": str(self.port),
+            "JH_WS_PATH": BROWSER_SERVER_WS_PATH,
+        }
+        
+        # Detach so the server outlives this run
+        if sys.platform == "win32":
+            detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            detach = {"start_new_session": True}
+        
+        process = subprocess.Popen(
+            [node_path, "-e", LAUNCH_SERVER_SCRIPT],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            **detach
+        )
+        log_file.close()
+        
+        self.store.save({
+            "pid": process.pid, "browser": self.browser, "headless": self.headless, "launched": time.time()
+        })
+        
+        deadline = time.monotonic() + BROWSER_SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.is_healthy():
+                self.logger.info(f"Launched {self.browser} browser server at {self.ws_endpoint}")
+                return self.ws_endpoint
+            time.sleep(0.2)
+        
+        raise RuntimeError(f"Browser server did not start within {BROWSER_SERVER_START_TIMEOUT}s")
+    
+    def stop(self) -> None:
+        """Terminate the recorded server process, if any.
+        
+        A recorded PID that now belongs to another process (after a reboot
+        or PID reuse) is forgotten without being killed.
+        """
+        with self.store.lock():
+            self._stop()
+    
+    def _stop(self) -> None:
+        """Terminate the recorded server process while holding the store's lock."""
+        pid = self.store.load().get("pid")
+        if not self._is_process_alive(pid):
+            return
+        if not self._is_recorded_server(pid):
+            self.logger.warning(f"Process {pid} is no longer the browser server, not stopping it")
+            self.store.save({})
+            return
+        
+        try:
+            if sys.platform == "win32":
+                subprocess.run(["taskkill", "/PID", str(pid), "/T", "/F"], capture_output=True)
+            else:
+                os.killpg(pid, 15)
+            self.logger.info(f"Stopped browser server (pid {pid})")
+        except OSError as e:
+            self.logger.warning(f"Could not stop browser server (pid {pid}): {e}")
+        
+        self.store.save({})
+    
+    def _is_process_alive(self, pid: int | None) -> bool:
+        """Check whether a process exists.
+        
+        Args:
+            pid: Process ID to check.
+            
+        Returns:
+            True if the process is running.
+        """
+        if not pid:
+            return False
+        
+        if sys.platform == "win32":
+            result = subprocess.run(
+                ["tasklist", "/FI", f"PID eq {pid}", "/NH"],
+                capture_output=True,
+                text=True
+            )
+            return str(pid) in result.stdout
+        
+        try:
+            os.kill(pid, 0)
+            return True
+        except OSError:
+            return False
+    
+    def _is_recorded_server(self, pid: int | None) -> bool:
+        """Check whether a process is alive and is a browser server we launched.
+        
+        Args:
+            pid: Process ID recorded at launch.
+            
+        Returns:
+            True if the process runs the launch script.
+        """
+        if not self._is_process_alive(pid):
+            return False
+        
+        command_line = self._get_command_line(pid)
+        return command_line is not None and SERVER_COMMAND_MARKER in command_line
+    
+    def _get_command_line(self, pid: int) -> str | None:
+        """Get the command line of a process.
+        
+        Args:
+            pid: Process ID.
+            
+        Returns:
+            Command line, or None if it cannot be read.
+        """
+        try:
+            if sys.platform == "win32":
+                result = subprocess.run(
+                    [
+                        "powershell", "-NoProfile", "-Command",
+                        f"(Get-CimInstance Win32_Process -Filter 'ProcessId={pid}').CommandLine"
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                return result.stdout
+            
+            proc_cmdline = Path(f"/proc/{pid}/cmdline")
+            if proc_cmdline.exists():
+                return proc_cmdline.read_bytes().replace(b"\0", b" ").decode("utf-8", "replace")
+            
+            result = subprocess.run(
+                ["ps", "-o", "command=", "-p", str(pid)], capture_output=True, text=True, timeout=10
+            )
+            return result.stdout
+        except (OSError, subprocess.SubprocessError) as e:
+            self.logger.debug(f"Could not read command line of process {pid}: {e}")
+            return None
+    
+    def _get_driver_paths(self) -> tuple[str, str]:
+        """Get the node executable and CLI script bundled with Playwright.
+        
+        Returns:
+            Tuple of (node executable path, driver cli.js path).
+        """
+        from playwright._impl._driver import compute_driver_executable
+        return compute_driver_executable()
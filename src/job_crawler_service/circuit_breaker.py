@@ -0,0 +1,96 @@
+"""Per-URL circuit breaker persisted across runs."""
+
+import threading
+from datetime import datetime, timedelta
+from src.config import scraping_settings
+from src.logger import get_logger
+from src.job_storage.json_file_store import JsonFileStore
+from .crawl_stats import crawl_stats
+
+# File remembering consecutive failures of each URL
+CIRCUIT_BREAKER_FILE_NAME = "circuit_breaker.json"
+
+
+class CircuitBreaker:
+    """Skips URLs that failed on several runs in a row until a cooldown ends.
+    
+    After `circuit_breaker_threshold` consecutive failed runs a URL's circuit
+    opens for `circuit_breaker_cooldown_hours`. Once the cooldown is over the
+    URL is tried again; one more failure reopens the circuit, a success
+    closes it.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the circuit breaker."""
+        self.logger = get_logger("circuit_breaker")
+        self.store = JsonFileStore(CIRCUIT_BREAKER_FILE_NAME)
+        self.entries: dict[str, dict] = self.store.load()
+        self._updated: dict[str, dict | None] = {}
+        self._lock = threading.Lock()
+    
+    def is_open(self, url: str) -> bool:
+        """Check whether a URL should be skipped on this run.
+        
+        Args:
+            url: Target page URL
+            
+        Returns:
+            True while the URL's circuit is open
+        """
+        with self._lock:
+            entry = self.entries.get(url)
+        if not entry or not entry.get("opened_at"):
+            return False
+        
+        cooldown = timedelta(hours=scraping_settings.circuit_breaker_cooldown_hours)
+        reopens_at = datetime.fromisoformat(entry["opened_at"]) + cooldown
+        if datetime.now() >= reopens_at:
+            self.logger.info(f"Cooldown over, trying failing URL again: {url}")
+            return False
+        
+        self.logger.warning(
+            f"Skipping URL that failed {entry['failures']} runs in a row "
+            f"until {reopens_at:%Y-%m-%d %H:%M} (last error: {entry['last_error']}): {url}"
+        )
+        crawl_stats.increment("urls.circuit_open")
+        return True
+    
+    def record_success(self, url: str) -> None:
+        """Close a URL's circuit.
+        
+        Args:
+            url: URL crawled successfully
+        """
+        with self._lock:
+            if url in self.entries:
+                del self.entries[url]
+                self._updated[url] = None
+    
+    def record_failure(self, url: str, error: str) -> None:
+        """Count a failed run of a URL, opening its circuit at the threshold.
+        
+        Args:
+            url: URL that failed
+            error: Error description
+        """
+        with self._lock:
+            entry = dict(self.entries.get(url, {"failures": 0, "opened_at": None}))
+            entry["failures"] += 1
+            entry["last_error"] = error[:200]
+            if entry["failures"] >= scraping_settings.circuit_breaker_threshold:
+                entry["opened_at"] = datetime.now().isoformat()
+                self.logger.warning(f"Circuit opened after {entry['failures']} failed runs: {url}")
+            self.entries[url] = entry
+            self._updated[url] = entry
+    
+    def save(self) -> None:
+        """Persist updated circuits.
+        
+        Only the URLs crawled here are merged into the file, so crawl
+        processes sharing it keep each other's circuits.
+        """
+        with self._lock:
+            if not self._updated:
+                return
+            self.store.update(self._updated)
+            self._updated.clear()
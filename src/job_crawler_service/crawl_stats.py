@@ -0,0 +1,88 @@
+"""Thread-safe counters and timings collected during a crawl."""
+
+import threading
+from collections import Counter
+from typing import Dict, List
+from src.logger import get_logger
+
+
+class CrawlStats:
+    """Collects counters and timings from crawler components.
+    
+    Components record into the shared `crawl_stats` instance; the crawler
+    resets it at the start of a run and logs the summary at the end.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize empty crawl statistics."""
+        self.logger = get_logger("crawl_stats")
+        self._lock = threading.Lock()
+        self.counters: Counter = Counter()
+        self.timings: Dict[str, List[float]] = {}
+    
+    def reset(self) -> None:
+        """Clear all counters and timings."""
+        with self._lock:
+            self.counters.clear()
+            self.timings.clear()
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increment a named counter.
+        
+        Args:
+            name: Counter name, e.g. 'blocked.type.image'
+            amount: Amount to add
+        """
+        with self._lock:
+            self.counters[name] += amount
+    
+    def record_time(self, name: str, seconds: float) -> None:
+        """Record a duration sample.
+        
+        Args:
+            name: Timing name, e.g. 'settle.scroll'
+            seconds: Measured duration in seconds
+        """
+        with self._lock:
+            self.timings.setdefault(name, []).append(seconds)
+    
+    def snapshot(self) -> dict:
+        """Get a picklable copy of all counters and timings.
+        
+        Returns:
+            Dict with 'counters' and 'timings'
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "timings": {name: list(samples) for name, samples in self.timings.items()},
+            }
+    
+    def merge(self, snapshot: dict) -> None:
+        """Add a snapshot taken in another process to these statistics.
+        
+        Args:
+            snapshot: Result of `snapshot()`
+        """
+        with self._lock:
+            self.counters.update(snapshot["counters"])
+            for name, samples in snapshot["timings"].items():
+                self.timings.setdefault(name, []).extend(samples)
+    
+    def log_summary(self) -> None:
+        """Log all counters and timing aggregates."""
+        with self._lock:
+            if not self.counters and not self.timings:
+                return
+            
+            self.logger.info("Crawl statistics:")
+            for name, value in sorted(self.counters.items()):
+                self.logger.info(f"  {name}: {value}")
+            for name, samples in sorted(self.timings.items()):
+                self.logger.info(
+                    f"  {name}: {len(samples)} samples, "
+                    f"total {sum(samples):.2f}s, max {max(samples):.2f}s"
+                )
+
+
+crawl_stats = CrawlStats()
@@ -0,0 +1,133 @@
+"""Crawl worker pulling URLs from the shared work queue."""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from playwright.sync_api import Page
+from src.config import crawl_queue_settings
+from src.logger import get_logger
+from src.job_storage.job_storage_service import JobStorageService
+from .browser_driver import BrowserDriver
+from .job_crawler_service import JobCrawlerService
+from .work_queue import CrawlWorkQueue
+
+
+class CrawlWorker:
+    """Leases URLs from the CrawlWorkQueue, crawls them and pushes jobs back.
+    
+    Any number of workers can run on any host that reaches the queue
+    database (`jh crawl-worker`). The browser is only started once a URL
+    actually needs it, and is kept open between URLs.
+    """
+    
+    def __init__(self, work_queue: CrawlWorkQueue | None = None) -> None:
+        """Initialize the crawl worker.
+        
+        Args:
+            work_queue: Queue to pull from, the configured queue if None
+        """
+        self.work_queue = work_queue or CrawlWorkQueue()
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.crawler = JobCrawlerService(JobStorageService())
+        self.driver: BrowserDriver | None = None
+        self.page: Page | None = None
+        self.logger = get_logger("crawl_worker")
+    
+    def run(self, exit_when_idle: bool = False) -> None:
+        """Process URLs until stopped.
+        
+        Args:
+            exit_when_idle: Whether to exit once the queue has no available URLs
+        """
+        self.logger.info(f"Crawl worker {self.worker_id} started")
+        
+        try:
+            while True:
+                task = self.work_queue.lease_next(self.worker_id)
+                
+                if task is None:
+                    if exit_when_idle:
+                        break
+                    time.sleep(crawl_queue_settings.poll_interval)
+                    continue
+                
+                self._process_task(*task)
+        
+        except KeyboardInterrupt:
+            self.logger.info("Crawl worker interrupted by user")
+        finally:
+            if self.driver:
+                self.driver.close()
+            self.logger.info(f"Crawl worker {self.worker_id} stopped")
+    
+    def _process_task(self, run_id: str, url: str) -> None:
+        """Crawl a leased URL while keeping its lease alive.
+        
+        Args:
+            run_id: Run the URL belongs to
+            url: URL to crawl
+        """
+        self.logger.info(f"Leased {url} (run {run_id})")
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat,
+            args=(run_id, url, stop_heartbeat),
+            daemon=True
+        )
+        heartbeat.start()
+        
+        try:
+            jobs = self.crawler.crawl_url_without_browser(url)
+            if jobs is None:
+                jobs = self.crawler.crawl_url(*self._get_browser(), url)
+                self.page = self.driver.recycle_if_needed(self.page, url)
+            
+            self.work_queue.complete(run_id, url, self.worker_id, jobs)
+            self.logger.info(f"Completed {url} with {len(jobs)} jobs")
+        
+        except Exception as e:
+            self.logger.error(f"Error crawling {url}: {e}")
+            self.work_queue.fail(run_id, url, self.worker_id, str(e))
+            self._reset_browser()
+        
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+            self.crawler.listing_fingerprints.save()
+            self.crawler.site_profiles.save()
+    
+    def _heartbeat(self, run_id: str, url: str, stop: threading.Event) -> None:
+        """Renew the lease until the task finishes.
+        
+        Args:
+            run_id: Run the URL belongs to
+            url: Leased URL
+            stop: Event set when the task finishes
+        """
+        while not stop.wait(crawl_queue_settings.heartbeat_interval):
+            if not self.work_queue.heartbeat(run_id, url, self.worker_id):
+                self.logger.warning(f"Lost lease on {url}")
+                return
+    
+    def _get_browser(self) -> tuple[BrowserDriver, Page]:
+        """Start the browser on first use.
+        
+        Returns:
+            Tuple of (driver, page)
+        """
+        if self.driver is None:
+            self.driver = BrowserDriver(profile_name=f"worker-{os.getpid()}")
+            self.page = self.driver.__enter__()
+        return self.driver, self.page
+    
+    def _reset_browser(self) -> None:
+        """Close the browser after a failure so the next URL starts clean."""
+        if self.driver:
+            try:
+                self.driver.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing browser: {e}")
+        self.driver = None
+        self.page = None
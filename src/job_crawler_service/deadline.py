@@ -0,0 +1,49 @@
+"""Time budgets shared by everything that waits during a crawl."""
+
+import math
+import time
+
+
+class Deadline:
+    """A point in time after which work should stop.
+    
+    A deadline created from a parent never ends after it, so a URL's
+    budget is also bounded by the whole crawl's budget.
+    """
+    
+    def __init__(self, seconds: float | None = None, parent: "Deadline | None" = None) -> None:
+        """Initialize the deadline.
+        
+        Args:
+            seconds: Budget from now, None for no limit of its own
+            parent: Deadline this one must not outlast
+        """
+        expires_at = time.monotonic() + seconds if seconds is not None else math.inf
+        self.expires_at = min(expires_at, parent.expires_at) if parent else expires_at
+    
+    def remaining(self) -> float:
+        """Get the time left.
+        
+        Returns:
+            Seconds left (never negative), infinity if unlimited
+        """
+        return max(self.expires_at - time.monotonic(), 0)
+    
+    def expired(self) -> bool:
+        """Check whether the budget is used up.
+        
+        Returns:
+            True once no time is left
+        """
+        return self.remaining() <= 0
+    
+    def cap(self, timeout: float) -> float:
+        """Limit a wait to the time left.
+        
+        Args:
+            timeout: Wait the caller would like (seconds)
+            
+        Returns:
+            The smaller of the wait and the time left (seconds)
+        """
+        return min(timeout, self.remaining())
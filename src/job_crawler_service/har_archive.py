@@ -0,0 +1,39 @@
+"""HAR archives of target URLs for offline, deterministic crawls."""
+
+import hashlib
+from pathlib import Path
+from urllib.parse import urlparse
+from src.config import browser_settings
+from src.job_storage.json_file_store import get_data_dir
+
+HAR_RECORD = "record"
+HAR_REPLAY = "replay"
+HAR_MODES = [HAR_RECORD, HAR_REPLAY]
+
+
+def get_har_path(url: str) -> Path:
+    """Get the archive path of a target URL.
+    
+    Args:
+        url: Target page URL
+        
+    Returns:
+        Path of the URL's zipped HAR, its directory created if needed
+    """
+    har_dir = Path(browser_settings.har_dir) if browser_settings.har_dir else get_data_dir() / "har"
+    har_dir.mkdir(parents=True, exist_ok=True)
+    
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:10]
+    return har_dir / f"{urlparse(url).netloc}-{digest}.zip"
+
+
+def has_har(url: str) -> bool:
+    """Check whether a target URL has been recorded.
+    
+    Args:
+        url: Target page URL
+        
+    Returns:
+        True if the URL's archive exists
+    """
+    return get_har_path(url).exists()
@@ -0,0 +1,175 @@
+"""Per-host politeness for dispatching URLs to concurrent crawlers."""
+
+import math
+import threading
+import time
+from collections import Counter
+from typing import List
+from urllib.parse import urlparse
+from src.config import scraping_settings
+from src.logger import get_logger
+from .crawl_stats import crawl_stats
+from .robots_cache import RobotsCache
+from .deadline import Deadline
+
+
+def get_host_key(url: str) -> str:
+    """Get the site a URL's host belongs to, so tenants share one budget.
+    
+    "nvidia.wd5.myworkdayjobs.com" and "redhat.wd5.myworkdayjobs.com" both
+    map to "myworkdayjobs.com"; "careers.example.co.il" to "example.co.il".
+    
+    Args:
+        url: URL to get the key of
+        
+    Returns:
+        Registrable domain of the host (approximated without a suffix list)
+    """
+    labels = (urlparse(url).hostname or "").lower().split(".")
+    # Two-letter country TLDs usually sit under a short second level: co.il, ac.uk
+    if len(labels) >= 3 and len(labels[-1]) == 2 and len(labels[-2]) <= 3:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+class TokenBucket:
+    """Token bucket limiting how often a host gets a new URL."""
+    
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second, math.inf for no rate limit
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def time_until_token(self) -> float:
+        """Get the time until a token is available.
+        
+        Returns:
+            Seconds to wait, 0 if a token is available now
+        """
+        if math.isinf(self.rate):
+            return 0
+        
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return 0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+    
+    def take(self) -> None:
+        """Take a token, which must be available."""
+        self.tokens -= 1
+
+
+class HostScheduler:
+    """Hands out URLs so every worker stays busy while no host is overloaded.
+    
+    Each host gets a token bucket (`host_min_interval` between URLs, or the
+    robots.txt crawl-delay if longer) and at most `max_in_flight_per_host`
+    URLs at a time. Workers take the first URL whose host admits it,
+    preferring the least busy hosts, and wait only when no host does.
+    Without a robots cache (offline HAR replay) URLs are handed out freely.
+    """
+    
+    def __init__(
+        self,
+        urls: List[str],
+        robots_cache: RobotsCache | None,
+        deadline: Deadline | None = None
+        ) -> None:
+        """Initialize the scheduler.
+        
+        Args:
+            urls: URLs to dispatch
+            robots_cache: Source of the hosts' crawl delays, None to skip
+                robots.txt and the per-host limits
+            deadline: Crawl budget, no URL is handed out once it is used up
+        """
+        self.logger = get_logger("host_scheduler")
+        self.deadline = deadline or Deadline()
+        self.pending = list(urls)
+        self.in_flight: Counter = Counter()
+        self.buckets: dict[str, TokenBucket] = {}
+        self._condition = threading.Condition()
+        self.polite = robots_cache is not None
+        
+        if self.polite:
+            for url in urls:
+                self._add_bucket(url, robots_cache.get_crawl_delay(url, self.deadline))
+            robots_cache.save()
+    
+    def acquire(self) -> str | None:
+        """Take the next URL, waiting until some host admits one.
+        
+        Returns:
+            URL to crawl, or None once no URLs are pending or time is up
+        """
+        start = time.monotonic()
+        
+        with self._condition:
+            while self.pending:
+                if self.deadline.expired():
+                    self.logger.warning(f"Crawl budget used up, skipping {len(self.pending)} URLs: {self.pending}")
+                    crawl_stats.increment("urls.out_of_budget", len(self.pending))
+                    self.pending.clear()
+                    break
+                
+                if not self.polite:
+                    url = self.pending.pop(0)
+                    self.in_flight[get_host_key(url)] += 1
+                    return url
+                
+                wait = None
+                
+                for url in sorted(self.pending, key=lambda url: self.in_flight[get_host_key(url)]):
+                    host = get_host_key(url)
+                    if self.in_flight[host] >= scraping_settings.max_in_flight_per_host:
+                        continue
+                    
+                    delay = self.buckets[host].time_until_token()
+                    if delay == 0:
+                        self.buckets[host].take()
+                        self.in_flight[host] += 1
+                        self.pending.remove(url)
+                        crawl_stats.record_time("scheduler.wait", time.monotonic() - start)
+                        return url
+                    wait = delay if wait is None else min(wait, delay)
+                
+                # Woken by release, once the nearest token is due, or when time is up
+                timeout = self.deadline.cap(wait if wait is not None else math.inf)
+                self._condition.wait(timeout=None if math.isinf(timeout) else timeout)
+        
+        return None
+    
+    def release(self, url: str) -> None:
+        """Mark a URL acquired earlier as finished.
+        
+        Args:
+            url: Finished URL
+        """
+        with self._condition:
+            self.in_flight[get_host_key(url)] -= 1
+            self._condition.notify_all()
+    
+    def _add_bucket(self, url: str, crawl_delay: float | None) -> None:
+        """Create or tighten the token bucket of a URL's host.
+        
+        Args:
+            url: URL on the host
+            crawl_delay: robots.txt crawl delay of the URL's origin
+        """
+        host = get_host_key(url)
+        interval = max(scraping_settings.host_min_interval, crawl_delay or 0)
+        # An interval of 0 or less means no rate limit
+        rate = 1 / interval if interval > 0 else math.inf
+        # An explicit crawl delay allows no bursts
+        capacity = 1 if crawl_delay else scraping_settings.max_in_flight_per_host
+        
+        bucket = self.buckets.get(host)
+        if bucket is None or rate < bucket.rate:
+            self.buckets[host] = TokenBucket(rate=rate, capacity=capacity)
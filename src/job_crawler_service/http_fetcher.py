@@ -0,0 +1,414 @@
+"""HTTP-first fetching of static career pages with browser fallback."""
+
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import List
+from urllib.parse import urljoin, urldefrag, urlparse
+import requests
+from src.config import browser_settings, scraping_settings
+from src.logger import get_logger
+from src.job_storage.json_file_store import JsonFileStore
+from .http_session import create_http_session
+from .job_scraper import JOB_TITLE_SELECTORS
+from .job_links import merge_links, filter_job_links
+from .structured_data import extract_job_postings
+from .listing_fingerprints import fingerprint_links
+from .page_navigator import NEXT_KEYWORDS, ARROW_SYMBOLS
+from .deadline import Deadline
+
+# File remembering which tier worked for each URL
+FETCH_TIERS_FILE_NAME = "fetch_tiers.json"
+
+TIER_HTTP = "http"
+TIER_BROWSER = "browser"
+
+# Href substrings of the job title selectors, e.g. "a[href*='job']" -> "job"
+JOB_HREF_KEYWORDS = [
+    match
+    for selector in JOB_TITLE_SELECTORS
+    for match in re.findall(r"href\*='([^']+)'", selector)
+]
+
+
+@dataclass
+class HttpListing:
+    """Job links of a page fetched over HTTP.
+    
+    Attributes:
+        links: List of {'href', 'text'} dicts, empty when not modified
+        fingerprint: ETag or Last-Modified validator, or a hash of the links
+        not_modified: Whether the server answered 304 to the stored validator
+        next_url: URL of the next page's link, if the page has one
+    """
+    links: List[dict]
+    fingerprint: str
+    not_modified: bool = False
+    next_url: str | None = None
+
+
+def is_next_label(label: str) -> bool:
+    """Check whether an anchor or button label reads as "next page".
+    
+    Args:
+        label: Visible text or aria-label of the element
+        
+    Returns:
+        True if the label contains a next keyword or is a lone arrow
+    """
+    label = label.strip().lower()
+    return any(keyword in label for keyword in NEXT_KEYWORDS) or label in ARROW_SYMBOLS
+
+
+class JobAnchorParser(HTMLParser):
+    """Collects {'href', 'text'} for anchors whose href looks job-related.
+    
+    Anchors inside <nav> and links to the page itself or a parent path
+    (menus like /careers/teams on /careers/jobs) are not collected.
+    
+    Also keeps the raw text of JSON-LD blocks for structured data extraction
+    and finds the next page link. A next control that cannot be followed
+    over HTTP (a button, or an anchor without a real href) is flagged so the
+    page can be left to the browser.
+    """
+    
+    def __init__(self, base_url: str) -> None:
+        """Initialize the parser.
+        
+        Args:
+            base_url: URL of the document, used to resolve relative hrefs
+        """
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.links: List[dict] = []
+        self._seen: set[str] = set()
+        self._current_href: str | None = None
+        self._current_text: List[str] = []
+        self.json_ld_blocks: List[str] = []
+        self._in_json_ld = False
+        self.next_url: str | None = None
+        self.has_unfollowable_next = False
+        self._anchor: dict | None = None
+        self._button_text: List[str] | None = None
+        self._button_label = ""
+        self._nav_depth = 0
+    
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        attributes = dict(attrs)
+        
+        if tag == "base" and attributes.get("href"):
+            self.base_url = urljoin(self.base_url, attributes["href"])
+            return
+        
+        if tag == "script" and attributes.get("type") == "application/ld+json":
+            self._in_json_ld = True
+            self.json_ld_blocks.append("")
+            return
+        
+        if tag == "nav":
+            self._nav_depth += 1
+            return
+        
+        if tag == "button":
+            self._button_text = []
+            self._button_label = attributes.get("aria-label") or ""
+            return
+        
+        if tag != "a":
+            return
+        
+        href = attributes.get("href") or ""
+        self._anchor = {
+            "href": href,
+            "rel": (attributes.get("rel") or "").lower().split(),
+            "label": attributes.get("aria-label") or "",
+            "text": [],
+        }
+        if self._nav_depth == 0 and any(keyword in href for keyword in JOB_HREF_KEYWORDS):
+            absolute_href = urljoin(self.base_url, href)
+            if not self._is_own_or_parent_page(absolute_href):
+                self._current_href = absolute_href
+                self._current_text = []
+    
+    def handle_data(self, data: str) -> None:
+        if self._in_json_ld:
+            self.json_ld_blocks[-1] += data
+            return
+        
+        if self._current_href is not None:
+            self._current_text.append(data)
+        if self._anchor is not None:
+            self._anchor["text"].append(data)
+        if self._button_text is not None:
+            self._button_text.append(data)
+    
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script":
+            self._in_json_ld = False
+            return
+        
+        if tag == "nav":
+            self._nav_depth = max(0, self._nav_depth - 1)
+            return
+        
+        if tag == "button" and self._button_text is not None:
+            if is_next_label(self._button_label) or is_next_label("".join(self._button_text)):
+                self.has_unfollowable_next = True
+            self._button_text = None
+            return
+        
+        if tag == "a" and self._anchor is not None:
+            self._check_next_anchor(self._anchor)
+            self._anchor = None
+        
+        if tag != "a" or self._current_href is None:
+            return
+        
+        href = self._current_href
+        self._current_href = None
+        if href in self._seen:
+            return
+        
+        self._seen.add(href)
+        self.links.append({"href": href, "text": " ".join("".join(self._current_text).split())})
+    
+    def _is_own_or_parent_page(self, href: str) -> bool:
+        """Check whether a link points at the page itself or one of its parent paths.
+        
+        Args:
+            href: Absolute link URL
+            
+        Returns:
+            True for links like /careers on /careers/jobs
+        """
+        link, page = urlparse(urldefrag(href)[0]), urlparse(urldefrag(self.base_url)[0])
+        if link.netloc != page.netloc:
+            return False
+        if link.path == page.path:
+            return link.query == page.query
+        return page.path.startswith(link.path.rstrip("/") + "/")
+    
+    def _check_next_anchor(self, anchor: dict) -> None:
+        """Record an anchor as the next page link if it reads as one.
+        
+        Args:
+            anchor: Finished anchor with its href, rel, label and text parts
+        """
+        if self.next_url:
+            return
+        if "next" not in anchor["rel"] and not (
+            is_next_label(anchor["label"]) or is_next_label("".join(anchor["text"]))
+        ):
+            return
+        
+        href = anchor["href"].strip()
+        next_url = urldefrag(urljoin(self.base_url, href))[0] if href else ""
+        if not href or href.startswith(("#", "javascript:")) or next_url == urldefrag(self.base_url)[0]:
+            self.has_unfollowable_next = True
+            return
+        self.next_url = next_url
+
+
+class HttpFetcher:
+    """Fetches listing pages over pooled HTTP and remembers the tier per URL.
+    
+    Static pages are parsed directly. A page with fewer than
+    `http_min_job_links` job-like anchors is escalated to the browser, and
+    that decision is remembered for `fetch_tier_max_age_days` so the next
+    runs go straight to it. A failed fetch uses the browser for this run
+    only.
+    """
+    
+    def __init__(self, session: requests.Session | None = None) -> None:
+        """Initialize the HTTP fetcher.
+        
+        Args:
+            session: HTTP session to use, a pooled session is created if None
+        """
+        self.session = session or create_http_session(scraping_settings.http_concurrency)
+        self.logger = get_logger("http_fetcher")
+        self.store = JsonFileStore(FETCH_TIERS_FILE_NAME)
+        self.tiers: dict[str, dict] = self.store.load()
+        self._updated: dict[str, dict] = {}
+        self._lock = threading.Lock()
+    
+    def fetch_links(
+        self,
+        url: str,
+        fingerprint: str | None = None,
+        deadline: Deadline | None = None
+        ) -> HttpListing | None:
+        """Fetch a page's job links over HTTP unless it needs a browser.
+        
+        A stored ETag or Last-Modified fingerprint is sent as a conditional
+        request, so an unchanged page costs a 304 without a body.
+        
+        Args:
+            url: Target page URL
+            fingerprint: Fingerprint stored for the page on the last run
+            deadline: Crawl budget the request timeout is capped at
+            
+        Returns:
+            HttpListing, or None if the URL needs the browser
+        """
+        deadline = deadline or Deadline()
+        if self._get_remembered_tier(url) == TIER_BROWSER:
+            self.logger.info(f"Using browser tier (remembered): {url}")
+            return None
+        
+        if deadline.expired():
+            return None
+        
+        start = time.monotonic()
+        try:
+            response = self.session.get(
+                url,
+                headers=self._conditional_headers(fingerprint),
+                timeout=deadline.cap(browser_settings.page_load_timeout)
+            )
+            if response.status_code == 304:
+                self.logger.info(f"HTTP listing not modified: {url}")
+                return HttpListing(links=[], fingerprint=fingerprint, not_modified=True)
+            
+            response.raise_for_status()
+            parser = JobAnchorParser(response.url)
+            parser.feed(response.text)
+            links = merge_links(
+                extract_job_postings(parser.json_ld_blocks, response.url),
+                parser.links
+            )
+        except Exception as e:
+            self.logger.warning(f"HTTP fetch failed for {url}, using browser this run: {str(e)[:100]}")
+            return None
+        
+        elapsed_ms = (time.monotonic() - start) * 1000
+        
+        # Menus alone can pass the count; real listings also match the keywords
+        if len(links) < scraping_settings.http_min_job_links or not filter_job_links(links):
+            self.logger.info(f"HTTP found {len(links)} job links in {elapsed_ms:.0f} ms, escalating to browser: {url}")
+            self._remember(url, TIER_BROWSER)
+            return None
+        
+        # Pagination driven by scripts can only be followed in the browser
+        if parser.has_unfollowable_next and not parser.next_url:
+            self.logger.info(f"HTTP page paginates without a next link, escalating to browser: {url}")
+            self._remember(url, TIER_BROWSER)
+            return None
+        
+        self.logger.info(f"HTTP found {len(links)} job links in {elapsed_ms:.0f} ms: {url}")
+        self._remember(url, TIER_HTTP)
+        return HttpListing(
+            links=links,
+            fingerprint=self._get_fingerprint(response, links),
+            next_url=parser.next_url
+        )
+    
+    def fetch_page(self, url: str, deadline: Deadline | None = None) -> HttpListing | None:
+        """Fetch a further page of a listing served over HTTP.
+        
+        Unlike the first page it is neither conditional nor escalated, so a
+        short last page is kept as is.
+        
+        Args:
+            url: URL of the page, usually the previous page's next link
+            deadline: Crawl budget the request timeout is capped at
+            
+        Returns:
+            HttpListing, or None if the fetch failed or time is up
+        """
+        deadline = deadline or Deadline()
+        if deadline.expired():
+            return None
+        
+        try:
+            response = self.session.get(url, timeout=deadline.cap(browser_settings.page_load_timeout))
+            response.raise_for_status()
+        except Exception as e:
+            self.logger.warning(f"HTTP fetch failed for page {url}: {str(e)[:100]}")
+            return None
+        
+        parser = JobAnchorParser(response.url)
+        parser.feed(response.text)
+        links = merge_links(extract_job_postings(parser.json_ld_blocks, response.url), parser.links)
+        self.logger.info(f"HTTP found {len(links)} job links on page {url}")
+        return HttpListing(links=links, fingerprint=fingerprint_links(links), next_url=parser.next_url)
+    
+    def save(self) -> None:
+        """Persist the tiers decided in this run.
+        
+        Only the URLs decided here are merged into the file, so crawl
+        processes sharing it keep each other's decisions.
+        """
+        with self._lock:
+            if not self._updated:
+                return
+            self.store.update(self._updated)
+            self._updated.clear()
+    
+    def _conditional_headers(self, fingerprint: str | None) -> dict:
+        """Build conditional request headers from a stored fingerprint.
+        
+        Args:
+            fingerprint: Fingerprint stored for the page, if any
+            
+        Returns:
+            If-None-Match or If-Modified-Since header, or no headers
+        """
+        if not fingerprint:
+            return {}
+        kind, _, value = fingerprint.partition(":")
+        if kind == "etag":
+            return {"If-None-Match": value}
+        if kind == "last-modified":
+            return {"If-Modified-Since": value}
+        return {}
+    
+    def _get_fingerprint(self, response: requests.Response, links: List[dict]) -> str:
+        """Fingerprint a fetched page, preferring the server's validators.
+        
+        Args:
+            response: HTTP response of the page
+            links: Job links parsed from the page
+            
+        Returns:
+            Fingerprint string prefixed with its kind
+        """
+        if response.headers.get("ETag"):
+            return f"etag:{response.headers['ETag']}"
+        if response.headers.get("Last-Modified"):
+            return f"last-modified:{response.headers['Last-Modified']}"
+        return fingerprint_links(links)
+    
+    def _get_remembered_tier(self, url: str) -> str | None:
+        """Get the tier that served a URL, unless the decision has expired.
+        
+        Args:
+            url: Target page URL
+            
+        Returns:
+            TIER_HTTP or TIER_BROWSER, or None if nothing fresh is remembered
+        """
+        with self._lock:
+            entry = self.tiers.get(url)
+        if not isinstance(entry, dict):
+            return None
+        
+        max_age = timedelta(days=scraping_settings.fetch_tier_max_age_days)
+        if datetime.fromisoformat(entry["decided"]) < datetime.now() - max_age:
+            return None
+        return entry["tier"]
+    
+    def _remember(self, url: str, tier: str) -> None:
+        """Remember the tier that served a URL.
+        
+        Args:
+            url: Target page URL
+            tier: TIER_HTTP or TIER_BROWSER
+        """
+        entry = {"tier": tier, "decided": datetime.now().isoformat()}
+        with self._lock:
+            self.tiers[url] = entry
+            self._updated[url] = entry
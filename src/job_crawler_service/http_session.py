@@ -0,0 +1,30 @@
+"""Pooled HTTP session shared by the browser-less crawl paths."""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Desktop browser user agent - some boards reject the default requests one
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:128.0) "
+    "Gecko/20100101 Firefox/128.0"
+)
+
+
+def create_http_session(pool_size: int = 10) -> requests.Session:
+    """Create an HTTP session with connection pooling.
+    
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": HTTP_USER_AGENT,
+        "Accept-Language": "en-US,en;q=0.9",
+    })
+    return session
@@ -1,11 +1,33 @@
 """Job crawler manager for coordinating job scraping operations using Playwright."""
 
-from typing import List
-from .job_scraper import JobScraper
+import math
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
+from typing import Callable, Dict, List
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+from .job_scraper import JobScraper, JOB_TITLE_SELECTORS
 from .browser_driver import BrowserDriver
+from .browser_server import BrowserServer
 from .page_navigator import PageNavigator
+from .crawl_stats import crawl_stats
+from .workday_client import WorkdayClient
+from .http_fetcher import HttpFetcher, HttpListing
+from .listing_fingerprints import ListingFingerprints
+from .site_profiles import SiteProfiles, SiteProfile
+from .robots_cache import RobotsCache
+from .host_scheduler import HostScheduler, get_host_key
+from .circuit_breaker import CircuitBreaker
+from .deadline import Deadline
+from .har_archive import HAR_REPLAY, has_har
+from .work_queue import CrawlWorkQueue, TASK_PENDING, TASK_LEASED, TASK_FAILED
+from .job_links import filter_job_links, build_job_data, merge_links
 from src.data_models import JobData
-from src.config import scraping_settings
+from src.config import scraping_settings, browser_settings, crawl_queue_settings, get_site_settings
+from src.job_storage.job_storage_service import JobStorageService
 from src.logger import get_logger
 from src.exceptions.exceptions import JobCrawlerException
 
@@ -18,62 +40,925 @@ class JobCrawlerService:
     browser management, URL navigation, and job data extraction.
     """
 
-    def __init__(self) -> None:
-        """Initialize the job crawler manager."""
+    def __init__(self, job_storage_service: JobStorageService | None = None) -> None:
+        """Initialize the job crawler manager.
+
+        Args:
+            job_storage_service: Storage of sent jobs, used to stop paginating
+                listings sorted by recency once a page holds only known jobs.
+        """
         self.logger = get_logger("job_crawler")
-        self.job_scraper = None
-        self.page_navigator = None
-        
+        self.job_storage_service = job_storage_service
+        self.workday_client = WorkdayClient()
+        self.http_fetcher = HttpFetcher()
+        self.listing_fingerprints = ListingFingerprints()
+        self.site_profiles = SiteProfiles()
+        self.robots_cache = RobotsCache(self.http_fetcher.session)
+        self.circuit_breaker = CircuitBreaker()
+        self.crawl_deadline = Deadline()
+
         self.logger.info("Job crawler manager initialized...")
-    
+
     def crawl_jobs(self) -> List[JobData]:
         """Crawl jobs from specified URLs."""
         self.logger.info(f"Starting job crawl..")
-
-        result: List[JobData] = []
+        crawl_stats.reset()
+        self.crawl_deadline = Deadline(scraping_settings.crawl_budget)
 
         try:
-            with BrowserDriver() as page:
-                self.job_scraper = JobScraper(page)
-                self.page_navigator = PageNavigator(page)
-
-                for url in scraping_settings.urls:
-                    page.goto(url, wait_until="domcontentloaded")
-                    result.extend(self._process_url(url))
+            if crawl_queue_settings.coordinator:
+                results = self._crawl_via_work_queue(scraping_settings.urls)
+            else:
+                results = self._crawl_locally(scraping_settings.urls)
 
         except Exception as e:
             self.logger.error(f"Error during job crawling: {e}")
             raise JobCrawlerException()
-        
+        finally:
+            crawl_stats.log_summary()
+            self._log_cache_hit_ratio()
+            if crawl_stats.counters["pages.skipped"]:
+                self.logger.info(f"Change detection skipped {crawl_stats.counters['pages.skipped']} pages")
+
+        result = self._merge_results(results)
+
         if not result:
             raise RuntimeError("No jobs found during crawling")
 
+        self._assign_job_ids(result)
+
         self.logger.info(f"Found {len(result)} jobs total:")
         for i, job in enumerate(result, 1):
             self.logger.info(f"  {i}. {job.title} at {job.company}")
         return result
-    
-    def _process_url(self, url: str) -> List[JobData]:
+
+    def _crawl_locally(self, urls: List[str]) -> Dict[str, List[JobData]]:
+        """Crawl URLs in this process, escalating from API to HTTP to browser.
+
+        URLs whose circuit is open are skipped. A URL that fails is left out
+        of the result; the browser failing as a whole only fails the crawl
+        if nothing was collected.
+
+        Args:
+            urls: URLs to crawl.
+
+        Returns:
+            Mapping of each URL to the jobs found on it.
+        """
+        urls = [url for url in urls if not self.circuit_breaker.is_open(url)]
+
+        results: Dict[str, List[JobData]] = {}
+        if browser_settings.har_mode:
+            # HAR archives only cover browser traffic, so every URL goes
+            # through the browser
+            urls = self._get_har_urls(urls)
+        else:
+            results = self._crawl_via_api(urls)
+            if scraping_settings.http_first:
+                results.update(self._crawl_via_http([url for url in urls if url not in results]))
+        browser_urls = [url for url in urls if url not in results]
+
+        try:
+            if scraping_settings.crawl_processes > 1 and len(browser_urls) > 1:
+                results.update(self._crawl_in_processes(browser_urls))
+            elif scraping_settings.max_concurrent_urls > 1 and len(browser_urls) > 1:
+                results.update(self._crawl_concurrently(browser_urls))
+            elif browser_urls:
+                results.update(self._crawl_sequentially(browser_urls))
+        except Exception as e:
+            if not results:
+                raise
+            self.logger.error(f"Browser crawl failed, keeping {len(results)} URLs crawled without it: {e}")
+
+        for url in results:
+            self.circuit_breaker.record_success(url)
+
+        self.listing_fingerprints.save()
+        self.site_profiles.save()
+        self.circuit_breaker.save()
+        return results
+
+    def _get_robots_cache(self) -> RobotsCache | None:
+        """Get the robots.txt source for host scheduling.
+
+        Returns:
+            The robots cache, or None in HAR replay where no live site is
+            contacted and politeness does not apply.
+        """
+        return None if browser_settings.har_mode == HAR_REPLAY else self.robots_cache
+
+    def _get_har_urls(self, urls: List[str]) -> List[str]:
+        """Get the URLs that can be crawled in the current HAR mode.
+
+        Args:
+            urls: URLs to crawl.
+
+        Returns:
+            All URLs when recording, only the recorded ones when replaying.
+        """
+        if browser_settings.har_mode != HAR_REPLAY:
+            return urls
+
+        recorded = [url for url in urls if has_har(url)]
+        for url in urls:
+            if url not in recorded:
+                self.logger.warning(f"No HAR recorded for {url}, skipping it in replay")
+        return recorded
+
+    def _crawl_via_work_queue(self, urls: List[str]) -> Dict[str, List[JobData]]:
+        """Publish URLs to the shared work queue and wait for crawl workers.
+
+        Workers on any host (`jh crawl-worker`) lease the URLs, so this
+        process only coordinates. URLs that fail on every attempt or are not
+        finished before the coordinator timeout are left out of the result.
+
+        Args:
+            urls: URLs to crawl.
+
+        Returns:
+            Mapping of each finished URL to the jobs found on it.
+        """
+        work_queue = CrawlWorkQueue()
+        run_id = work_queue.create_run(urls)
+        self.logger.info(f"Published {len(urls)} URLs as run {run_id}, waiting for crawl workers")
+
+        deadline = time.monotonic() + crawl_queue_settings.coordinator_timeout
+        progress = work_queue.get_progress(run_id)
+        while time.monotonic() < deadline:
+            progress = work_queue.get_progress(run_id)
+            remaining = progress[TASK_PENDING] + progress[TASK_LEASED]
+            if not remaining:
+                break
+            self.logger.debug(f"Run {run_id}: {remaining} URLs remaining")
+            time.sleep(crawl_queue_settings.poll_interval)
+        else:
+            self.logger.warning(f"Run {run_id} timed out with unfinished URLs: {progress}")
+
+        if progress[TASK_FAILED]:
+            self.logger.warning(f"Run {run_id}: {progress[TASK_FAILED]} URLs failed on every attempt")
+
+        return work_queue.get_results(run_id)
+
+    def crawl_url_without_browser(self, url: str) -> List[JobData] | None:
+        """Crawl a single URL through the direct API and HTTP tiers only.
+
+        Args:
+            url: URL to crawl.
+
+        Returns:
+            Jobs found on the URL, or None if it needs the browser.
+        """
+        results = self._crawl_via_api([url])
+        if url not in results and scraping_settings.http_first:
+            results = self._crawl_via_http([url])
+        return results.get(url)
+
+    def _crawl_via_api(self, urls: List[str]) -> Dict[str, List[JobData]]:
+        """Crawl URLs whose site exposes a direct JSON API, without a browser.
+
+        URLs whose API call fails are left out of the result so they fall
+        back to the browser crawl.
+
+        Args:
+            urls: URLs to crawl.
+
+        Returns:
+            Mapping of each URL handled over the API to the jobs found on it.
+        """
+        results: Dict[str, List[JobData]] = {}
+
+        for url in urls:
+            if not self.workday_client.supports(url):
+                continue
+            # URLs left over are skipped by the later tiers' schedulers
+            if self.crawl_deadline.expired():
+                break
+            try:
+                links = filter_job_links(self.workday_client.fetch_links(url, self.crawl_deadline))
+            except Exception as e:
+                self.logger.warning(f"Direct API failed, falling back to browser for {url}: {e}")
+                continue
+
+            crawl_stats.increment("urls.direct_api")
+            results[url] = [build_job_data(link, url, i) for i, link in enumerate(links, 1)]
+
+        return results
+
+    def _crawl_via_http(self, urls: List[str]) -> Dict[str, List[JobData]]:
+        """Crawl URLs whose listings are served as static HTML.
+
+        URLs with too few job-like links in the static HTML, or whose fetch
+        failed, are left out of the result so they escalate to the browser
+        crawl. Paginated listings are followed through their next links.
+
+        Args:
+            urls: URLs to crawl.
+
+        Returns:
+            Mapping of each URL handled over HTTP to the jobs found on it.
+        """
+        results: Dict[str, List[JobData]] = {}
+        if not urls:
+            return results
+
+        scheduler = HostScheduler(urls, self._get_robots_cache(), self.crawl_deadline)
+
+        def fetch_scheduled() -> None:
+            while (url := scheduler.acquire()) is not None:
+                try:
+                    listing = self.http_fetcher.fetch_links(
+                        url, self.listing_fingerprints.get_fingerprint(url), self.crawl_deadline
+                    )
+                    if listing is not None:
+                        results[url] = self._crawl_http_pages(url, listing)
+                        crawl_stats.increment("urls.http")
+                except Exception as e:
+                    self.logger.warning(f"HTTP crawl failed, leaving {url} to the browser: {e}")
+                finally:
+                    scheduler.release(url)
+
+        with ThreadPoolExecutor(max_workers=scraping_settings.http_concurrency) as executor:
+            futures = [
+                executor.submit(fetch_scheduled)
+                for _ in range(min(scraping_settings.http_concurrency, len(urls)))
+            ]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                # URLs without a result escalate to the browser
+                self.logger.error(f"HTTP crawl worker failed, leaving its URLs to the browser: {e}")
+        self.http_fetcher.save()
+
+        return results
+
+    def _crawl_http_pages(self, url: str, listing: HttpListing) -> List[JobData]:
+        """Build the jobs of a static listing, following its next links over HTTP.
+
+        Stops after `max_pages_per_url` pages, once the crawl budget is used
+        up, or on a recency-sorted site at a page holding only known jobs.
+
+        Args:
+            url: Target page URL.
+            listing: First page of the listing.
+
+        Returns:
+            List of JobData objects found on all pages.
+        """
+        unchanged_jobs = self.listing_fingerprints.get_unchanged_jobs(url, listing.fingerprint)
+        if unchanged_jobs is not None:
+            return unchanged_jobs
+
+        sorted_by_recency = get_site_settings(url).sorted_by_recency
+        links = listing.links
+        page = listing
+        pages = 1
+        visited = {url}
+
+        while page.next_url and page.next_url not in visited and pages < scraping_settings.max_pages_per_url:
+            if sorted_by_recency and self._all_jobs_known(self._build_jobs(url, page.links)):
+                self.logger.info(f"Page {pages} holds only known jobs, stopping pagination: {url}")
+                crawl_stats.increment("pages.stopped_known")
+                break
+            if self.crawl_deadline.expired():
+                self.logger.warning(f"Crawl budget used up after {pages} pages, keeping partial results: {url}")
+                break
+
+            visited.add(page.next_url)
+            page = self.http_fetcher.fetch_page(page.next_url, self.crawl_deadline)
+            if page is None:
+                break
+            links = merge_links(links, page.links)
+            pages += 1
+
+        jobs = self._build_jobs(url, links)
+        self.listing_fingerprints.remember(url, listing.fingerprint, pages, jobs)
+        return jobs
+
+    def _build_jobs(self, url: str, links: List[dict]) -> List[JobData]:
+        """Build job data from the links of a listing that match the filters.
+
+        Args:
+            url: Target page URL the links were found through.
+            links: Harvested {'href', 'text'} dicts.
+
+        Returns:
+            List of JobData objects.
+        """
+        return [build_job_data(link, url, i) for i, link in enumerate(filter_job_links(links), 1)]
+
+    def _crawl_sequentially(self, urls: List[str]) -> Dict[str, List[JobData]]:
+        """Crawl all URLs one after another on a single page.
+
+        Args:
+            urls: URLs to crawl.
+
+        Returns:
+            Mapping of each URL to the jobs found on it.
+        """
+        results: Dict[str, List[JobData]] = {}
+        scheduler = HostScheduler(urls, self._get_robots_cache(), self.crawl_deadline)
+
+        def reset_page() -> None:
+            nonlocal page
+            page = driver.recycle_context(page)
+
+        driver = BrowserDriver()
+        try:
+            with driver as page:
+                while (url := scheduler.acquire()) is not None:
+                    try:
+                        jobs = self._crawl_on_driver(driver, lambda: page, url, reset_page)
+                        if jobs is not None:
+                            results[url] = jobs
+                        page = driver.recycle_if_needed(page, url)
+                    finally:
+                        scheduler.release(url)
+        except Exception as e:
+            if not results:
+                raise
+            self.logger.error(f"Browser failed, keeping {len(results)} URLs crawled so far: {e}")
+
+        return results
+
+    def _crawl_concurrently(self, urls: List[str]) -> Dict[str, List[JobData]]:
+        """Crawl URLs in parallel, one isolated browser context per URL.
+
+        All contexts live in one browser. The Playwright sync API is bound
+        to the thread that started it, so the browser runs as a browser
+        server and every worker thread connects its own Playwright to it,
+        pulling URLs from a shared host scheduler. Persistent profiles
+        cannot share a browser, so with them every worker launches its own.
+
+        Args:
+            urls: URLs to crawl.
+
+        Returns:
+            Mapping of each URL to the jobs found on it.
+        """
+        workers_count = min(scraping_settings.max_concurrent_urls, len(urls))
+        # Persistent profiles, which HAR mode turns off, cannot share a browser
+        shares_browser = not browser_settings.use_persistent_profile or bool(browser_settings.har_mode)
+        if shares_browser:
+            self.logger.info(f"Crawling {len(urls)} URLs in {workers_count} concurrent contexts of one browser")
+        else:
+            self.logger.info(f"Crawling {len(urls)} URLs with {workers_count} concurrent browser profiles")
+
+        scheduler = HostScheduler(urls, self._get_robots_cache(), self.crawl_deadline)
+
+        results: Dict[str, List[JobData]] = {}
+        errors: List[Exception] = []
+
+        browser_server = BrowserServer() if shares_browser else None
+        if browser_server:
+            browser_server.ensure_running()
+
+        workers = [
+            threading.Thread(
+                target=self._crawl_worker,
+                args=(scheduler, results, errors, browser_server),
+                name=f"crawl-worker-{i + 1}"
+            )
+            for i in range(workers_count)
+        ]
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            # A server started only for this crawl is not kept around
+            if browser_server and not browser_settings.use_browser_server:
+                browser_server.stop()
+
+        if errors:
+            if not results:
+                raise errors[0]
+            self.logger.error(f"Crawl worker failed, keeping {len(results)} URLs crawled so far: {errors[0]}")
+
+        return results
+
+    def _crawl_in_processes(self, urls: List[str]) -> Dict[str, List[JobData]]:
+        """Shard URLs across worker processes, each with its own browser.
+
+        Workers stream (url, jobs) messages back as each URL finishes and
+        end with a message carrying their crawl statistics.
+
+        Args:
+            urls: URLs to crawl.
+
+        Returns:
+            Mapping of each URL to the jobs found on it.
+        """
+        shards = self._shard_by_host(urls, min(scraping_settings.crawl_processes, len(urls)))
+        processes_count = len(shards)
+        self.logger.info(f"Crawling {len(urls)} URLs across {processes_count} worker processes")
+
+        result_queue = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=crawl_shard,
+                args=(
+                    shards[i],
+                    result_queue,
+                    f"crawl-process-{i + 1}",
+                    self.job_storage_service,
+                    self.crawl_deadline.remaining(),
+                    browser_settings.har_mode
+                ),
+                name=f"crawl-process-{i + 1}"
+            )
+            for i in range(processes_count)
+        ]
+        for process in processes:
+            process.start()
+
+        results: Dict[str, List[JobData]] = {}
+        errors: List[str] = []
+        finished = 0
+
+        try:
+            while finished < processes_count:
+                try:
+                    message = result_queue.get(timeout=1)
+                except Empty:
+                    # A worker that died without reporting would block us forever
+                    if not any(process.is_alive() for process in processes):
+                        errors.append("worker process exited without reporting")
+                        break
+                    continue
+
+                match message["type"]:
+                    case "url":
+                        results[message["url"]] = message["jobs"]
+                        self.logger.info(f"Received {len(message['jobs'])} jobs from {message['url']}")
+                    case "error":
+                        errors.append(message["error"])
+                    case "done":
+                        crawl_stats.merge(message["stats"])
+                        finished += 1
+        finally:
+            for process in processes:
+                process.join()
+
+        if errors:
+            if not results:
+                raise RuntimeError(f"Worker process failed: {errors[0]}")
+            self.logger.error(f"Worker process failed, keeping {len(results)} URLs crawled so far: {errors[0]}")
+
+        return results
+
+    def _shard_by_host(self, urls: List[str], shards_count: int) -> List[List[str]]:
+        """Split URLs into shards keeping each site's URLs together.
+
+        Processes do not share a host scheduler, so a site is only ever
+        crawled by one of them.
+
+        Args:
+            urls: URLs to shard.
+            shards_count: Maximum number of shards.
+
+        Returns:
+            Non-empty shards, balanced by URL count.
+        """
+        by_host: Dict[str, List[str]] = {}
+        for url in urls:
+            by_host.setdefault(get_host_key(url), []).append(url)
+
+        shards: List[List[str]] = [[] for _ in range(shards_count)]
+        for host_urls in sorted(by_host.values(), key=len, reverse=True):
+            min(shards, key=len).extend(host_urls)
+
+        return [shard for shard in shards if shard]
+
+    def _crawl_worker(
+        self,
+        scheduler: HostScheduler,
+        results: Dict[str, List[JobData]],
+        errors: List[Exception],
+        browser_server: BrowserServer | None = None
+        ) -> None:
+        """Worker thread loop - crawl URLs from the scheduler until none are left.
+
+        Args:
+            scheduler: Scheduler handing out the URLs waiting to be crawled.
+            results: Shared mapping of URL to the jobs found on it.
+            errors: Shared list collecting errors raised by workers.
+            browser_server: Server of the browser shared by all workers, or
+                None to launch a browser of the worker's own.
+        """
+        driver = BrowserDriver(profile_name=threading.current_thread().name, browser_server=browser_server)
+        try:
+            driver.start()
+            while not errors and (url := scheduler.acquire()) is not None:
+                try:
+                    jobs = self._crawl_with_retries(url, lambda deadline: self._crawl_in_new_context(driver, url, deadline))
+                    if jobs is not None:
+                        results[url] = jobs
+                finally:
+                    scheduler.release(url)
+
+        except Exception as e:
+            self.logger.error(f"Error in {threading.current_thread().name}: {e}")
+            errors.append(e)
+        finally:
+            driver.close()
+
+    def _crawl_on_driver(
+        self,
+        driver: BrowserDriver,
+        get_page: Callable[[], Page],
+        url: str,
+        reset: Callable[[], None]
+        ) -> List[JobData] | None:
+        """Crawl a URL on a driver's shared page, or in its own context under HAR.
+
+        The page is looked up on every attempt, since `reset` replaces it
+        after a failed one.
+
+        Args:
+            driver: Browser driver owning the page.
+            get_page: Returns the page currently reused across URLs.
+            url: URL to crawl.
+            reset: Replaces the shared page after a failed attempt.
+
+        Returns:
+            Jobs found on the URL, or None if every attempt failed.
+        """
+        if browser_settings.har_mode:
+            # Archives are per context, so each URL gets its own
+            return self._crawl_with_retries(url, lambda deadline: self._crawl_in_new_context(driver, url, deadline))
+        return self._crawl_with_retries(url, lambda deadline: self.crawl_url(driver, get_page(), url, deadline), reset)
+
+    def _crawl_in_new_context(self, driver: BrowserDriver, url: str, deadline: Deadline) -> List[JobData]:
+        """Crawl a URL in a fresh context that is closed afterwards.
+
+        Args:
+            driver: Browser driver to open the context with.
+            url: URL to crawl.
+            deadline: Budget of the URL.
+
+        Returns:
+            List of JobData objects found on all pages of the URL.
+        """
+        context = driver.new_context(har_url=url)
+        page = driver.new_page(context)
+        try:
+            jobs = self.crawl_url(driver, page, url, deadline)
+            driver.memory_sampler.sample(page, url)
+            return jobs
+        finally:
+            page.close()
+            driver.close_context(context)
+
+    def _crawl_with_retries(
+        self,
+        url: str,
+        crawl: Callable[[Deadline], List[JobData]],
+        reset: Callable[[], None] | None = None
+        ) -> List[JobData] | None:
+        """Crawl a URL in its own failure domain and time budget.
+
+        Failed attempts are retried after a jittered exponential backoff
+        while the URL's budget lasts. Once all attempts fail the failure is
+        counted by the circuit breaker and the crawl moves on to the next URL.
+
+        Args:
+            url: URL to crawl.
+            crawl: Crawls the URL once within the given deadline.
+            reset: Restores a clean page after a failed attempt; an error
+                raised here means the browser itself is broken and propagates.
+
+        Returns:
+            Jobs found on the URL, or None if every attempt failed.
+        """
+        deadline = Deadline(scraping_settings.url_budget, parent=self.crawl_deadline)
+        error = ""
+        for attempt in range(1, scraping_settings.url_max_attempts + 1):
+            try:
+                return crawl(deadline)
+            except Exception as e:
+                error = str(e)[:200]
+                self.logger.warning(f"Attempt {attempt}/{scraping_settings.url_max_attempts} failed for {url}: {error}")
+
+            if reset:
+                reset()
+            if deadline.expired():
+                self.logger.warning(f"URL budget used up, not retrying: {url}")
+                break
+            if attempt < scraping_settings.url_max_attempts:
+                crawl_stats.increment("urls.retried")
+                backoff = random.uniform(0, scraping_settings.retry_backoff * 2 ** (attempt - 1))
+                time.sleep(deadline.cap(backoff))
+
+        crawl_stats.increment("urls.failed")
+        self.circuit_breaker.record_failure(url, error)
+        return None
+
+    def crawl_url(
+        self,
+        driver: BrowserDriver,
+        page: Page,
+        url: str,
+        deadline: Deadline | None = None
+        ) -> List[JobData]:
+        """Open a URL and scrape all of its pages.
+
+        Every wait is capped at the URL's budget; pages scraped before it
+        runs out are returned.
+
+        Args:
+            driver: Browser driver owning the page.
+            page: Playwright Page to crawl with.
+            url: URL to crawl.
+            deadline: Budget of the URL, `url_budget` from now if None.
+
+        Returns:
+            List of JobData objects found on all pages of the URL.
+        """
+        deadline = deadline or Deadline(scraping_settings.url_budget, parent=self.crawl_deadline)
+        driver.apply_site_settings(url)
+        profile = self.site_profiles.get(url)
+        job_scraper = JobScraper(page, profile, deadline)
+        try:
+            page.set_default_timeout(max(deadline.cap(browser_settings.page_load_timeout) * 1000, 1))
+            page.goto(url, wait_until="domcontentloaded")
+            return self._process_url(url, driver, job_scraper, PageNavigator(page, profile, deadline))
+        finally:
+            job_scraper.detach()
+            driver.record_cache_stats(page)
+            driver.record_blocked_requests(url)
+
+    def _process_url(
+        self,
+        url: str,
+        driver: BrowserDriver,
+        job_scraper: JobScraper,
+        page_navigator: PageNavigator
+        ) -> List[JobData]:
 
         """
         Process all pages for current URL.
-        
+
+        Once the first click reveals a URL pagination pattern, the remaining
+        pages are loaded in parallel tabs instead of clicking through them.
+
         Args:
             url: URL to process.
-            
+            driver: Browser driver owning the page.
+            job_scraper: Scraper bound to the page showing the URL.
+            page_navigator: Navigator bound to the page showing the URL.
+
         Returns:
             List of JobData objects found on all pages.
-        """        
+        """
         result: List[JobData] = []
+        pages = 0
         ongoing = True
         self.logger.info(f"Processing URL: {url}")
+
+        # Reuse the last run's jobs when the first page has not changed,
+        # except under HAR where every run must walk the same pages
+        detect_changes = scraping_settings.skip_unchanged_listings and not browser_settings.har_mode
+        last_fingerprint = self.listing_fingerprints.get_fingerprint(url) if detect_changes else None
+
+        sorted_by_recency = get_site_settings(url).sorted_by_recency
+
         # Process all pages for this URL
         while ongoing:
             # Find jobs on the current page
-            result.extend(self.job_scraper.scrape_jobs())
+            first_page = not pages
+            page_jobs = job_scraper.scrape_jobs(detect_changes and first_page, last_fingerprint)
+            if first_page and job_scraper.unchanged:
+                unchanged_jobs = self.listing_fingerprints.get_unchanged_jobs(url, job_scraper.fingerprint)
+                if unchanged_jobs is not None:
+                    return unchanged_jobs
+            result.extend(page_jobs)
+            pages += 1
+
+            # Newest-first listings hold nothing new past a fully known page
+            if sorted_by_recency and self._all_jobs_known(page_jobs):
+                self.logger.info(f"Page {pages} holds only known jobs, stopping pagination: {url}")
+                crawl_stats.increment("pages.stopped_known")
+                break
+
+            if job_scraper.deadline.expired():
+                self.logger.warning(f"URL budget used up after {pages} pages, keeping partial results: {url}")
+                crawl_stats.increment("urls.out_of_budget")
+                break
+
+            # Page through a URL pattern in parallel tabs, the order of
+            # recency-sorted pages matters for stopping early
+            page_urls = page_navigator.page_urls(pages + 1)
+            if page_urls and scraping_settings.parallel_pages > 1 and not sorted_by_recency:
+                try:
+                    tab_results = self._scrape_pages_in_tabs(
+                        driver, page_navigator.page, page_urls, job_scraper.profile, job_scraper.deadline
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Parallel pages failed, keeping {pages} pages: {str(e)[:100]}")
+                    tab_results = []
+                for tab_jobs in tab_results:
+                    result.extend(tab_jobs)
+                    pages += 1
+                break
 
             # Try to go to next page
-            if not self.page_navigator.go_to_next_page():
+            if not page_navigator.go_to_next_page():
                 ongoing = False
 
+        if job_scraper.fingerprint:
+            self.listing_fingerprints.remember(url, job_scraper.fingerprint, pages, result)
+        if result:
+            self._learn_site_profile(url, job_scraper, page_navigator, pages)
         return result
+
+    def _scrape_pages_in_tabs(
+        self,
+        driver: BrowserDriver,
+        page: Page,
+        page_urls: List[str],
+        profile: SiteProfile | None,
+        deadline: Deadline
+        ) -> List[List[JobData]]:
+        """Load pages in parallel tabs and scrape them in page order.
+
+        The sync API blocks on goto, so each navigation is started from
+        inside its tab and awaited afterwards - the browser loads a whole
+        batch of tabs at once.
+
+        Args:
+            driver: Browser driver owning the page.
+            page: Page showing the URL, its context hosts the tabs.
+            page_urls: URLs of the remaining pages.
+            profile: Strategy learned for the site on earlier runs, if any.
+            deadline: Budget of the URL, no batch starts once it is used up.
+
+        Returns:
+            Jobs found on each page, in page order.
+        """
+        self.logger.info(f"Loading {len(page_urls)} pages in up to {scraping_settings.parallel_pages} parallel tabs")
+        results: List[List[JobData]] = []
+
+        for start in range(0, len(page_urls), scraping_settings.parallel_pages):
+            if deadline.expired():
+                self.logger.warning(f"URL budget used up, skipping {len(page_urls) - start} pages")
+                break
+
+            batch = page_urls[start:start + scraping_settings.parallel_pages]
+            tabs = [driver.new_page(page.context) for _ in batch]
+            scrapers = [JobScraper(tab, profile, deadline) for tab in tabs]
+            try:
+                for tab, page_url in zip(tabs, batch):
+                    tab.evaluate("url => { window.location.href = url; }", page_url)
+
+                for tab, scraper, page_url in zip(tabs, scrapers, batch):
+                    try:
+                        if deadline.expired():
+                            raise PlaywrightTimeoutError("URL budget used up")
+                        tab.wait_for_url(
+                            lambda current: current != "about:blank",
+                            wait_until="domcontentloaded",
+                            timeout=deadline.cap(browser_settings.page_load_timeout) * 1000
+                        )
+                    except PlaywrightTimeoutError:
+                        self.logger.warning(f"Page did not load in its tab: {page_url}")
+                        results.append([])
+                        continue
+                    crawl_stats.increment("pages.parallel")
+                    results.append(scraper.scrape_jobs())
+            finally:
+                for tab, scraper in zip(tabs, scrapers):
+                    scraper.detach()
+                    tab.close()
+
+        return results
+
+    def _learn_site_profile(
+        self,
+        url: str,
+        job_scraper: JobScraper,
+        page_navigator: PageNavigator,
+        pages: int
+        ) -> None:
+        """Remember the strategy that worked on a URL's site for later runs.
+
+        Args:
+            url: Crawled URL.
+            job_scraper: Scraper that scraped the first page.
+            page_navigator: Navigator that paginated the URL.
+            pages: Number of pages crawled.
+        """
+        cached = job_scraper.profile
+        self.site_profiles.remember(url, SiteProfile(
+            job_selectors=[selector for selector in JOB_TITLE_SELECTORS if selector in job_scraper.matched_selectors],
+            next_button=page_navigator.next_button_selector,
+            scroll_container=job_scraper.scroll_container,
+            pages=pages,
+            paginates=not (pages == 1 and page_navigator.last_page_reached),
+            load_time=job_scraper.load_time or 0.0,
+            discovered=cached.discovered if cached else ""
+        ))
+
+    def _all_jobs_known(self, jobs: List[JobData]) -> bool:
+        """Check whether every job of a page was already sent.
+
+        Args:
+            jobs: Jobs found on a single page.
+
+        Returns:
+            True if the page has jobs and all of them are in storage.
+        """
+        if not self.job_storage_service or not jobs:
+            return False
+        return all(self.job_storage_service.is_job_sent(job.url) for job in jobs)
+
+    def _merge_results(self, results: Dict[str, List[JobData]]) -> List[JobData]:
+        """Merge per-URL results in TARGET_URLS order, dropping duplicate job URLs.
+
+        Args:
+            results: Mapping of each URL to the jobs found on it.
+
+        Returns:
+            Merged list of unique jobs.
+        """
+        merged: List[JobData] = []
+        seen_urls = set()
+
+        for url in scraping_settings.urls:
+            for job in results.get(url, []):
+                if job.url in seen_urls:
+                    continue
+                seen_urls.add(job.url)
+                merged.append(job)
+
+        return merged
+
+    def _log_cache_hit_ratio(self) -> None:
+        """Log the share of page resources served from the persistent HTTP cache."""
+        resources = crawl_stats.counters["cache.resources"]
+        if resources:
+            self.logger.info(
+                f"HTTP cache hit ratio: {crawl_stats.counters['cache.hits'] / resources:.0%} "
+                f"({crawl_stats.counters['cache.hits']} / {resources} resources)"
+            )
+
+    def _assign_job_ids(self, jobs: List[JobData]) -> None:
+        """Re-number jobs so IDs stay unique across URLs and workers.
+
+        Args:
+            jobs: Merged list of JobData objects from all URLs.
+        """
+        for i, job in enumerate(jobs, 1):
+            job.id = f"{i}"
+
+
+def crawl_shard(
+    urls: List[str],
+    result_queue: multiprocessing.Queue,
+    profile_name: str,
+    job_storage_service: JobStorageService | None = None,
+    crawl_budget: float | None = None,
+    har_mode: str | None = None
+    ) -> None:
+    """Worker process entry point - crawl a shard of URLs with its own browser.
+
+    Args:
+        urls: URLs assigned to this worker.
+        result_queue: Queue streaming messages back to the parent process.
+        profile_name: Browser profile name for this worker.
+        job_storage_service: Storage of sent jobs from the parent process.
+        crawl_budget: Time left of the parent's crawl budget (seconds).
+        har_mode: The parent's HAR mode - spawned processes do not inherit
+            settings changed at runtime.
+    """
+    browser_settings.har_mode = har_mode
+    service = JobCrawlerService(job_storage_service)
+    service.crawl_deadline = Deadline(None if crawl_budget == math.inf else crawl_budget)
+    crawl_stats.reset()
+
+    try:
+        scheduler = HostScheduler(urls, service._get_robots_cache(), service.crawl_deadline)
+        driver = BrowserDriver(profile_name=profile_name)
+
+        def reset_page() -> None:
+            nonlocal page
+            page = driver.recycle_context(page)
+
+        with driver as page:
+            while (url := scheduler.acquire()) is not None:
+                try:
+                    jobs = service._crawl_on_driver(driver, lambda: page, url, reset_page)
+                    if jobs is not None:
+                        result_queue.put({"type": "url", "url": url, "jobs": jobs})
+                    page = driver.recycle_if_needed(page, url)
+                finally:
+                    scheduler.release(url)
+    except Exception as e:
+        service.logger.error(f"Error in {profile_name}: {e}")
+        result_queue.put({"type": "error", "error": str(e)})
+    finally:
+        service.listing_fingerprints.save()
+        service.site_profiles.save()
+        service.circuit_breaker.save()
+        result_queue.put({"type": "done", "stats": crawl_stats.snapshot()})
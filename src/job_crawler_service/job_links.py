@@ -0,0 +1,156 @@
+"""Helpers turning harvested {'href', 'text'} links into job data.
+
+Shared by every crawl path - DOM harvest, JSON API responses and direct
+HTTP fetches - so they filter and build JobData the same way.
+"""
+
+import re
+from datetime import datetime, timedelta
+from typing import List
+from urllib.parse import urlparse
+from src.config import scraping_settings
+from src.data_models.job_data import JobData
+
+
+def filter_job_links(job_links: List[dict]) -> List[dict]:
+    """
+    Filter job links to only include those that match the keywords.
+    
+    Args:
+        job_links: List of {'href', 'text'} dicts to filter.
+        
+    Returns:
+        List of job links whose text matches the keywords.
+    """
+    return [
+        link for link in job_links
+        if matches_keywords(link["text"], scraping_settings.keywords) and
+        not matches_keywords(link["text"], scraping_settings.excluded_keywords) and
+        matches_structured_data(link)
+    ]
+
+
+def matches_structured_data(link: dict) -> bool:
+    """
+    Check a link's published date and location against the settings.
+    
+    Only values the site actually published are checked, so links without
+    structured data always pass.
+    
+    Args:
+        link: Link dict, optionally with 'date_posted' and 'location'.
+        
+    Returns:
+        True if the link is recent enough and in an allowed location.
+    """
+    date_posted = link.get("date_posted")
+    if date_posted and scraping_settings.max_posting_age_days is not None:
+        if date_posted < datetime.now() - timedelta(days=scraping_settings.max_posting_age_days):
+            return False
+    
+    location = link.get("location")
+    if location and scraping_settings.locations:
+        return matches_location(location, scraping_settings.locations)
+    
+    return True
+
+
+def merge_links(primary: List[dict], secondary: List[dict]) -> List[dict]:
+    """
+    Merge two link lists, keeping the primary entry for duplicate hrefs.
+    
+    Args:
+        primary: Links that win on duplicate hrefs, e.g. structured data.
+        secondary: Links added when their href is not in primary.
+        
+    Returns:
+        Merged list of links.
+    """
+    hrefs = {link["href"] for link in primary}
+    return primary + [link for link in secondary if link["href"] not in hrefs]
+
+
+def build_job_data(link: dict, source_url: str, job_id: int) -> JobData:
+    """
+    Build job data from a harvested link.
+    
+    Args:
+        link: {'href', 'text'} dict to extract job data from, optionally
+            with 'company', 'location' and 'date_posted'.
+        source_url: URL of the page the link was found on.
+        job_id: Numeric ID for the job.
+        
+    Returns:
+        JobData object for the link.
+    """
+    return JobData(
+        id=f"{job_id}",
+        title=link["text"],
+        url=link["href"],
+        company=link.get("company") or extract_company_name(source_url),
+        source_url=source_url,
+        location=link.get("location", ""),
+        date_posted=link.get("date_posted")
+    )
+
+
+def extract_company_name(url: str) -> str:
+    """
+    Extract company name from URL.
+    
+    Args:
+        url: URL to extract company name from.
+        
+    Returns:
+        Company name extracted from URL.
+    """
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc.lower()
+        
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        
+        # Extract company name (first part before first dot)
+        company = domain.split('.')[0]
+        
+        return company.title()
+        
+    except Exception:
+        return "Unknown"
+
+
+def matches_location(location: str, locations: List[str]) -> bool:
+    """
+    Check if a location matches any configured location as whole words.
+    
+    Unlike keywords, "IL" must not match inside "Chile" or "Illinois".
+    
+    Args:
+        location: Location published by the site, e.g. "Tel Aviv, IL".
+        locations: Locations to keep.
+        
+    Returns:
+        True if any configured location appears as whole words.
+    """
+    return any(
+        re.search(rf"(?<!\w){re.escape(wanted)}(?!\w)", location, re.IGNORECASE)
+        for wanted in locations
+    )
+
+
+def matches_keywords(job_title: str, keywords: List[str]) -> bool:
+    """
+    Check if job title matches any keywords.
+    
+    Args:
+        job_title: Job title to check.
+        keywords: List of keywords to check against.
+        
+    Returns:
+        True if job title matches any keywords, False otherwise.
+    """
+    title_lower = job_title.lower()
+    keywords_lower = [keyword.lower() for keyword in keywords]
+
+    return any(keyword in title_lower for keyword in keywords_lower)
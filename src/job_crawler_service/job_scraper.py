@@ -1,10 +1,27 @@
 """Job scraper for finding keywords in job listings using Playwright."""
 
+import time
 from typing import List
-from playwright.sync_api import Page, Locator
-from src.config import scraping_settings
+from urllib.parse import urlparse
+from playwright.sync_api import Page, Response, TimeoutError as PlaywrightTimeoutError
+from src.config import scraping_settings, get_site_settings
 from src.logger import get_logger
 from src.data_models.job_data import JobData
+from .page_scripts import (
+    HARVEST_LINKS_SCRIPT,
+    MIN_ANCHORS_READY_SCRIPT,
+    JSON_LD_SCRIPT,
+    FIND_SCROLL_CONTAINER_SCRIPT,
+    SCROLL_STEP_SCRIPT,
+)
+from .crawl_stats import crawl_stats
+from .response_extractors import ResponseExtractorFactory
+from .job_links import filter_job_links, build_job_data, merge_links
+from .structured_data import extract_job_postings
+from .page_settler import PageSettler
+from .listing_fingerprints import fingerprint_links
+from .site_profiles import SiteProfile
+from .deadline import Deadline
 
 # Constants for scrollable containers
 SCROLLABLE_CONTAINERS = [
@@ -14,7 +31,12 @@ SCROLLABLE_CONTAINERS = [
     ".results-list"              # Common class
 ]
 
-MAX_SCROLL_ATTEMPTS = 10
+# Scrolling stops once the list's end brings no new links, or at the URL
+# budget. This only bounds lists that keep growing when there is no budget.
+MAX_SCROLL_STEPS = 500
+
+# Attribute used to tag the detected scroll container inside the page
+SCROLL_CONTAINER_MARKER = "data-jh-scroll"
 
 # Job title selectors - focus on URL patterns (href-based matching)
 JOB_TITLE_SELECTORS = [
@@ -30,20 +52,56 @@ JOB_TITLE_SELECTORS = [
 class JobScraper:
     """Scrapes job listings for specific keywords using Playwright."""
     
-    def __init__(self, page: Page) -> None:
+    def __init__(
+        self,
+        page: Page,
+        profile: SiteProfile | None = None,
+        deadline: Deadline | None = None
+        ) -> None:
         """Initialize the job scraper.
         
         Args:
             page: Playwright Page instance.
+            profile: Strategy learned for the site on earlier runs, if any.
+            deadline: Budget of the URL, every wait is capped at it.
         """
         self.page = page
+        self.profile = profile
+        self.deadline = deadline or Deadline()
+        self.settler = PageSettler(page, self.deadline)
         self.logger = get_logger("job_scraper")
         self.jobs_counter = 0
+        self.api_responses: List[Response] = []
+        
+        # What worked on this page, for the next run's site profile
+        self.matched_selectors: set[str] = set()
+        self.scroll_container = profile.scroll_container if profile else None
+        self.load_time: float | None = None
+        
+        # Change detection of the first page, see scrape_jobs
+        self.fingerprint: str | None = None
+        self.unchanged = False
+        
+        self.page.on("response", self._on_response)
+    
+    def detach(self) -> None:
+        """Stop listening to the page's responses."""
+        self.page.remove_listener("response", self._on_response)
     
-    def scrape_jobs(self) -> List[JobData]:
+    def scrape_jobs(self, detect_changes: bool = False, last_fingerprint: str | None = None) -> List[JobData]:
         """
         Find job listings that contain any of the specified keywords.
         
+        With `detect_changes`, the links found before any scrolling are hashed
+        into `fingerprint`, provided some of them are relevant jobs rather
+        than only the site's navigation. If that matches `last_fingerprint`
+        the page is unchanged since the last run: `unchanged` is set and
+        scrolling is skipped.
+        
+        Args:
+            detect_changes: Whether to fingerprint the page for change detection.
+            last_fingerprint: Fingerprint of the page on the last run, if any.
+        
         Returns:
             List of JobData objects for jobs that match the keywords.
         """
@@ -52,176 +110,259 @@ class JobScraper:
 
         try:
             # Wait for page to be ready
-            self.page.wait_for_load_state("networkidle")
+            self._wait_until_ready()
             
-            # Smart scroll - detects and scrolls correct container
-            self._scroll_full_page()
+            # Prefer listings from the site's JSON API, scrape the DOM otherwise
+            job_links = self._harvest_response_links()
             
-            # Find and filter elements
-            job_elements = self._find_job_elements()
+            if job_links:
+                if detect_changes:
+                    self._detect_change(job_links, last_fingerprint)
+            else:
+                # Structured JobPosting data first - it carries date and location
+                structured_links = self._harvest_structured_links()
+                links, selectors = self._harvest_job_links()
+                job_links = merge_links(structured_links, list(links.values()))
+                
+                # Keep harvesting while scrolling the list's real container -
+                # JSON-LD often lists only the featured or first jobs
+                if not (detect_changes and self._detect_change(job_links, last_fingerprint)):
+                    self._scroll_and_harvest(links, selectors)
+                    job_links = merge_links(structured_links, list(links.values()))
+                
+                for link in links.values():
+                    self.logger.info(f"Added element: {link['text']}")
+                self.logger.info(f"Found {len(links)} unique job elements")
 
-            # Filter job elements to only include those that match the keywords
-            filtered_job_elements = self._filter_job_elements(job_elements)
+            # Filter job links to only include those that match the keywords
+            filtered_job_links = self._filter_job_links(job_links)
             
-            # Extract job data from filtered job elements into JobData objects
-            for element in filtered_job_elements:
-                result.append(self._extract_job_data(element))
+            # Extract job data from filtered job links into JobData objects
+            source_url = self.page.url
+            for link in filtered_job_links:
+                result.append(self._extract_job_data(link, source_url))
 
         except Exception as e:
             self.logger.error(f"Error finding jobs: {e}")
         
         return result
 
-    def _scroll_container(self, container: Locator) -> None:
-        """Scroll a specific container element."""
-        last_height = 0
-        attempts = 0
+    def _detect_change(self, links: List[dict], last_fingerprint: str | None) -> bool:
+        """Fingerprint the links found before scrolling and compare with the last run.
         
-        while attempts < MAX_SCROLL_ATTEMPTS:
-            current_height = container.evaluate("el => el.scrollHeight")
-            if current_height == last_height:
-                break
+        A page showing no relevant job yet, like a client-rendered shell with
+        only a careers link in its navigation, gets no fingerprint.
+        
+        Args:
+            links: Links harvested before any scrolling
+            last_fingerprint: Fingerprint of the page on the last run, if any
             
-            container.evaluate("el => el.scrollTo(0, el.scrollHeight)")
-            self.page.wait_for_timeout(scraping_settings.scroll_pause_time * 1000)
-            last_height = current_height
-            attempts += 1
-
-    def _scroll_full_page(self) -> None:
-        """Scroll the entire page."""
-        last_height = 0
-        attempts = 0
-        
-        while attempts < MAX_SCROLL_ATTEMPTS:
-            current_height = self.page.evaluate("document.body.scrollHeight")
-            if current_height == last_height:
+        Returns:
+            True if the page is unchanged since the last run
+        """
+        self.fingerprint = fingerprint_links(links) if filter_job_links(links) else None
+        self.unchanged = self.fingerprint is not None and self.fingerprint == last_fingerprint
+        return self.unchanged
+
+    def _wait_until_ready(self) -> None:
+        """Wait for the site's readiness predicate instead of network idle.
+        
+        A timeout is logged and scraping continues with whatever has rendered.
+        """
+        site = get_site_settings(self.page.url)
+        timeout = self.deadline.cap(scraping_settings.ready_timeout) * 1000
+        start = time.monotonic()
+        
+        try:
+            if timeout <= 0:
+                raise PlaywrightTimeoutError("URL budget used up")
+            if site.ready_script:
+                self.page.wait_for_function(site.ready_script, timeout=timeout)
+            elif site.ready_selector:
+                self.page.wait_for_selector(site.ready_selector, state="attached", timeout=timeout)
+            else:
+                self.page.wait_for_function(
+                    MIN_ANCHORS_READY_SCRIPT,
+                    arg=[", ".join(JOB_TITLE_SELECTORS), site.ready_min_anchors],
+                    timeout=timeout
+                )
+        except PlaywrightTimeoutError:
+            self.logger.warning(f"Page not ready after {scraping_settings.ready_timeout}s, scraping anyway: {self.page.url}")
+        
+        elapsed = time.monotonic() - start
+        crawl_stats.record_time(f"ready.{urlparse(self.page.url).netloc}", elapsed)
+        self.logger.info(f"Page ready after {elapsed * 1000:.0f} ms: {self.page.url}")
+        
+        if self.load_time is None:
+            self.load_time = elapsed
+            if self.profile and self.profile.load_time and elapsed > 3 * self.profile.load_time:
+                self.logger.warning(
+                    f"Page took {elapsed:.1f}s to get ready, typically {self.profile.load_time:.1f}s: {self.page.url}"
+                )
+
+    def _scroll_and_harvest(self, links: dict[str, dict], selectors: List[str]) -> None:
+        """Scroll the job list step by step, collecting links after each step.
+        
+        Virtualized lists drop rows that scrolled out of view, so anchors are
+        collected at every step. When a step brings no new links the list is
+        jumped to its end once, which triggers infinite-scroll loading; if
+        that brings nothing new either, scrolling stops. Otherwise it goes
+        on until the URL budget is used up, however long the list is.
+        
+        Args:
+            links: Links collected so far by href, updated in place
+            selectors: Job link selectors to harvest with
+        """
+        containers = SCROLLABLE_CONTAINERS
+        if self.profile and self.profile.scroll_container:
+            containers = [self.profile.scroll_container] + SCROLLABLE_CONTAINERS
+        
+        self.scroll_container = self.page.evaluate(
+            FIND_SCROLL_CONTAINER_SCRIPT,
+            [containers, ", ".join(selectors), SCROLL_CONTAINER_MARKER]
+        )
+        self.logger.info(f"Scrolling {self.scroll_container or 'the document'}")
+        
+        to_end = False
+        for step in range(1, MAX_SCROLL_STEPS + 1):
+            if self.deadline.expired():
+                self.logger.warning(f"URL budget used up, stopping scroll after {step - 1} steps")
                 break
             
-            self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            self.page.wait_for_timeout(scraping_settings.scroll_pause_time * 1000)
-            last_height = current_height
-            attempts += 1
+            at_end = self.page.evaluate(SCROLL_STEP_SCRIPT, [SCROLL_CONTAINER_MARKER, to_end])
+            self.settler.settle("scroll", scraping_settings.scroll_pause_time)
+            
+            new_links = 0
+            for link in self.page.evaluate(HARVEST_LINKS_SCRIPT, selectors)["links"]:
+                if link["href"] not in links:
+                    links[link["href"]] = link
+                    new_links += 1
+            
+            self.logger.debug(f"Scroll step {step}: {new_links} new links")
+            if new_links:
+                to_end = False
+            elif at_end or to_end:
+                break
+            else:
+                to_end = True
+        else:
+            self.logger.warning(
+                f"Still finding links after {MAX_SCROLL_STEPS} scroll steps, keeping {len(links)}: {self.page.url}"
+            )
+            crawl_stats.increment("scroll.capped")
+        
+        crawl_stats.increment("scroll.steps", step)
 
-    def _find_job_elements(self) -> List[Locator]:
-        """Find job elements using Playwright locators."""
-        self.logger.info(f"Searching job elements on {self.page.url}")
+    def _on_response(self, response: Response) -> None:
+        """Keep XHR/fetch responses for JSON extraction at scrape time.
         
-        job_elements = []
+        Args:
+            response: Response received by the page.
+        """
+        if response.request.resource_type in ("xhr", "fetch"):
+            self.api_responses.append(response)
 
-        for selector in JOB_TITLE_SELECTORS:
-            try:
-                elements = self.page.locator(selector).all()
-                if elements:
-                    self.logger.info(f"Found {len(elements)} elements with selector: {selector}")
-                    job_elements.extend(elements)
-                else:
-                    self.logger.debug(f"No elements found with selector: {selector}")
-            except Exception as e:
-                self.logger.debug(f"Error with selector {selector}: {e}")
-                continue
+    def _harvest_response_links(self) -> List[dict]:
+        """Extract job links from JSON responses captured since the last scrape.
+        
+        Returns:
+            List of {'href', 'text'} dicts, deduplicated by href.
+        """
+        responses, self.api_responses = self.api_responses, []
+        
+        extractor_name = get_site_settings(self.page.url).json_extractor
+        if not extractor_name:
+            return []
         
-        self.logger.info(f"Total elements found before deduplication: {len(job_elements)}")
+        extractor = ResponseExtractorFactory.create_extractor(extractor_name)
+        links: dict[str, dict] = {}
         
-        # Remove duplicates by href
-        seen_urls = set()
-        unique_elements = []
-        for element in job_elements:
+        for response in responses:
+            if not response.ok or not extractor.matches(response.url):
+                continue
+            if "json" not in (response.headers.get("content-type") or ""):
+                continue
             try:
-                href = element.evaluate("el => el.href")
-                if href and href not in seen_urls:
-                    seen_urls.add(href)
-                    unique_elements.append(element)
-                    self.logger.info(f"Added element: {element.inner_text()}")
-                elif href:
-                    self.logger.debug(f"Duplicate URL found: {href}")
+                for link in extractor.extract(response.json(), response.url):
+                    links.setdefault(link["href"], link)
             except Exception as e:
-                self.logger.debug(f"Error getting href from element: {e}")
-                continue
+                self.logger.debug(f"Error extracting jobs from {response.url}: {e}")
         
-        self.logger.info(f"Found {len(unique_elements)} unique job elements")
-        return unique_elements
+        if links:
+            self.logger.info(f"Found {len(links)} jobs in {extractor_name} API responses")
+            crawl_stats.increment("pages.json_api")
+        
+        return list(links.values())
 
-    def _filter_job_elements(self, job_elements: List[Locator]) -> List[Locator]:
-        """
-        Filter job elements to only include those that match the keywords.
+    def _harvest_structured_links(self) -> List[dict]:
+        """Extract schema.org JobPosting entries from the page's JSON-LD.
         
-        Args:
-            job_elements: List of Locators to filter.
-            
         Returns:
-            List of Locators that match the keywords.
+            List of link dicts with structured company, location and date fields.
         """
-        self.logger.info(f"Filtering job elements..")
-        filtered = []
-        for element in job_elements:
-            try:
-                text = element.inner_text()
-                if self._matches_keywords(text, scraping_settings.keywords) and \
-                not self._matches_keywords(text, scraping_settings.excluded_keywords):
-                    filtered.append(element)
-            except Exception:
-                continue
-        self.logger.info(f"{len(filtered)} / {len(job_elements)} jobs titles are relevant")
-        return filtered
+        links = extract_job_postings(self.page.evaluate(JSON_LD_SCRIPT), self.page.url)
+        
+        if links:
+            self.logger.info(f"Found {len(links)} JobPosting entries in JSON-LD")
+            crawl_stats.increment("pages.json_ld")
+        
+        return links
 
-    def _extract_job_data(self, element: Locator) -> JobData:
-        """
-        Extract job data from Playwright element.
+    def _harvest_job_links(self) -> tuple[dict[str, dict], List[str]]:
+        """Collect the candidate job links currently rendered in one round trip.
+        
+        The selectors that matched on the site's last crawl are tried first;
+        all JOB_TITLE_SELECTORS are used if they find nothing.
         
-        Args:
-            element: Locator to extract job data from.
-            
         Returns:
-            JobData object with auto-incremented unique ID.
+            Tuple of ({'href', 'text'} dicts by href, selectors that were used).
         """
-        self.jobs_counter += 1
+        self.logger.info(f"Searching job elements on {self.page.url}")
+        
+        selectors = JOB_TITLE_SELECTORS
+        if self.profile and self.profile.job_selectors:
+            selectors = self.profile.job_selectors
+        
+        harvest = self.page.evaluate(HARVEST_LINKS_SCRIPT, selectors)
+        if not harvest["links"] and selectors is not JOB_TITLE_SELECTORS:
+            self.logger.info("Cached job selectors found nothing, trying all selectors")
+            selectors = JOB_TITLE_SELECTORS
+            harvest = self.page.evaluate(HARVEST_LINKS_SCRIPT, selectors)
+        
+        for selector, count in harvest["counts"].items():
+            if count:
+                self.matched_selectors.add(selector)
+                self.logger.info(f"Found {count} elements with selector: {selector}")
+            else:
+                self.logger.debug(f"No elements found with selector: {selector}")
+        
+        return {link["href"]: link for link in harvest["links"]}, selectors
 
-        return JobData(
-            id=f"{self.jobs_counter}",
-            title=element.inner_text(),
-            url=element.evaluate("el => el.href"),
-            company=self._extract_company_name(self.page.url),
-            source_url=self.page.url
-        )
-    
-    def _extract_company_name(self, url: str) -> str:
+    def _filter_job_links(self, job_links: List[dict]) -> List[dict]:
         """
-        Extract company name from URL.
+        Filter job links to only include those that match the keywords.
         
         Args:
-            url: URL to extract company name from.
+            job_links: List of {'href', 'text'} dicts to filter.
             
         Returns:
-            Company name extracted from URL.
+            List of job links whose text matches the keywords.
         """
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            
-            # Extract company name (first part before first dot)
-            company = domain.split('.')[0]
-            
-            return company.title()
-            
-        except Exception:
-            return "Unknown"
-    
-    def _matches_keywords(self, job_title: str, keywords: List[str]) -> bool:
+        self.logger.info(f"Filtering job elements..")
+        filtered = filter_job_links(job_links)
+        self.logger.info(f"{len(filtered)} / {len(job_links)} jobs titles are relevant")
+        return filtered
+
+    def _extract_job_data(self, link: dict, source_url: str) -> JobData:
         """
-        Check if job title matches any keywords.
+        Build job data from a harvested link.
         
         Args:
-            job_title: Job title to check.
-            keywords: List of keywords to check against.
+            link: {'href', 'text'} dict to extract job data from.
+            source_url: URL of the page the link was found on.
             
         Returns:
-            True if job title matches any keywords, False otherwise.
+            JobData object with auto-incremented unique ID.
         """
-        title_lower = job_title.lower()
-        keywords_lower = [keyword.lower() for keyword in keywords]
-
-        return any(keyword in title_lower for keyword in keywords_lower)
\ No newline at end of file
+        self.jobs_counter += 1
+        return build_job_data(link, source_url, self.jobs_counter)
@@ -0,0 +1,127 @@
+"""Change detection for listing pages between crawl runs."""
+
+import hashlib
+import threading
+from typing import List
+from src.config import scraping_settings
+from src.data_models import JobData
+from src.logger import get_logger
+from src.job_storage.json_file_store import JsonFileStore
+from .crawl_stats import crawl_stats
+
+# File remembering the first-page fingerprint and jobs of each URL
+LISTING_FINGERPRINTS_FILE_NAME = "listing_fingerprints.json"
+
+
+def get_filters_key() -> str:
+    """Hash the job filters, so stored jobs are not reused after they change.
+    
+    Returns:
+        Hash of the keyword, location and posting age filters
+    """
+    filters = repr((
+        sorted(scraping_settings.keywords),
+        sorted(scraping_settings.excluded_keywords),
+        sorted(scraping_settings.locations),
+        scraping_settings.max_posting_age_days,
+    ))
+    return hashlib.sha256(filters.encode("utf-8")).hexdigest()
+
+
+def fingerprint_links(links: List[dict]) -> str:
+    """Hash the sorted hrefs of a page's job links.
+    
+    Args:
+        links: List of {'href', 'text'} dicts
+        
+    Returns:
+        Fingerprint string, stable across link order
+    """
+    hrefs = "\n".join(sorted({link["href"] for link in links}))
+    return f"links:{hashlib.sha256(hrefs.encode('utf-8')).hexdigest()}"
+
+
+class ListingFingerprints:
+    """Remembers what each URL's first page looked like on the last run.
+    
+    When a URL's first page fingerprint is unchanged, the jobs of the last
+    run are reused instead of scrolling and paginating the site again.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the fingerprint store."""
+        self.logger = get_logger("listing_fingerprints")
+        self.store = JsonFileStore(LISTING_FINGERPRINTS_FILE_NAME)
+        self.entries: dict[str, dict] = self.store.load()
+        self._updated: dict[str, dict] = {}
+        self._lock = threading.Lock()
+    
+    def get_fingerprint(self, url: str) -> str | None:
+        """Get the fingerprint stored for a URL.
+        
+        Args:
+            url: Target page URL
+            
+        Returns:
+            Stored fingerprint, or None if the URL was never crawled or
+            change detection is disabled
+        """
+        if not scraping_settings.skip_unchanged_listings:
+            return None
+        with self._lock:
+            entry = self.entries.get(url)
+        if not entry or entry.get("filters") != get_filters_key():
+            return None
+        return entry["fingerprint"]
+    
+    def get_unchanged_jobs(self, url: str, fingerprint: str) -> List[JobData] | None:
+        """Get the last run's jobs if the first page has not changed.
+        
+        Args:
+            url: Target page URL
+            fingerprint: Fingerprint of the first page on this run
+            
+        Returns:
+            Jobs found on the last run, or None if the page changed
+        """
+        if fingerprint != self.get_fingerprint(url):
+            return None
+        
+        with self._lock:
+            entry = self.entries[url]
+        
+        skipped = entry["pages"] - 1
+        crawl_stats.increment("pages.skipped", skipped)
+        self.logger.info(f"Listing unchanged since last run, skipped {skipped} pages: {url}")
+        return [JobData.from_dict(job) for job in entry["jobs"]]
+    
+    def remember(self, url: str, fingerprint: str, pages: int, jobs: List[JobData]) -> None:
+        """Store a URL's first page fingerprint with the jobs found on it.
+        
+        Args:
+            url: Target page URL
+            fingerprint: Fingerprint of the first page
+            pages: Number of pages crawled for the URL
+            jobs: Jobs found on all pages of the URL
+        """
+        entry = {
+            "fingerprint": fingerprint,
+            "pages": pages,
+            "filters": get_filters_key(),
+            "jobs": [job.to_dict() for job in jobs],
+        }
+        with self._lock:
+            self.entries[url] = entry
+            self._updated[url] = entry
+    
+    def save(self) -> None:
+        """Persist updated fingerprints.
+        
+        Only the URLs crawled here are merged into the file, so crawl
+        processes sharing it keep each other's entries.
+        """
+        with self._lock:
+            if not self._updated:
+                return
+            self.store.update(self._updated)
+            self._updated.clear()
@@ -3,12 +3,20 @@
 import logging
 from typing import Optional
 from playwright.sync_api import Page, Locator
-from src.config import scraping_settings
+from src.config import scraping_settings, browser_settings
+from .page_scripts import FIND_NEXT_BUTTON_SCRIPT
+from .page_settler import PageSettler
+from .pagination_pattern import PaginationPattern, infer_pagination_pattern
+from .site_profiles import SiteProfile
+from .deadline import Deadline
 
 # Next button keywords - focus on explicit "next" indicators
 NEXT_KEYWORDS = ['next', 'forward']
 ARROW_SYMBOLS = ['›', '→', '>']
 
+# Attribute used to tag the detected next button inside the page
+NEXT_BUTTON_MARKER = "data-jh-next"
+
 
 class PageNavigator:
     """Page navigation for job scraping using Playwright.
@@ -16,15 +24,28 @@ class PageNavigator:
     Handles URL navigation and pagination with flexible button detection.
     """
     
-    def __init__(self, page: Page) -> None:
+    def __init__(
+        self,
+        page: Page,
+        profile: Optional[SiteProfile] = None,
+        deadline: Optional[Deadline] = None
+        ) -> None:
         """Initialize the page navigator.
         
         Args:
             page: Playwright Page instance for browser automation.
+            profile: Strategy learned for the site on earlier runs, if any.
+            deadline: Budget of the URL, every wait is capped at it.
         """
         self.page = page
+        self.profile = profile
+        self.deadline = deadline or Deadline()
+        self.next_button_selector = profile.next_button if profile else None
+        self.last_page_reached = False
+        self.settler = PageSettler(page, self.deadline)
         self.logger = logging.getLogger(__name__)
         self.current_page = 1
+        self.pagination_pattern: Optional[PaginationPattern] = None
     
     def go_to_next_page(self) -> bool:
         """Navigate to the next page with smart button detection.
@@ -38,26 +59,38 @@ class PageNavigator:
             if not self._check_page_limit():
                 return False
             
-            # Scroll to bottom to ensure pagination buttons are loaded
-            self._scroll_to_bottom()
+            if self.deadline.expired():
+                self.logger.warning("URL budget used up, stopping pagination")
+                return False
+            
+            if self.profile and not self.profile.paginates:
+                self.logger.info("Site profile: no pagination")
+                return False
             
-            next_button = self._find_next_page_element()
+            next_button = self._find_cached_next_page_element()
+            if next_button is None:
+                # Scroll to bottom to ensure pagination buttons are loaded
+                self._scroll_to_bottom()
+                next_button = self._find_next_page_element()
 
             if next_button is None:
                 self.logger.info("No next page found")
+                self.last_page_reached = True
                 return False
             
             current_url = self.page.url
             
-            # Playwright auto-waits for element to be clickable
-            next_button.click()
+            # Playwright auto-waits for element to be clickable, and for a
+            # navigation started by the click to commit
+            next_button.click(timeout=self._remaining_ms())
+            
+            if self.page.url != current_url:
+                self.page.wait_for_load_state("domcontentloaded", timeout=self._remaining_ms())
+                if self.current_page == 1:
+                    self._infer_pagination_pattern(current_url)
             
-            # Wait for navigation (if URL changes)
-            try:
-                self.page.wait_for_url(lambda url: url != current_url, timeout=5000)
-            except:
-                # URL might not change (AJAX pagination)
-                self.page.wait_for_timeout(2000)
+            # Wait for the new results to render (also covers AJAX pagination)
+            self.settler.settle("pagination", scraping_settings.settle_timeout)
 
             self.current_page += 1
             return True
@@ -66,6 +99,43 @@ class PageNavigator:
             self.logger.warning(f"Error navigating to next page: {str(e)[:100]}")
             return False
     
+    def page_urls(self, first_page: int) -> list[str]:
+        """Build the URLs of the pages left up to the page limit.
+        
+        Args:
+            first_page: Number of the first page to build
+            
+        Returns:
+            Page URLs, empty if no URL pagination pattern was inferred
+        """
+        if self.pagination_pattern is None:
+            return []
+        return [
+            self.pagination_pattern.url_for(page_number)
+            for page_number in range(first_page, scraping_settings.max_pages_per_url + 1)
+        ]
+    
+    def _infer_pagination_pattern(self, first_url: str) -> None:
+        """Learn the URL pagination pattern from the first page transition.
+        
+        Args:
+            first_url: URL of the first page
+        """
+        self.pagination_pattern = infer_pagination_pattern(first_url, self.page.url)
+        if self.pagination_pattern:
+            self.logger.info(
+                f"Inferred {self.pagination_pattern.kind} pagination on "
+                f"'{self.pagination_pattern.key}' (step {self.pagination_pattern.step})"
+            )
+    
+    def _remaining_ms(self) -> float:
+        """Get the Playwright timeout for the next action within the URL budget.
+        
+        Returns:
+            Timeout in milliseconds, at least 1 (0 would disable the timeout)
+        """
+        return max(self.deadline.cap(browser_settings.page_load_timeout) * 1000, 1)
+    
     def _check_page_limit(self) -> bool:
         """Check if we've reached the maximum pages limit."""
         if self.current_page >= scraping_settings.max_pages_per_url:
@@ -78,85 +148,52 @@ class PageNavigator:
         try:
             # Scroll to bottom
             self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            self.page.wait_for_timeout(1000)  # Wait for any lazy-loaded content
+            self.settler.settle("bottom", scraping_settings.settle_timeout)  # Wait for any lazy-loaded content
             
             # Try one more scroll in case content loaded
             self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            self.page.wait_for_timeout(500)
+            self.settler.settle("bottom", scraping_settings.settle_timeout)
         except Exception as e:
             self.logger.debug(f"Error scrolling to bottom: {e}")
     
-    def _find_next_page_element(self) -> Optional[Locator]:
-        """Find next page button by checking for 'next' indicators in any attribute or text."""
-        all_elements = self.page.locator("a, button").all()
-        
-        for element in all_elements:
-            try:
-                if not element.is_visible():
-                    continue
-                
-                if self._is_next_button(element):
-                    return element
-                    
-            except Exception:
-                continue
-        
-        self.logger.warning("No next page element found")
-        return None
-    
-    def _is_next_button(self, element: Locator) -> bool:
-        """Check if element is a 'next' button by examining all attributes and text.
+    def _find_cached_next_page_element(self) -> Optional[Locator]:
+        """Find the next button through the selector learned on earlier runs.
         
-        Args:
-            element: Locator to check
-            
         Returns:
-            True if element contains 'next' indicators, False otherwise
+            Locator of the visible, enabled next button, or None.
         """
+        if not self.profile or not self.profile.next_button:
+            return None
+        
         try:
-            # Extract all relevant data
-            class_attr = (element.get_attribute("class") or "").lower()
-            title = (element.get_attribute("title") or "").lower()
-            aria_label = (element.get_attribute("aria-label") or "").lower()
-            href = (element.get_attribute("href") or "").lower()
-            text = element.inner_text().lower()
-            
-            # Get all data-* attributes
-            data_attrs = self._get_data_attributes(element)
-            data_values = " ".join(data_attrs.values())
-            
-            # Combine all searchable content
-            all_content = f"{class_attr} {title} {aria_label} {href} {text} {data_values}"
-            
-            # Check for NEXT_KEYWORDS or ARROW_SYMBOLS
-            for keyword in NEXT_KEYWORDS + ARROW_SYMBOLS:
-                if keyword in all_content:
-                    self.logger.info(f"Found next button with keyword '{keyword}': text='{text[:30]}', href='{href[:50]}'")
-                    return True
-            
-            return False
-            
+            next_button = self.page.locator(self.profile.next_button).first
+            if next_button.is_visible() and next_button.is_enabled():
+                self.logger.info(f"Found next button from site profile: {self.profile.next_button}")
+                self.next_button_selector = self.profile.next_button
+                return next_button
         except Exception as e:
-            self.logger.debug(f"Error checking element: {e}")
-            return False
+            self.logger.debug(f"Cached next button selector failed: {e}")
+        
+        return None
     
-    def _get_data_attributes(self, element: Locator) -> dict:
-        """Extract all data-* attributes from element.
+    def _find_next_page_element(self) -> Optional[Locator]:
+        """Find next page button by checking for 'next' indicators in any attribute or text.
         
-        Args:
-            element: Locator to extract data attributes from
-            
-        Returns:
-            Dictionary of data-* attribute names and values
+        The whole scoring pass runs inside the page; only the winning element
+        comes back, tagged so it can be addressed with a locator.
         """
-        data_attrs = {}
-        try:
-            attrs = element.evaluate("el => Array.from(el.attributes).map(a => a.name)")
-            for attr_name in attrs:
-                if attr_name.startswith("data-"):
-                    value = element.get_attribute(attr_name) or ""
-                    data_attrs[attr_name] = value.lower()
-        except Exception:
-            pass
-        return data_attrs
-    
\ No newline at end of file
+        candidate = self.page.evaluate(
+            FIND_NEXT_BUTTON_SCRIPT,
+            [NEXT_KEYWORDS + ARROW_SYMBOLS, NEXT_BUTTON_MARKER]
+        )
+        
+        if candidate is None:
+            self.logger.warning("No next page element found")
+            return None
+        
+        self.logger.info(
+            f"Found next button with keyword '{candidate['keyword']}': "
+            f"text='{candidate['text'][:30]}', href='{candidate['href'][:50]}'"
+        )
+        self.next_button_selector = candidate["stable"]
+        return self.page.locator(candidate["selector"]).first
@@ -0,0 +1,261 @@
+"""JavaScript snippets evaluated inside the page by the crawler.
+
+Each script does its work in a single `page.evaluate` call so the crawler
+pays one IPC round trip instead of one per element.
+"""
+
+# Collects {href, text} for every anchor matching any of the given selectors,
+# deduplicated by resolved href, plus the match count per selector.
+HARVEST_LINKS_SCRIPT = """
+(selectors) => {
+    const seen = new Set();
+    const links = [];
+    const counts = {};
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            counts[selector] = 0;
+            continue;
+        }
+        counts[selector] = elements.length;
+        for (const el of elements) {
+            const href = typeof el.href === 'string' ? el.href : '';
+            if (!href || seen.has(href)) continue;
+            seen.add(href);
+            links.push({href: href, text: (el.innerText || '').trim()});
+        }
+    }
+    return {links: links, counts: counts};
+}
+"""
+
+# Scores every visible, enabled `a, button` against the given keywords and
+# tags the best candidate with `data-jh-next`. Matches in visible text,
+# aria-label or title outrank matches in class, href or data-* attributes;
+# ties go to the first element in DOM order. Also returns a stable selector
+# for the candidate built from its id or identifying attributes.
+FIND_NEXT_BUTTON_SCRIPT = """
+([keywords, marker]) => {
+    document.querySelectorAll('[' + marker + ']').forEach(el => el.removeAttribute(marker));
+    let best = null;
+    for (const el of document.querySelectorAll('a, button')) {
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0) continue;
+        if (getComputedStyle(el).visibility === 'hidden') continue;
+        if (el.disabled || el.getAttribute('aria-disabled') === 'true') continue;
+
+        const text = (el.innerText || '').toLowerCase();
+        const label = [el.getAttribute('aria-label'), el.getAttribute('title')]
+            .map(v => (v || '').toLowerCase()).join(' ');
+        const dataValues = Array.from(el.attributes)
+            .filter(a => a.name.startsWith('data-'))
+            .map(a => a.value.toLowerCase());
+        const other = [el.getAttribute('class'), el.getAttribute('href')]
+            .map(v => (v || '').toLowerCase()).concat(dataValues).join(' ');
+
+        for (const keyword of keywords) {
+            let score = 0;
+            if (text.includes(keyword) || label.includes(keyword)) score = 2;
+            else if (other.includes(keyword)) score = 1;
+            if (score && (!best || score > best.score)) {
+                best = {el: el, score: score, keyword: keyword, text: text, href: el.getAttribute('href') || ''};
+            }
+        }
+        if (best && best.score === 2) break;
+    }
+    if (!best) return null;
+    best.el.setAttribute(marker, '1');
+
+    // A selector that still finds the button on later runs, if it has one
+    const tag = best.el.tagName.toLowerCase();
+    let stable = null;
+    if (best.el.id) stable = '#' + CSS.escape(best.el.id);
+    for (const name of ['aria-label', 'rel', 'data-testid', 'data-automation-id', 'title']) {
+        const value = best.el.getAttribute(name);
+        if (!stable && value) stable = tag + '[' + name + '="' + CSS.escape(value) + '"]';
+    }
+    return {
+        selector: '[' + marker + '="1"]',
+        stable: stable,
+        keyword: best.keyword,
+        text: best.text,
+        href: best.href,
+    };
+}
+"""
+
+# Init script counting the page's fetch and XHR requests still in flight in
+# `window.__jhInFlight`, announcing each start and end with an event. Added
+# before the document loads, so requests started before a settle are seen.
+TRACK_REQUESTS_SCRIPT = """
+(() => {
+    if (window.__jhInFlight !== undefined) return;
+    window.__jhInFlight = 0;
+    const started = () => {
+        window.__jhInFlight++;
+        window.dispatchEvent(new Event('jh-request-start'));
+    };
+    const ended = () => {
+        window.__jhInFlight = Math.max(0, window.__jhInFlight - 1);
+        window.dispatchEvent(new Event('jh-request-end'));
+    };
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (...args) {
+            started();
+            try {
+                return originalFetch.apply(this, args).finally(ended);
+            } catch (e) {
+                ended();
+                throw e;
+            }
+        };
+    }
+
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        started();
+        this.addEventListener('loadend', ended, {once: true});
+        try {
+            return originalSend.apply(this, args);
+        } catch (e) {
+            this.removeEventListener('loadend', ended);
+            ended();
+            throw e;
+        }
+    };
+})();
+"""
+
+# Resolves once no fetch/XHR request is in flight (see TRACK_REQUESTS_SCRIPT)
+# and the DOM has stopped mutating and no new network resources have
+# completed for `quietMs`, or after `timeoutMs` at the latest.
+WAIT_FOR_SETTLE_SCRIPT = """
+([quietMs, timeoutMs]) => new Promise(resolve => {
+    const start = performance.now();
+    let quietTimer = null;
+    let capTimer = null;
+    let mutationObserver = null;
+    let resourceObserver = null;
+    let mutations = 0;
+
+    const pause = () => clearTimeout(quietTimer);
+    const done = (settled) => {
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        if (mutationObserver) mutationObserver.disconnect();
+        if (resourceObserver) resourceObserver.disconnect();
+        window.removeEventListener('jh-request-start', pause);
+        window.removeEventListener('jh-request-end', arm);
+        resolve({settled: settled, elapsed: performance.now() - start, mutations: mutations});
+    };
+    // Quiet time only counts while no request is pending
+    function arm() {
+        clearTimeout(quietTimer);
+        if (window.__jhInFlight > 0) return;
+        quietTimer = setTimeout(() => done(true), quietMs);
+    }
+
+    window.addEventListener('jh-request-start', pause);
+    window.addEventListener('jh-request-end', arm);
+
+    mutationObserver = new MutationObserver(records => {
+        mutations += records.length;
+        arm();
+    });
+    mutationObserver.observe(document.documentElement || document, {childList: true, subtree: true});
+    try {
+        resourceObserver = new PerformanceObserver(() => arm());
+        resourceObserver.observe({type: 'resource'});
+    } catch (e) {}
+
+    capTimer = setTimeout(() => done(false), timeoutMs);
+    arm();
+})
+"""
+
+# True once at least `minCount` elements match the selector.
+MIN_ANCHORS_READY_SCRIPT = """
+([selector, minCount]) => document.querySelectorAll(selector).length >= minCount
+"""
+
+# Returns the raw text of every JSON-LD block on the page.
+JSON_LD_SCRIPT = """
+() => Array.from(document.querySelectorAll('script[type="application/ld+json"]'))
+    .map(script => script.textContent)
+"""
+
+# Counts resources of the current document served from the HTTP cache:
+# transferSize is 0 for cache hits. Cross-origin entries without
+# Timing-Allow-Origin report no sizes at all and are skipped.
+CACHE_STATS_SCRIPT = """
+() => {
+    const entries = performance.getEntriesByType('resource')
+        .filter(entry => entry.decodedBodySize > 0);
+    return {
+        resources: entries.length,
+        hits: entries.filter(entry => entry.transferSize === 0).length,
+    };
+}
+"""
+
+# Tags the element that actually scrolls the job list with `marker` and
+# returns a CSS selector for it, or null when the document itself scrolls. Known
+# container selectors are tried first, then the scrollable ancestor holding
+# the most job anchors.
+FIND_SCROLL_CONTAINER_SCRIPT = """
+([containerSelectors, jobSelector, marker]) => {
+    document.querySelectorAll('[' + marker + ']').forEach(el => el.removeAttribute(marker));
+    const scrollable = el => {
+        if (!el || el === document.body || el === document.documentElement) return false;
+        const overflow = getComputedStyle(el).overflowY;
+        return (overflow === 'auto' || overflow === 'scroll' || overflow === 'overlay')
+            && el.scrollHeight > el.clientHeight + 10;
+    };
+
+    let container = null;
+    for (const selector of containerSelectors) {
+        try {
+            container = Array.from(document.querySelectorAll(selector)).find(scrollable) || null;
+        } catch (e) {}
+        if (container) break;
+    }
+
+    if (!container) {
+        const anchorsPerAncestor = new Map();
+        for (const anchor of document.querySelectorAll(jobSelector)) {
+            let el = anchor.parentElement;
+            while (el && !scrollable(el)) el = el.parentElement;
+            if (el) anchorsPerAncestor.set(el, (anchorsPerAncestor.get(el) || 0) + 1);
+        }
+        let most = 0;
+        for (const [el, count] of anchorsPerAncestor) {
+            if (count > most) {
+                most = count;
+                container = el;
+            }
+        }
+    }
+
+    if (!container) return null;
+    container.setAttribute(marker, '1');
+    return container.tagName.toLowerCase()
+        + (container.id ? '#' + CSS.escape(container.id) : '')
+        + (typeof container.className === 'string' && container.className.trim()
+            ? '.' + container.className.trim().split(/\\s+/).map(c => CSS.escape(c)).join('.') : '');
+}
+"""
+
+# Scrolls the element tagged with `marker` (or the document) one viewport
+# down, or straight to the end, and reports whether the end was reached.
+SCROLL_STEP_SCRIPT = """
+([marker, toEnd]) => {
+    const el = document.querySelector('[' + marker + ']') || document.scrollingElement || document.documentElement;
+    if (toEnd) el.scrollTo(0, el.scrollHeight);
+    else el.scrollBy(0, Math.max(el.clientHeight * 0.8, 200));
+    return el.scrollTop + el.clientHeight >= el.scrollHeight - 2;
+}
+"""
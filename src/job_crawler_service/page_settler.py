@@ -0,0 +1,85 @@
+"""Event-driven waiting for pages to stop changing."""
+
+import time
+from playwright.sync_api import Page, Error as PlaywrightError
+from src.config import scraping_settings
+from src.logger import get_logger
+from .crawl_stats import crawl_stats
+from .page_scripts import WAIT_FOR_SETTLE_SCRIPT
+from .deadline import Deadline
+
+
+class PageSettler:
+    """Waits until a page's DOM and network go quiet.
+    
+    Replaces fixed sleeps: a `MutationObserver` and a resource
+    `PerformanceObserver` injected into the page resolve as soon as nothing
+    has changed for `settle_quiet_time`, bounded by a per-call timeout.
+    Quiet time only counts while no fetch or XHR request is in flight, as
+    counted by TRACK_REQUESTS_SCRIPT, which BrowserDriver adds to every page.
+    """
+    
+    def __init__(self, page: Page, deadline: Deadline | None = None) -> None:
+        """Initialize the page settler.
+        
+        Args:
+            page: Playwright Page instance to watch.
+            deadline: Budget every wait is capped at, unlimited if None.
+        """
+        self.page = page
+        self.deadline = deadline or Deadline()
+        self.logger = get_logger("page_settler")
+    
+    def settle(self, label: str, timeout: float) -> float:
+        """Wait for the page to settle.
+        
+        Args:
+            label: Name of the wait, used in logs and crawl statistics.
+            timeout: Upper bound for the wait (seconds).
+            
+        Returns:
+            Time actually spent waiting (seconds).
+        """
+        start = time.monotonic()
+        settled = False
+        timeout = self.deadline.cap(timeout)
+        
+        try:
+            settled = self._wait(timeout)
+        except PlaywrightError as e:
+            # The page navigated while we were watching it - wait for the new
+            # document, then watch that one with what is left of the budget
+            self.logger.debug(f"Settle '{label}' interrupted by navigation: {str(e)[:100]}")
+            try:
+                remaining = timeout - (time.monotonic() - start)
+                if remaining > 0:
+                    self.page.wait_for_load_state("domcontentloaded", timeout=remaining * 1000)
+                    settled = self._wait(max(timeout - (time.monotonic() - start), 0))
+            except PlaywrightError as e:
+                self.logger.debug(f"Settle '{label}' failed after navigation: {str(e)[:100]}")
+        
+        elapsed = time.monotonic() - start
+        crawl_stats.record_time(f"settle.{label}", elapsed)
+        self.logger.info(
+            f"Page settle '{label}' took {elapsed * 1000:.0f} ms"
+            f"{'' if settled else ' (hit upper bound)'}"
+        )
+        return elapsed
+    
+    def _wait(self, timeout: float) -> bool:
+        """Run the settle script in the page.
+        
+        Args:
+            timeout: Upper bound for the wait (seconds).
+            
+        Returns:
+            True if the page went quiet before the timeout, False otherwise.
+        """
+        if timeout <= 0:
+            return False
+        
+        result = self.page.evaluate(
+            WAIT_FOR_SETTLE_SCRIPT,
+            [scraping_settings.settle_quiet_time * 1000, timeout * 1000]
+        )
+        return bool(result["settled"])
@@ -0,0 +1,133 @@
+"""Inference of URL-based pagination from a single page transition."""
+
+from dataclasses import dataclass
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+
+@dataclass
+class PaginationPattern:
+    """A numeric query parameter or path segment that selects the page.
+    
+    Attributes:
+        url: URL of the second page
+        kind: "query" or "path"
+        key: Query parameter name or path segment index
+        second_value: Value of the parameter on the second page
+        step: Difference between the values of consecutive pages
+    """
+    url: str
+    kind: str
+    key: str | int
+    second_value: int
+    step: int
+    
+    def url_for(self, page_number: int) -> str:
+        """Build the URL of a page.
+        
+        Args:
+            page_number: 1-based page number, at least 2
+            
+        Returns:
+            URL of the page
+        """
+        value = str(self.second_value + (page_number - 2) * self.step)
+        parsed = urlparse(self.url)
+        
+        if self.kind == "query":
+            query = [
+                (name, value if name == self.key else current)
+                for name, current in parse_qsl(parsed.query, keep_blank_values=True)
+            ]
+            return urlunparse(parsed._replace(query=urlencode(query)))
+        
+        segments = parsed.path.split("/")
+        segments[self.key] = value
+        return urlunparse(parsed._replace(path="/".join(segments)))
+
+
+def infer_pagination_pattern(first_url: str, second_url: str) -> PaginationPattern | None:
+    """Infer the pagination pattern from the URLs of the first two pages.
+    
+    Recognizes a single changed numeric query parameter (page=2, offset=20)
+    or path segment (/page/2). A parameter missing from the first page
+    counts as 1 when the second page is 2, and as 0 otherwise (offsets).
+    
+    Args:
+        first_url: URL of the first page
+        second_url: URL reached by clicking the next button
+        
+    Returns:
+        PaginationPattern, or None if the transition is not URL-based
+    """
+    first, second = urlparse(first_url), urlparse(second_url)
+    if (first.scheme, first.netloc) != (second.scheme, second.netloc):
+        return None
+    
+    if first.path == second.path:
+        first_query = dict(parse_qsl(first.query, keep_blank_values=True))
+        changed = [
+            (name, value)
+            for name, value in parse_qsl(second.query, keep_blank_values=True)
+            if first_query.get(name) != value
+        ]
+        if len(changed) != 1 or not changed[0][1].isdigit():
+            return None
+        
+        name, value = changed[0]
+        return _build_pattern(second_url, "query", name, first_query.get(name), int(value))
+    
+    if first.query != second.query:
+        return None
+    
+    first_segments, second_segments = first.path.split("/"), second.path.split("/")
+    # "/jobs/" pages to the same segments as "/jobs"
+    base_segments = first_segments[:-1] if first_segments[-1] == "" else first_segments
+    
+    if len(first_segments) == len(second_segments):
+        changed = [i for i, (a, b) in enumerate(zip(first_segments, second_segments)) if a != b]
+        if len(changed) != 1:
+            return None
+        index = changed[0]
+        previous = first_segments[index]
+    elif second_segments[:-2] == base_segments and len(second_segments) == len(base_segments) + 2:
+        # /jobs -> /jobs/page/2
+        index = len(second_segments) - 1
+        previous = None
+    else:
+        return None
+    
+    if not second_segments[index].isdigit():
+        return None
+    return _build_pattern(second_url, "path", index, previous, int(second_segments[index]))
+
+
+def _build_pattern(
+    second_url: str,
+    kind: str,
+    key: str | int,
+    first_value: str | None,
+    second_value: int
+    ) -> PaginationPattern | None:
+    """Build a pattern from the parameter values of the first two pages.
+    
+    Args:
+        second_url: URL of the second page
+        kind: "query" or "path"
+        key: Query parameter name or path segment index
+        first_value: Raw value on the first page, None if missing
+        second_value: Value on the second page
+        
+    Returns:
+        PaginationPattern, or None if the values do not increase
+    """
+    if first_value is None:
+        first = 1 if second_value == 2 else 0
+    elif first_value.isdigit():
+        first = int(first_value)
+    else:
+        return None
+    
+    step = second_value - first
+    if step <= 0:
+        return None
+    return PaginationPattern(url=second_url, kind=kind, key=key, second_value=second_value, step=step)
@@ -0,0 +1,192 @@
+"""Request interception that aborts resources the crawler never reads."""
+
+from collections import Counter
+from urllib.parse import urlparse
+from playwright.sync_api import BrowserContext, Request, Response, Route
+from src.config import browser_settings
+from src.logger import get_logger
+from .crawl_stats import crawl_stats
+
+# Rough transfer size of one request per resource type (KB), used until a
+# response of that type has been seen with a Content-Length
+DEFAULT_RESOURCE_SIZES_KB = {
+    "image": 15,
+    "media": 250,
+    "font": 25,
+    "script": 20,
+    "stylesheet": 10,
+}
+DEFAULT_RESOURCE_SIZE_KB = 5
+
+
+class RequestBlocker:
+    """Aborts requests by resource type and by domain blocklist.
+    
+    The scraper only reads anchors, so images, fonts, media and third-party
+    trackers are pure overhead. Blocking can be switched off per site via
+    `SiteSettings.block_resources` when a board breaks without them.
+    
+    The saving is estimated per URL: blocked requests are priced at the
+    average Content-Length of allowed responses of the same type, and the
+    time at the transfer rate of the allowed responses.
+    """
+    
+    def __init__(
+        self,
+        resource_types: list[str] = browser_settings.blocked_resource_types,
+        domains: list[str] = browser_settings.blocked_domains
+        ) -> None:
+        """Initialize the request blocker.
+        
+        Args:
+            resource_types: Playwright resource types to abort ('image', 'font', ...)
+            domains: Domains whose requests are aborted, subdomains included
+        """
+        self.resource_types = set(resource_types)
+        self.domains = [domain.lower() for domain in domains]
+        self.enabled = True
+        self.logger = get_logger("request_blocker")
+        
+        # Blocked requests of the current URL, by reason and by resource type
+        self.url_blocked: Counter = Counter()
+        self.url_blocked_types: Counter = Counter()
+        
+        # Allowed responses seen, to price the blocked ones
+        self._bytes_by_type: Counter = Counter()
+        self._responses_by_type: Counter = Counter()
+        self._response_sizes: dict[Request, int] = {}
+        self._transfer_bytes = 0
+        self._transfer_seconds = 0.0
+    
+    def attach(self, context: BrowserContext) -> None:
+        """Route all requests of the context through the blocker.
+        
+        Args:
+            context: Browser context to intercept requests on.
+        """
+        context.route("**/*", self._handle_route)
+        context.on("response", self._on_response)
+        context.on("requestfinished", self._on_request_finished)
+        context.on("requestfailed", self._on_request_failed)
+    
+    def start_url(self) -> None:
+        """Start counting the blocked requests of a new target URL."""
+        self.url_blocked.clear()
+        self.url_blocked_types.clear()
+    
+    def log_savings(self, url: str) -> None:
+        """Log the requests blocked while crawling a URL and the estimated saving.
+        
+        Args:
+            url: Crawled URL.
+        """
+        blocked = sum(self.url_blocked.values())
+        if not blocked:
+            return
+        
+        saved_kb = sum(
+            count * self._get_average_size_kb(resource_type)
+            for resource_type, count in self.url_blocked_types.items()
+        )
+        crawl_stats.increment("blocked.kb_saved_estimate", round(saved_kb))
+        
+        saving = f"~{saved_kb / 1024:.1f} MB"
+        if self._transfer_seconds:
+            saved_seconds = saved_kb * 1024 / (self._transfer_bytes / self._transfer_seconds)
+            crawl_stats.increment("blocked.ms_saved_estimate", round(saved_seconds * 1000))
+            saving += f" and ~{saved_seconds:.1f}s of request time"
+        
+        reasons = ", ".join(f"{reason} {count}" for reason, count in self.url_blocked.most_common())
+        self.logger.info(f"Blocked {blocked} requests ({reasons}), saving {saving}: {url}")
+    
+    def _handle_route(self, route: Route) -> None:
+        """Abort or continue an intercepted request.
+        
+        Args:
+            route: Intercepted Playwright route.
+        """
+        resource_type = route.request.resource_type
+        reason = self._block_reason(route.request.url, resource_type)
+        
+        if reason is None:
+            route.fallback()
+            return
+        
+        crawl_stats.increment(f"blocked.{reason}")
+        self.url_blocked[reason] += 1
+        self.url_blocked_types[resource_type] += 1
+        route.abort("blockedbyclient")
+    
+    def _on_response(self, response: Response) -> None:
+        """Record the size of an allowed response.
+        
+        Args:
+            response: Response received in the context.
+        """
+        content_length = response.headers.get("content-length")
+        if not content_length or not content_length.isdigit():
+            return
+        
+        size = int(content_length)
+        self._bytes_by_type[response.request.resource_type] += size
+        self._responses_by_type[response.request.resource_type] += 1
+        self._response_sizes[response.request] = size
+    
+    def _on_request_finished(self, request: Request) -> None:
+        """Record how long a sized response took to transfer.
+        
+        Args:
+            request: Finished request.
+        """
+        size = self._response_sizes.pop(request, None)
+        timing = request.timing
+        if size is None or timing["responseEnd"] <= 0 or timing["requestStart"] < 0:
+            return
+        
+        self._transfer_bytes += size
+        self._transfer_seconds += (timing["responseEnd"] - timing["requestStart"]) / 1000
+    
+    def _on_request_failed(self, request: Request) -> None:
+        """Forget a request that will never finish.
+        
+        Args:
+            request: Failed request.
+        """
+        self._response_sizes.pop(request, None)
+    
+    def _get_average_size_kb(self, resource_type: str) -> float:
+        """Get the average transfer size of a resource type.
+        
+        Args:
+            resource_type: Playwright resource type.
+        
+        Returns:
+            Average Content-Length of allowed responses of the type in KB,
+            or a typical size if none was seen.
+        """
+        if self._responses_by_type[resource_type]:
+            return self._bytes_by_type[resource_type] / self._responses_by_type[resource_type] / 1024
+        return DEFAULT_RESOURCE_SIZES_KB.get(resource_type, DEFAULT_RESOURCE_SIZE_KB)
+    
+    def _block_reason(self, url: str, resource_type: str) -> str | None:
+        """Decide whether a request should be blocked.
+        
+        Args:
+            url: Request URL.
+            resource_type: Playwright resource type of the request.
+        
+        Returns:
+            Counter suffix describing why the request is blocked, or None to allow it.
+        """
+        if not self.enabled:
+            return None
+        
+        if resource_type in self.resource_types:
+            return f"type.{resource_type}"
+        
+        host = (urlparse(url).hostname or "").lower()
+        for domain in self.domains:
+            if host == domain or host.endswith(f".{domain}"):
+                return f"domain.{domain}"
+        
+        return None
@@ -0,0 +1,149 @@
+"""Extractors that read job listings straight from JSON API responses."""
+
+from abc import ABC, abstractmethod
+from typing import Any, List
+from urllib.parse import urlparse
+
+
+class ResponseExtractor(ABC):
+    """Abstract base class for JSON response extractors.
+    
+    Most modern boards render their listings from a JSON API call. An
+    extractor recognizes that call and turns its payload into the same
+    {'href', 'text'} links the DOM harvest produces.
+    """
+    
+    @abstractmethod
+    def matches(self, response_url: str) -> bool:
+        """Check if a response carries job listings for this extractor.
+        
+        Args:
+            response_url: URL of the XHR/fetch response
+            
+        Returns:
+            True if the payload should be passed to `extract`
+        """
+        pass
+    
+    @abstractmethod
+    def extract(self, payload: Any, response_url: str) -> List[dict]:
+        """Extract job links from a JSON payload.
+        
+        Args:
+            payload: Parsed JSON body of the response
+            response_url: URL of the XHR/fetch response
+            
+        Returns:
+            List of {'href', 'text'} dicts
+        """
+        pass
+
+
+class WorkdayExtractor(ResponseExtractor):
+    """Reads the Workday CXS search endpoint (/wday/cxs/<tenant>/<site>/jobs)."""
+    
+    def matches(self, response_url: str) -> bool:
+        path = urlparse(response_url).path
+        return "/wday/cxs/" in path and path.rstrip("/").endswith("/jobs")
+    
+    def extract(self, payload: Any, response_url: str) -> List[dict]:
+        parsed = urlparse(response_url)
+        site = parsed.path.rstrip("/").split("/")[-2]
+        
+        return [
+            {
+                "href": f"{parsed.scheme}://{parsed.netloc}/{site}{posting['externalPath']}",
+                "text": posting["title"].strip(),
+            }
+            for posting in payload.get("jobPostings", [])
+            if posting.get("title") and posting.get("externalPath")
+        ]
+
+
+class ComeetExtractor(ResponseExtractor):
+    """Reads the Comeet careers API used by embedded Comeet boards."""
+    
+    def matches(self, response_url: str) -> bool:
+        parsed = urlparse(response_url)
+        return parsed.netloc.endswith("comeet.co") and "/positions" in parsed.path
+    
+    def extract(self, payload: Any, response_url: str) -> List[dict]:
+        links = []
+        for position in payload if isinstance(payload, list) else []:
+            href = position.get("url_active_page") or position.get("url_comeet_hosted_page")
+            if position.get("name") and href:
+                links.append({"href": href, "text": position["name"].strip()})
+        return links
+
+
+# Keys recognized by the generic extractor, in order of preference
+GENERIC_TITLE_KEYS = ["title", "jobTitle", "name", "text"]
+GENERIC_URL_KEYS = ["absolute_url", "hostedUrl", "applyUrl", "jobUrl", "url", "link"]
+GENERIC_MAX_DEPTH = 6
+
+
+class GenericJobsExtractor(ResponseExtractor):
+    """Finds any objects with a title-like and an absolute URL-like field.
+    
+    Covers Greenhouse, Lever and similar APIs. Not enabled by default since
+    unrelated JSON (menus, footers) can look the same - opt in per site.
+    """
+    
+    def matches(self, response_url: str) -> bool:
+        return True
+    
+    def extract(self, payload: Any, response_url: str) -> List[dict]:
+        links: List[dict] = []
+        self._walk(payload, links, 0)
+        return links
+    
+    def _walk(self, node: Any, links: List[dict], depth: int) -> None:
+        """Recursively collect job-like objects from a JSON node.
+        
+        Args:
+            node: Current JSON node
+            links: List collecting the found links
+            depth: Current recursion depth
+        """
+        if depth > GENERIC_MAX_DEPTH:
+            return
+        
+        if isinstance(node, list):
+            for item in node:
+                self._walk(item, links, depth + 1)
+            return
+        
+        if not isinstance(node, dict):
+            return
+        
+        title = next((node[key] for key in GENERIC_TITLE_KEYS if isinstance(node.get(key), str)), None)
+        href = next(
+            (node[key] for key in GENERIC_URL_KEYS
+             if isinstance(node.get(key), str) and node[key].startswith("http")),
+            None
+        )
+        if title and href:
+            links.append({"href": href, "text": title.strip()})
+            return
+        
+        for value in node.values():
+            self._walk(value, links, depth + 1)
+
+
+class ResponseExtractorFactory:
+    """Factory class for creating response extractors by name."""
+    
+    @staticmethod
+    def create_extractor(extractor_name: str) -> ResponseExtractor:
+        """
+        Create and return the response extractor configured for a site.
+        """
+        match extractor_name.lower():
+            case "workday":
+                return WorkdayExtractor()
+            case "comeet":
+                return ComeetExtractor()
+            case "generic":
+                return GenericJobsExtractor()
+            case _:
+                raise ValueError(f"Unsupported response extractor: {extractor_name}")
@@ -0,0 +1,107 @@
+"""robots.txt crawl-delay lookup with a one day cache."""
+
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+import requests
+from src.logger import get_logger
+from src.job_storage.json_file_store import JsonFileStore
+from .http_session import create_http_session, HTTP_USER_AGENT
+from .deadline import Deadline
+
+# File caching the crawl-delay of each origin
+ROBOTS_CACHE_FILE_NAME = "robots_cache.json"
+
+# How long a fetched robots.txt is trusted
+ROBOTS_CACHE_TTL = timedelta(days=1)
+
+ROBOTS_TIMEOUT = 10
+
+
+class RobotsCache:
+    """Fetches robots.txt per origin and caches its crawl-delay for a day.
+    
+    Origins whose robots.txt is missing are cached without a delay; fetch
+    errors are not cached so the next run tries again.
+    """
+    
+    def __init__(self, session: requests.Session | None = None) -> None:
+        """Initialize the robots.txt cache.
+        
+        Args:
+            session: HTTP session to use, a pooled session is created if None
+        """
+        self.session = session or create_http_session()
+        self.logger = get_logger("robots_cache")
+        self.store = JsonFileStore(ROBOTS_CACHE_FILE_NAME)
+        self.entries: dict[str, dict] = self.store.load()
+        self._updated: dict[str, dict] = {}
+        self._lock = threading.Lock()
+    
+    def get_crawl_delay(self, url: str, deadline: Deadline | None = None) -> float | None:
+        """Get the crawl-delay robots.txt asks for on a URL's origin.
+        
+        Args:
+            url: URL on the origin
+            deadline: Crawl budget; once used up robots.txt is not fetched
+            
+        Returns:
+            Crawl delay in seconds, or None if none is set
+        """
+        deadline = deadline or Deadline()
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        
+        with self._lock:
+            entry = self.entries.get(origin)
+        if entry and datetime.fromisoformat(entry["fetched"]) > datetime.now() - ROBOTS_CACHE_TTL:
+            return entry["crawl_delay"]
+        if deadline.expired():
+            return entry["crawl_delay"] if entry else None
+        
+        try:
+            crawl_delay = self._fetch_crawl_delay(origin, deadline.cap(ROBOTS_TIMEOUT))
+        except Exception as e:
+            self.logger.warning(f"Error fetching robots.txt of {origin}: {str(e)[:100]}")
+            return entry["crawl_delay"] if entry else None
+        
+        if crawl_delay:
+            self.logger.info(f"robots.txt of {origin} asks for a {crawl_delay}s crawl delay")
+        entry = {"crawl_delay": crawl_delay, "fetched": datetime.now().isoformat()}
+        with self._lock:
+            self.entries[origin] = entry
+            self._updated[origin] = entry
+        return crawl_delay
+    
+    def save(self) -> None:
+        """Persist the crawl delays fetched in this run.
+        
+        Only the origins fetched here are merged into the file, so crawl
+        processes sharing it keep each other's entries.
+        """
+        with self._lock:
+            if not self._updated:
+                return
+            self.store.update(self._updated)
+            self._updated.clear()
+    
+    def _fetch_crawl_delay(self, origin: str, timeout: float) -> float | None:
+        """Download and parse an origin's robots.txt.
+        
+        Args:
+            origin: Scheme and host, e.g. "https://example.com"
+            timeout: Request timeout (seconds)
+            
+        Returns:
+            Crawl delay in seconds, or None if none is set
+        """
+        response = self.session.get(f"{origin}/robots.txt", timeout=timeout)
+        if 400 <= response.status_code < 500:
+            return None
+        response.raise_for_status()
+        
+        parser = RobotFileParser()
+        parser.parse(response.text.splitlines())
+        crawl_delay = parser.crawl_delay(HTTP_USER_AGENT)
+        return float(crawl_delay) if crawl_delay else None
@@ -0,0 +1,104 @@
+"""Per-domain crawl strategies learned on earlier runs."""
+
+import threading
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timedelta
+from typing import List
+from urllib.parse import urlparse
+from src.config import scraping_settings
+from src.logger import get_logger
+from src.job_storage.json_file_store import JsonFileStore
+
+# File remembering the learned profile of each domain
+SITE_PROFILES_FILE_NAME = "site_profiles.json"
+
+
+@dataclass
+class SiteProfile:
+    """What worked on a domain during its last successful crawl.
+    
+    Attributes:
+        job_selectors: JOB_TITLE_SELECTORS entries that matched job links
+        next_button: Stable selector of the next button, None if not found
+        scroll_container: Selector of the job list's scroll container,
+            None if the document scrolls
+        pages: Number of pages crawled
+        paginates: False if the first page had no next button
+        load_time: Typical time until the page was ready (seconds)
+        discovered: ISO timestamp of the full discovery the profile is based on
+    """
+    job_selectors: List[str] = field(default_factory=list)
+    next_button: str | None = None
+    scroll_container: str | None = None
+    pages: int = 0
+    paginates: bool = True
+    load_time: float = 0.0
+    discovered: str = ""
+
+
+class SiteProfiles:
+    """Stores a SiteProfile per domain under the data directory.
+    
+    Profiles older than `site_profile_max_age_days` are ignored, so every
+    site is periodically rediscovered from scratch.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize the site profile store."""
+        self.logger = get_logger("site_profiles")
+        self.store = JsonFileStore(SITE_PROFILES_FILE_NAME)
+        self.profiles: dict[str, dict] = self.store.load()
+        self._updated: dict[str, dict] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> SiteProfile | None:
+        """Get the fresh profile of a URL's domain.
+        
+        Args:
+            url: Target page URL
+            
+        Returns:
+            SiteProfile, or None if the domain has no fresh profile
+        """
+        with self._lock:
+            data = self.profiles.get(urlparse(url).netloc)
+        if not data:
+            return None
+        
+        profile = SiteProfile(**data)
+        max_age = timedelta(days=scraping_settings.site_profile_max_age_days)
+        if datetime.fromisoformat(profile.discovered) < datetime.now() - max_age:
+            self.logger.info(f"Site profile expired, rediscovering: {url}")
+            return None
+        return profile
+    
+    def remember(self, url: str, profile: SiteProfile) -> None:
+        """Store the profile learned while crawling a URL.
+        
+        The load time is smoothed with the previous profile's. A profile
+        without a discovery time counts as discovered now.
+        
+        Args:
+            url: Crawled URL
+            profile: Learned profile
+        """
+        domain = urlparse(url).netloc
+        with self._lock:
+            previous = self.profiles.get(domain)
+            if previous and previous.get("load_time"):
+                profile.load_time = round(0.7 * previous["load_time"] + 0.3 * profile.load_time, 3)
+            profile.discovered = profile.discovered or datetime.now().isoformat()
+            self.profiles[domain] = asdict(profile)
+            self._updated[domain] = asdict(profile)
+    
+    def save(self) -> None:
+        """Persist updated profiles.
+        
+        Only the domains crawled here are merged into the file, so crawl
+        processes sharing it keep each other's profiles.
+        """
+        with self._lock:
+            if not self._updated:
+                return
+            self.store.update(self._updated)
+            self._updated.clear()
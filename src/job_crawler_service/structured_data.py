@@ -0,0 +1,153 @@
+"""schema.org JobPosting extraction from JSON-LD blocks."""
+
+import json
+from datetime import datetime
+from typing import Any, List
+from urllib.parse import urljoin
+from src.logger import get_logger
+
+logger = get_logger("structured_data")
+
+
+def extract_job_postings(json_ld_blocks: List[str], page_url: str) -> List[dict]:
+    """Extract JobPosting entries from raw JSON-LD script contents.
+    
+    Args:
+        json_ld_blocks: Text of every <script type="application/ld+json"> on the page
+        page_url: URL of the page, used for postings without their own URL
+        
+    Returns:
+        List of link dicts with 'href' and 'text', plus 'company', 'location'
+        and 'date_posted' when the posting provides them
+    """
+    links: List[dict] = []
+    seen: set[str] = set()
+    
+    for block in json_ld_blocks:
+        try:
+            document = json.loads(block)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.debug(f"Skipping invalid JSON-LD block: {e}")
+            continue
+        
+        for posting in _find_postings(document):
+            link = _posting_to_link(posting, page_url)
+            if link and link["href"] not in seen:
+                seen.add(link["href"])
+                links.append(link)
+    
+    return links
+
+
+def _find_postings(node: Any) -> List[dict]:
+    """Find JobPosting objects in a JSON-LD document.
+    
+    Handles top-level arrays, @graph containers and ItemList wrappers.
+    
+    Args:
+        node: JSON-LD node
+        
+    Returns:
+        List of JobPosting objects
+    """
+    if isinstance(node, list):
+        return [posting for item in node for posting in _find_postings(item)]
+    
+    if not isinstance(node, dict):
+        return []
+    
+    types = node.get("@type", [])
+    if "JobPosting" in (types if isinstance(types, list) else [types]):
+        return [node]
+    
+    postings = []
+    for key in ("@graph", "itemListElement", "item"):
+        if key in node:
+            postings.extend(_find_postings(node[key]))
+    return postings
+
+
+def _posting_to_link(posting: dict, page_url: str) -> dict | None:
+    """Convert a JobPosting into a link dict.
+    
+    Args:
+        posting: JobPosting object
+        page_url: URL of the page the posting was found on
+        
+    Returns:
+        Link dict, or None if the posting has no title
+    """
+    title = posting.get("title") or posting.get("name")
+    if not isinstance(title, str) or not title.strip():
+        return None
+    
+    link = {
+        "href": urljoin(page_url, posting.get("url") or page_url),
+        "text": " ".join(title.split()),
+    }
+    
+    organization = posting.get("hiringOrganization")
+    if isinstance(organization, dict) and organization.get("name"):
+        link["company"] = organization["name"]
+    
+    location = _format_location(posting)
+    if location:
+        link["location"] = location
+    
+    date_posted = _parse_date(posting.get("datePosted"))
+    if date_posted:
+        link["date_posted"] = date_posted
+    
+    return link
+
+
+def _format_location(posting: dict) -> str:
+    """Format a posting's jobLocation as 'City, Region, Country'.
+    
+    Args:
+        posting: JobPosting object
+        
+    Returns:
+        Human-readable location, 'Remote' for telecommute postings, or ''
+    """
+    if posting.get("jobLocationType") == "TELECOMMUTE":
+        return "Remote"
+    
+    locations = posting.get("jobLocation") or []
+    if isinstance(locations, dict):
+        locations = [locations]
+    
+    formatted = []
+    for location in locations:
+        address = location.get("address", {}) if isinstance(location, dict) else {}
+        if isinstance(address, str):
+            formatted.append(address)
+            continue
+        
+        country = address.get("addressCountry", "")
+        if isinstance(country, dict):
+            country = country.get("name", "")
+        parts = [address.get("addressLocality"), address.get("addressRegion"), country]
+        text = ", ".join(part for part in parts if isinstance(part, str) and part)
+        if text:
+            formatted.append(text)
+    
+    return "; ".join(formatted)
+
+
+def _parse_date(value: Any) -> datetime | None:
+    """Parse a schema.org date or date-time.
+    
+    Args:
+        value: datePosted value
+        
+    Returns:
+        Parsed naive datetime, or None if missing or invalid
+    """
+    if not isinstance(value, str):
+        return None
+    
+    try:
+        return datetime.fromisoformat(value.strip().replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
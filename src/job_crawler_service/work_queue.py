@@ -0,0 +1,228 @@
+"""Durable lease-based crawl work queue shared between hosts."""
+
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+from src.config import crawl_queue_settings
+from src.data_models import JobData
+from src.logger import get_logger
+from src.job_storage.json_file_store import get_data_dir
+
+TASK_PENDING = "pending"
+TASK_LEASED = "leased"
+TASK_DONE = "done"
+TASK_FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_tasks (
+    run_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    jobs_json TEXT,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (run_id, url)
+);
+CREATE INDEX IF NOT EXISTS crawl_tasks_status ON crawl_tasks (status, lease_expires_at);
+"""
+
+
+class CrawlWorkQueue:
+    """SQLite-backed queue of URLs to crawl, leased to workers on any host.
+    
+    A worker leases a URL for `lease_seconds` and keeps the lease alive with
+    heartbeats. When a lease expires without completion the URL becomes
+    available again, until it has been attempted `max_attempts` times.
+    Put the database on shared storage to spread workers across boxes.
+    """
+    
+    def __init__(self, db_path: str | None = crawl_queue_settings.queue_path) -> None:
+        """Initialize the work queue.
+        
+        Args:
+            db_path: SQLite database path, data/crawl_queue.db if None
+        """
+        self.db_path = Path(db_path) if db_path else get_data_dir() / "crawl_queue.db"
+        self.logger = get_logger("crawl_work_queue")
+        
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+    
+    def create_run(self, urls: List[str]) -> str:
+        """Enqueue all URLs of a new crawl run.
+        
+        Args:
+            urls: URLs to crawl
+            
+        Returns:
+            ID of the new run
+        """
+        run_id = uuid.uuid4().hex
+        now = time.time()
+        
+        with self._connect() as connection:
+            connection.execute("BEGIN")
+            connection.executemany(
+                "INSERT OR IGNORE INTO crawl_tasks (run_id, url, status, created_at) VALUES (?, ?, ?, ?)",
+                [(run_id, url, TASK_PENDING, now) for url in urls]
+            )
+        
+        self.logger.info(f"Created crawl run {run_id} with {len(urls)} URLs")
+        return run_id
+    
+    def lease_next(self, worker_id: str) -> tuple[str, str] | None:
+        """Lease the oldest available URL.
+        
+        Expired leases that used up their attempts are marked failed first.
+        
+        Args:
+            worker_id: ID of the leasing worker
+            
+        Returns:
+            Tuple of (run_id, url), or None if nothing is available
+        """
+        now = time.time()
+        
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "UPDATE crawl_tasks SET status = ?, last_error = 'lease expired' "
+                "WHERE status = ? AND lease_expires_at < ? AND attempts >= ?",
+                (TASK_FAILED, TASK_LEASED, now, crawl_queue_settings.max_attempts)
+            )
+            row = connection.execute(
+                "SELECT run_id, url FROM crawl_tasks "
+                "WHERE status = ? OR (status = ? AND lease_expires_at < ?) "
+                "ORDER BY created_at, rowid LIMIT 1",
+                (TASK_PENDING, TASK_LEASED, now)
+            ).fetchone()
+            
+            if row is None:
+                return None
+            
+            connection.execute(
+                "UPDATE crawl_tasks SET status = ?, lease_owner = ?, lease_expires_at = ?, "
+                "attempts = attempts + 1 WHERE run_id = ? AND url = ?",
+                (TASK_LEASED, worker_id, now + crawl_queue_settings.lease_seconds, row[0], row[1])
+            )
+            return row[0], row[1]
+    
+    def heartbeat(self, run_id: str, url: str, worker_id: str) -> bool:
+        """Extend a lease held by a worker.
+        
+        Args:
+            run_id: Run of the leased URL
+            url: Leased URL
+            worker_id: ID of the worker holding the lease
+            
+        Returns:
+            True if the lease is still held by the worker
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE crawl_tasks SET lease_expires_at = ? "
+                "WHERE run_id = ? AND url = ? AND status = ? AND lease_owner = ?",
+                (time.time() + crawl_queue_settings.lease_seconds, run_id, url, TASK_LEASED, worker_id)
+            )
+            return cursor.rowcount == 1
+    
+    def complete(self, run_id: str, url: str, worker_id: str, jobs: List[JobData]) -> None:
+        """Store the jobs found on a URL and mark it done.
+        
+        Args:
+            run_id: Run of the leased URL
+            url: Crawled URL
+            worker_id: ID of the worker that crawled it
+            jobs: Jobs found on the URL
+        """
+        jobs_json = json.dumps([job.to_dict() for job in jobs], ensure_ascii=False)
+        
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE crawl_tasks SET status = ?, lease_owner = ?, jobs_json = ? "
+                "WHERE run_id = ? AND url = ? AND status != ?",
+                (TASK_DONE, worker_id, jobs_json, run_id, url, TASK_DONE)
+            )
+    
+    def fail(self, run_id: str, url: str, worker_id: str, error: str) -> None:
+        """Release a URL after a failed attempt.
+        
+        The URL is retried by any worker until it runs out of attempts.
+        
+        Args:
+            run_id: Run of the leased URL
+            url: URL that failed
+            worker_id: ID of the worker holding the lease
+            error: Error description
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE crawl_tasks SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "lease_owner = NULL, lease_expires_at = NULL, last_error = ? "
+                "WHERE run_id = ? AND url = ? AND status = ? AND lease_owner = ?",
+                (crawl_queue_settings.max_attempts, TASK_FAILED, TASK_PENDING,
+                 error[:500], run_id, url, TASK_LEASED, worker_id)
+            )
+    
+    def get_progress(self, run_id: str) -> Dict[str, int]:
+        """Count a run's URLs by status.
+        
+        Args:
+            run_id: Run to inspect
+            
+        Returns:
+            Mapping of status to number of URLs
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT status, COUNT(*) FROM crawl_tasks WHERE run_id = ? GROUP BY status",
+                (run_id,)
+            ).fetchall()
+        progress = dict.fromkeys((TASK_PENDING, TASK_LEASED, TASK_DONE, TASK_FAILED), 0)
+        progress.update(rows)
+        return progress
+    
+    def get_results(self, run_id: str) -> Dict[str, List[JobData]]:
+        """Get the jobs of every completed URL of a run.
+        
+        Args:
+            run_id: Run to read
+            
+        Returns:
+            Mapping of each completed URL to the jobs found on it
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT url, jobs_json FROM crawl_tasks WHERE run_id = ? AND status = ?",
+                (run_id, TASK_DONE)
+            ).fetchall()
+        
+        return {
+            url: [JobData.from_dict(job) for job in json.loads(jobs_json)]
+            for url, jobs_json in rows
+        }
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived connection, committing on success.
+        
+        Connections are not shared so heartbeat threads can use the queue too.
+        """
+        connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield connection
+            if connection.in_transaction:
+                connection.execute("COMMIT")
+        except Exception:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
@@ -0,0 +1,153 @@
+"""Direct client for the Workday CXS job search API."""
+
+import re
+import time
+from typing import Dict, List
+from urllib.parse import urlparse, parse_qs
+import requests
+from src.config import browser_settings, scraping_settings, get_site_settings
+from src.logger import get_logger
+from .http_session import create_http_session
+from .deadline import Deadline
+
+# Workday returns at most 20 postings per search request
+WORKDAY_PAGE_SIZE = 20
+
+# Optional locale segment in board paths, e.g. /en-US/Ext
+LOCALE_SEGMENT_PATTERN = re.compile(r"^[a-z]{2}-[A-Z]{2}$")
+
+# Query-string keys that are not facets
+SEARCH_TEXT_PARAMS = ["q", "searchText"]
+
+
+class WorkdayClient:
+    """Fetches Workday board listings over plain HTTP, without a browser.
+    
+    A board URL such as https://<tenant>.wd5.myworkdayjobs.com/<site>?facet=id
+    maps to POST https://<host>/wday/cxs/<tenant>/<site>/jobs with the query
+    string facets sent as `appliedFacets`.
+    """
+    
+    def __init__(self, session: requests.Session | None = None) -> None:
+        """Initialize the Workday client.
+        
+        Args:
+            session: HTTP session to use, a pooled session is created if None
+        """
+        self.session = session or create_http_session()
+        self.logger = get_logger("workday_client")
+    
+    def supports(self, url: str) -> bool:
+        """Check if a URL is a Workday board handled by this client.
+        
+        Args:
+            url: Target board URL
+            
+        Returns:
+            True if the site is configured with direct_api="workday"
+        """
+        return get_site_settings(url).direct_api == "workday"
+    
+    def fetch_links(self, url: str, deadline: Deadline | None = None) -> List[dict]:
+        """Fetch all listings of a board, up to max_pages_per_url pages.
+        
+        Args:
+            url: Target board URL
+            deadline: Crawl budget, every request is capped at it and no
+                further page is fetched once it is used up
+            
+        Returns:
+            List of {'href', 'text'} dicts
+            
+        Raises:
+            requests.RequestException: If the search endpoint fails
+            ValueError: If the URL has no board site in its path
+        """
+        deadline = deadline or Deadline()
+        start = time.monotonic()
+        parsed = urlparse(url)
+        site = self._get_site(parsed.path)
+        tenant = parsed.hostname.split(".")[0]
+        endpoint = f"{parsed.scheme}://{parsed.netloc}/wday/cxs/{tenant}/{site}/jobs"
+        body = self._build_search_body(parse_qs(parsed.query))
+        
+        links: List[dict] = []
+        total = None
+        
+        for page_number in range(scraping_settings.max_pages_per_url):
+            if deadline.expired():
+                if not links:
+                    raise TimeoutError("Crawl budget used up")
+                self.logger.warning(f"Crawl budget used up after {page_number} pages, keeping partial results: {url}")
+                break
+            
+            body["offset"] = page_number * WORKDAY_PAGE_SIZE
+            response = self.session.post(
+                endpoint, json=body, timeout=deadline.cap(browser_settings.page_load_timeout)
+            )
+            response.raise_for_status()
+            payload = response.json()
+            
+            # Only the first page reports the total
+            if total is None:
+                total = payload.get("total", 0)
+            
+            postings = payload.get("jobPostings", [])
+            links.extend(
+                {
+                    "href": f"{parsed.scheme}://{parsed.netloc}/{site}{posting['externalPath']}",
+                    "text": posting["title"].strip(),
+                }
+                for posting in postings
+                if posting.get("title") and posting.get("externalPath")
+            )
+            
+            if not postings or body["offset"] + WORKDAY_PAGE_SIZE >= total:
+                break
+        
+        self.logger.info(
+            f"Fetched {len(links)} / {total} Workday postings in "
+            f"{(time.monotonic() - start) * 1000:.0f} ms: {url}"
+        )
+        return links
+    
+    def _get_site(self, path: str) -> str:
+        """Get the board site name from a board URL path.
+        
+        Args:
+            path: URL path, e.g. '/en-US/Ext' or '/NVIDIAExternalCareerSite'
+            
+        Returns:
+            Board site name
+        """
+        segments = [segment for segment in path.split("/") if segment]
+        if segments and LOCALE_SEGMENT_PATTERN.match(segments[0]):
+            segments = segments[1:]
+        if not segments:
+            raise ValueError(f"No Workday site in URL path: {path}")
+        return segments[0]
+    
+    def _build_search_body(self, query: Dict[str, List[str]]) -> dict:
+        """Translate query-string facets into a CXS search request body.
+        
+        Args:
+            query: Parsed query string of the board URL
+            
+        Returns:
+            JSON body for the search endpoint
+        """
+        search_text = ""
+        facets: Dict[str, List[str]] = {}
+        
+        for key, values in query.items():
+            if key in SEARCH_TEXT_PARAMS:
+                search_text = values[0]
+            else:
+                facets[key] = values
+        
+        return {
+            "appliedFacets": facets,
+            "limit": WORKDAY_PAGE_SIZE,
+            "offset": 0,
+            "searchText": search_text,
+        }
@@ -1,5 +1,6 @@
 """Job storage package for data persistence."""
 
 from .job_storage_service import JobStorageService
+from .json_file_store import JsonFileStore
 
-__all__ = ['JobStorageService']
+__all__ = ['JobStorageService', 'JsonFileStore']
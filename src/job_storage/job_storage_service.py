@@ -1,13 +1,13 @@
 """Job storage service for tracking sent job URLs with expiry."""
 
 import json
-import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict
 from src.data_models import JobData
 from src.logger import get_logger
 from src.config import job_storage_settings
+from .json_file_store import get_data_dir
 
 
 class JobStorageService:
@@ -34,11 +34,7 @@ class JobStorageService:
         Returns:
             Path object pointing to the storage file
         """
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        
-        data_dir = Path(project_root) / "data"
-        data_dir.mkdir(parents=True, exist_ok=True)
+        data_dir = get_data_dir()
         
         return data_dir / job_storage_settings.storage_file_name
     
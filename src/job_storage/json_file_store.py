@@ -0,0 +1,143 @@
+"""JSON file persistence for crawler state kept under the data directory."""
+
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+from src.logger import get_logger
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+DATA_DIR_ENV_VAR = "JOBHUNTER_DATA_DIR"
+
+
+def get_data_dir() -> Path:
+    """Get the project data directory, creating it if needed.
+    
+    The JOBHUNTER_DATA_DIR environment variable overrides the location.
+    
+    Returns:
+        Path object pointing to the data directory
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(os.path.dirname(current_dir))
+    
+    data_dir = Path(os.getenv(DATA_DIR_ENV_VAR) or Path(project_root) / "data")
+    data_dir.mkdir(parents=True, exist_ok=True)
+    
+    return data_dir
+
+
+class JsonFileStore:
+    """Loads and saves a single JSON document under the data directory.
+    
+    Missing or corrupt files load as an empty document, so state files can
+    always be deleted to reset what the crawler has learned.
+    
+    Saves replace the file atomically, so a reader never sees it half
+    written. Crawl processes sharing a file merge their changes through
+    `update`, which holds a lock on a sibling .lock file across processes.
+    """
+    
+    def __init__(self, file_name: str) -> None:
+        """Initialize the store.
+        
+        Args:
+            file_name: Name of the JSON file inside the data directory
+        """
+        self.logger = get_logger("json_file_store")
+        self.file_path = get_data_dir() / file_name
+        self.lock_path = self.file_path.with_name(f"{file_name}.lock")
+    
+    def load(self) -> dict:
+        """Load the stored document.
+        
+        Returns:
+            Stored data, or an empty dict if the file is missing or corrupt
+        """
+        try:
+            if not self.file_path.exists():
+                return {}
+            
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("data", {})
+            
+        except Exception as e:
+            self.logger.warning(f"Error loading {self.file_path.name}: {e}. Starting empty.")
+            return {}
+    
+    def save(self, data: dict) -> None:
+        """Save the document, replacing the file atomically.
+        
+        Args:
+            data: JSON-serializable data to store
+        """
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.file_path.parent,
+                prefix=f".{self.file_path.name}.", suffix=".tmp", delete=False
+            ) as f:
+                temp_path = f.name
+                json.dump(
+                    {"data": data, "last_updated": datetime.now().isoformat()},
+                    f, indent=2, ensure_ascii=False
+                )
+            os.replace(temp_path, self.file_path)
+        except Exception as e:
+            self.logger.error(f"Error saving {self.file_path.name}: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def update(self, changes: dict) -> None:
+        """Merge changed keys into the stored document.
+        
+        The file is re-read under the cross-process lock, so concurrent
+        writers only overwrite the keys they changed.
+        
+        Args:
+            changes: Key to new value, None removes the key
+        """
+        with self.lock():
+            data = self.load()
+            for key, value in changes.items():
+                if value is None:
+                    data.pop(key, None)
+                else:
+                    data[key] = value
+            self.save(data)
+    
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the document across processes.
+        
+        Blocks until every other holder, in any process, has released it.
+        Not reentrant.
+        """
+        with open(self.lock_path, 'a+b') as lock_file:
+            if sys.platform == "win32":
+                lock_file.seek(0)
+                # LK_LOCK gives up after 10 attempts, so keep retrying
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
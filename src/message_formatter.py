@@ -41,10 +41,7 @@ class MessageFormatterService:
         """
         # Format jobs for the message
         jobs_text = "\n".join([
-            f"\nid: {i}:\n"
-            f"  Title: {job.title}\n"
-            f"  Company: {job.company}\n"
-            f"  URL: {job.url}\n"
+            MessageFormatterService._format_llm_job(i, job)
             for i, job in enumerate(jobs)
         ])
 
@@ -52,6 +49,29 @@ class MessageFormatterService:
 
         return message_result
 
+    @staticmethod
+    def _format_llm_job(index: int, job: JobData) -> str:
+        """Format a single job for the LLM prompt.
+        
+        Args:
+            index: Position of the job in the batch (the id the LLM answers with)
+            job: JobData object to format
+
+        Returns:
+            Formatted job entry, with location and posting date when known
+        """
+        job_text = (
+            f"\nid: {index}:\n"
+            f"  Title: {job.title}\n"
+            f"  Company: {job.company}\n"
+        )
+        if job.location:
+            job_text += f"  Location: {job.location}\n"
+        if job.date_posted:
+            job_text += f"  Posted: {job.date_posted.date()}\n"
+        job_text += f"  URL: {job.url}\n"
+        return job_text
+
     @staticmethod
     def format_summary(
         run_summary: RunSummary,